@@ -1 +1,4 @@
 from .client_module import _client_classes, client
+from .transport import Transport
+from .retry import RetryPolicy
+from .rate_limiter import RateLimiter
@@ -0,0 +1,571 @@
+import os
+import time
+from bandwidth.async_transport import AsyncClientMixin
+from bandwidth.voice.async_lazy_enumerable import get_async_lazy_enumerator
+from bandwidth.async_sharding import async_list_sharded
+from bandwidth.async_batch import async_map_concurrently
+from bandwidth.sharding import split_time_range, get_boundary_item_id, TRANSACTIONS_TIME_FORMAT
+from bandwidth.media import UploadStream, DEFAULT_CHUNK_SIZE, get_content_type, list_files, get_local_file_path
+
+from .client_module import Client, _group_numbers, _get_number_infos, _bind_progress, _get_upload_stream, \
+    _get_upload_result, _is_downloaded, _get_range_headers, _is_complete_part, _is_resumed, _finish_download, \
+    _get_download_result, _get_download_report
+
+
+class AsyncClient(AsyncClientMixin, Client):
+
+    """
+    Account API client with coroutine methods (requires aiohttp)
+
+    Methods which return lists are async iterators.
+    """
+
+    def __init__(self, user_id=None, api_token=None, api_secret=None, **other_options):
+        """
+        Initialize the async client. Takes the same arguments as :class:`bandwidth.account.Client`
+        (option ``transport`` should be an instance of :class:`bandwidth.async_transport.AsyncTransport`).
+
+        Init the async client::
+
+            api = bandwidth.client('account', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET', mode='async')
+        """
+        owns_transport = self._init_async_transport(other_options)
+        Client.__init__(self, user_id, api_token, api_secret, **other_options)
+        self._owns_transport = owns_transport
+
+    async def get_account(self):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.get_account`
+        """
+        return (await self._make_request('get', '/users/%s/account' % self.user_id))[0]
+
+    def list_account_transactions(self,
+                                  max_items=None,
+                                  to_date=None,
+                                  from_date=None,
+                                  trans_type=None,
+                                  size=None,
+                                  number=None,
+                                  **kwargs):
+        """
+        Async iterator version of :meth:`bandwidth.account.Client.list_account_transactions`
+        """
+        kwargs["maxItems"] = max_items
+        kwargs["toDate"] = to_date
+        kwargs["fromDate"] = from_date
+        kwargs["type"] = trans_type
+        kwargs["size"] = size
+        kwargs["number"] = number
+
+        path = '/users/%s/account/transactions' % self.user_id
+        return get_async_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+
+    def list_account_transactions_sharded(self, from_date, to_date, shards=4, concurrency=None, ordered=True,
+                                          **kwargs):
+        """
+        Async iterator version of :meth:`bandwidth.account.Client.list_account_transactions_sharded`
+        """
+        # each sub-range returns at most max_items transactions, they are limited in total too
+        max_items = kwargs.get('max_items')
+        ranges = split_time_range(from_date, to_date, shards)
+        ranges.reverse()
+
+        def list_shard(start, end):
+            return self.list_account_transactions(from_date=start.strftime(TRANSACTIONS_TIME_FORMAT),
+                                                  to_date=end.strftime(TRANSACTIONS_TIME_FORMAT), **kwargs)
+        return async_list_sharded(list_shard, ranges, concurrency, ordered, max_items=max_items,
+                                  get_unique_id=get_boundary_item_id(ranges))
+
+    def list_applications(self, size=None, **kwargs):
+        """
+        Async iterator version of :meth:`bandwidth.account.Client.list_applications`
+        """
+        kwargs["size"] = size
+        path = '/users/%s/applications' % self.user_id
+        return get_async_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+
+    async def create_application(self,
+                                 name,
+                                 incoming_call_url=None,
+                                 incoming_call_url_callback_timeout=None,
+                                 incoming_call_fallback_url=None,
+                                 incoming_message_url=None,
+                                 incoming_message_url_callback_timeout=None,
+                                 incoming_message_fallback_url=None,
+                                 callback_http_method=None,
+                                 auto_answer=None,
+                                 **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.create_application`
+        """
+        kwargs["name"] = name
+        kwargs["incomingCallUrl"] = incoming_call_url
+        kwargs[
+            "incomingCallUrlCallbackTimeout"] = incoming_call_url_callback_timeout
+        kwargs["incomingCallFallbackUrl"] = incoming_call_fallback_url
+        kwargs["incomingMessageUrl"] = incoming_message_url
+        kwargs[
+            "incomingMessageUrlCallbackTimeout"] = incoming_message_url_callback_timeout
+        kwargs["incomingMessageFallbackUrl"] = incoming_message_fallback_url
+        kwargs["callbackHttpMethod"] = callback_http_method
+        kwargs["autoAnswer"] = auto_answer
+
+        return (await self._make_request('post', '/users/%s/applications' % self.user_id, json=kwargs))[2]
+
+    async def get_application(self, app_id):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.get_application`
+        """
+        application = self._get_cached('application', app_id)
+        if application is None:
+            application = self._set_cached('application', app_id, (await self._make_request(
+                'get', '/users/%s/applications/%s' % (self.user_id, app_id)))[0])
+        return application
+
+    async def update_application(self, app_id,
+                                 name=None,
+                                 incoming_call_url=None,
+                                 incoming_call_url_callback_timeout=None,
+                                 incoming_call_fallback_url=None,
+                                 incoming_message_url=None,
+                                 incoming_message_url_callback_timeout=None,
+                                 incoming_message_fallback_url=None,
+                                 callback_http_method=None,
+                                 auto_answer=None,
+                                 **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.update_application`
+        """
+        kwargs["name"] = name
+        kwargs["incomingCallUrl"] = incoming_call_url
+        kwargs[
+            "incomingCallUrlCallbackTimeout"] = incoming_call_url_callback_timeout
+        kwargs["incomingCallFallbackUrl"] = incoming_call_fallback_url
+        kwargs["incomingMessageUrl"] = incoming_message_url
+        kwargs[
+            "incomingMessageUrlCallbackTimeout"] = incoming_message_url_callback_timeout
+        kwargs["incomingMessageFallbackUrl"] = incoming_message_fallback_url
+        kwargs["callbackHttpMethod"] = callback_http_method
+        kwargs["autoAnswer"] = auto_answer
+
+        try:
+            await self._make_request('post', '/users/%s/applications/%s' % (self.user_id, app_id), json=kwargs)
+        finally:
+            self._invalidate_cached('application', app_id)
+
+    async def delete_application(self, app_id):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.delete_application`
+        """
+        try:
+            await self._make_request(
+                'delete', '/users/%s/applications/%s' % (self.user_id, app_id))
+        finally:
+            self._invalidate_cached('application', app_id)
+
+    async def search_available_local_numbers(self,
+                                             city=None,
+                                             state=None,
+                                             zip_code=None,
+                                             area_code=None,
+                                             local_number=None,
+                                             in_local_calling_area=None,
+                                             quantity=None,
+                                             pattern=None,
+                                             **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.search_available_local_numbers`
+        """
+        kwargs["city"] = city
+        kwargs["state"] = state
+        kwargs["zip"] = zip_code
+        kwargs["areaCode"] = area_code
+        kwargs["localNumber"] = local_number
+        kwargs["inLocalCallingArea"] = in_local_calling_area
+        kwargs["quantity"] = quantity
+        kwargs["pattern"] = pattern
+        return (await self._make_request('get', '/availableNumbers/local', params=kwargs))[0]
+
+    async def search_available_toll_free_numbers(self, quantity=None, pattern=None, **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.search_available_toll_free_numbers`
+        """
+        kwargs["quantity"] = quantity
+        kwargs["pattern"] = pattern
+        return (await self._make_request('get', '/availableNumbers/tollFree', params=kwargs))[0]
+
+    async def search_and_order_local_numbers(self,
+                                             city=None,
+                                             state=None,
+                                             zip_code=None,
+                                             area_code=None,
+                                             local_number=None,
+                                             in_local_calling_area=None,
+                                             quantity=None,
+                                             **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.search_and_order_local_numbers`
+        """
+        kwargs["city"] = city
+        kwargs["state"] = state
+        kwargs["zip"] = zip_code
+        kwargs["areaCode"] = area_code
+        kwargs["localNumber"] = local_number
+        kwargs["inLocalCallingArea"] = in_local_calling_area
+        kwargs["quantity"] = quantity
+        number_list = (await self._make_request(
+            'post', '/availableNumbers/local', params=kwargs))[0]
+        for item in number_list:
+            item['id'] = item.get('location', '').split('/')[-1]
+        return number_list
+
+    async def search_and_order_toll_free_numbers(self, quantity, **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.search_and_order_toll_free_numbers`
+        """
+        kwargs["quantity"] = quantity
+        list = (await self._make_request(
+            'post', '/availableNumbers/tollFree', params=kwargs))[0]
+        for item in list:
+            item['id'] = item.get('location', '').split('/')[-1]
+        return list
+
+    def list_domains(self, size=None, **kwargs):
+        """
+        Async iterator version of :meth:`bandwidth.account.Client.list_domains`
+        """
+        kwargs['size'] = size
+        path = '/users/%s/domains' % self.user_id
+        return get_async_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+
+    async def create_domain(self, name, description=None, **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.create_domain`
+        """
+        kwargs['name'] = name
+        kwargs['description'] = description
+        return (await self._make_request('post', '/users/%s/domains' % self.user_id, json=kwargs))[2]
+
+    async def get_domain(self, domain_id):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.get_domain`
+        """
+        domain = self._get_cached('domain', domain_id)
+        if domain is None:
+            domain = self._set_cached('domain', domain_id, (await self._make_request(
+                'get', '/users/%s/domains/%s' % (self.user_id, domain_id)))[0])
+        return domain
+
+    async def delete_domain(self, domain_id):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.delete_domain`
+        """
+        try:
+            await self._make_request('delete', '/users/%s/domains/%s' %
+                                     (self.user_id, domain_id))
+        finally:
+            self._invalidate_cached('domain', domain_id)
+
+    def list_domain_endpoints(self, domain_id, size=None, **kwargs):
+        """
+        Async iterator version of :meth:`bandwidth.account.Client.list_domain_endpoints`
+        """
+        kwargs['size'] = size
+        path = '/users/%s/domains/%s/endpoints' % (self.user_id, domain_id)
+        return get_async_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+
+    async def create_domain_endpoint(
+            self,
+            domain_id,
+            name,
+            password,
+            description=None,
+            application_id=None,
+            enabled=True,
+            **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.create_domain_endpoint`
+        """
+        kwargs['name'] = name
+        kwargs['description'] = description
+        kwargs['applicationId'] = application_id
+        kwargs['enabled'] = enabled
+        kwargs['credentials'] = dict(password=password)
+        path = '/users/%s/domains/%s/endpoints' % (self.user_id, domain_id)
+        return (await self._make_request('post', path, json=kwargs))[2]
+
+    async def get_domain_endpoint(self, domain_id, endpoint_id):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.get_domain_endpoint`
+        """
+        path = '/users/%s/domains/%s/endpoints/%s' % (self.user_id, domain_id, endpoint_id)
+        return (await self._make_request('get', path))[0]
+
+    async def update_domain_endpoint(self,
+                                     domain_id,
+                                     endpoint_id,
+                                     password=None,
+                                     description=None,
+                                     application_id=None,
+                                     enabled=None,
+                                     **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.update_domain_endpoint`
+        """
+
+        kwargs['description'] = description
+        kwargs['applicationId'] = application_id
+        kwargs['enabled'] = enabled
+        kwargs['credentials'] = dict(password=password)
+
+        await self._make_request('post', '/users/%s/domains/%s/endpoints/%s' %
+                                 (self.user_id, domain_id, endpoint_id), json=kwargs)
+
+    async def delete_domain_endpoint(self, domain_id, endpoint_id):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.delete_domain_endpoint`
+        """
+        await self._make_request(
+            'delete', '/users/%s/domains/%s/endpoints/%s' % (self.user_id, domain_id, endpoint_id))
+
+    async def create_domain_endpoint_auth_token(self, domain_id, endpoint_id, expires=3600, **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.create_domain_endpoint_auth_token`
+        """
+        kwargs['expires'] = expires
+        path = '/users/%s/domains/%s/endpoints/%s/tokens' % (
+            self.user_id, domain_id, endpoint_id)
+        return (await self._make_request('post', path, json=kwargs))[0]
+
+    def list_errors(self, size=None, **kwargs):
+        """
+        Async iterator version of :meth:`bandwidth.account.Client.list_errors`
+        """
+        kwargs['size'] = size
+        path = '/users/%s/errors' % self.user_id
+        return get_async_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+
+    async def get_error(self, error_id):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.get_error`
+        """
+        return (await self._make_request('get', '/users/%s/errors/%s' % (self.user_id, error_id)))[0]
+
+    def list_media_files(self):
+        """
+        Async iterator version of :meth:`bandwidth.account.Client.list_media_files`
+        """
+        path = '/users/%s/media' % self.user_id
+        return get_async_lazy_enumerator(self, lambda: self._make_request('get', path))
+
+    async def upload_media_file(self, media_name, content=None, content_type='application/octet-stream',
+                                file_path=None, chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.upload_media_file`
+        """
+        is_file_path = False
+        if file_path is not None and content is None:
+            content = open(file_path, 'rb')
+            is_file_path = True
+        path = '/users/%s/media/%s' % (self.user_id, self._encode_if_not_encoded(media_name))
+        try:
+            return await self._make_request('put', path,
+                                            data=_get_upload_stream(media_name, content, chunk_size, progress),
+                                            headers={'content-type': content_type})
+        finally:
+            if is_file_path:
+                content.close()
+
+    async def upload_media_files(self, file_paths, concurrency=4, content_type=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                                 progress=None):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.upload_media_files`
+        """
+        async def upload(file_path):
+            media_name = os.path.basename(file_path)
+            with open(file_path, 'rb') as f:
+                stream = UploadStream(f, chunk_size=chunk_size, progress=_bind_progress(media_name, progress))
+                await self.upload_media_file(media_name, stream, content_type or get_content_type(file_path))
+            return {'media_name': media_name, 'file_path': file_path, 'size': stream.sent, 'md5': stream.md5}
+        return [_get_upload_result(item)
+                async for item in async_map_concurrently(upload, list_files(file_paths), concurrency)]
+
+    async def download_media_file(self, media_name):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.download_media_file`
+
+        :rtype (aiohttp.StreamReader, str)
+        :returns stream to file to download and mime type
+
+        Example::
+
+            stream, content_type = await api.download_media_file('file1.txt')
+            with io.open('file1.txt', 'wb') as file:
+                async for chunk in stream.iter_chunked(65536):
+                    file.write(chunk)
+        """
+        response = await self._get_media_file_response(media_name)
+        return response.raw, response.headers['content-type']
+
+    async def _get_media_file_response(self, media_name):
+        # response with not read content, it should be closed by caller
+        path = '/users/%s/media/%s' % (self.user_id, self._encode_if_not_encoded(media_name))
+        response = await self._send_request('get', path, stream=True)
+        try:
+            response.raise_for_status()
+        except Exception:
+            response.close()
+            raise
+        return response
+
+    async def download_media_files(self, media_names, dest_dir, concurrency=4, chunk_size=DEFAULT_CHUNK_SIZE,
+                                   progress=None):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.download_media_files`
+        """
+        started = time.time()
+
+        async def download(media_name):
+            return await self._download_media_file_to(media_name, get_local_file_path(dest_dir, media_name),
+                                                      chunk_size, progress)
+        items = [item async for item in async_map_concurrently(download, media_names, concurrency)]
+        return _get_download_report(items, dest_dir, started)
+
+    async def _download_media_file_to(self, media_name, file_path, chunk_size, progress):
+        path = '/users/%s/media/%s' % (self.user_id, self._encode_if_not_encoded(media_name))
+        if os.path.exists(file_path):
+            response = await self._send_request('head', path)
+            self._check_response(response)
+            if _is_downloaded(file_path, response):
+                return _get_download_result(media_name, file_path, 'skipped', 0)
+        part_path = file_path + '.part'
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        response = await self._send_request('get', path, stream=True, headers=_get_range_headers(offset))
+        received = 0
+        try:
+            if offset > 0 and response.status_code == 416:
+                if not _is_complete_part(response, offset):
+                    os.remove(part_path)
+                    return await self._download_media_file_to(media_name, file_path, chunk_size, progress)
+            else:
+                if response.status_code >= 400:
+                    response.content = await response.raw.read()
+                    self._check_response(response)
+                # progress of resumed download counts the part received before
+                start = offset if _is_resumed(response, offset) else 0
+                with open(part_path, 'ab' if start else 'wb') as f:
+                    async for chunk in response.raw.iter_chunked(chunk_size):
+                        f.write(chunk)
+                        received += len(chunk)
+                        if progress is not None:
+                            progress(media_name, start + received)
+        finally:
+            response.close()
+        _finish_download(part_path, file_path)
+        return _get_download_result(media_name, file_path, 'resumed' if _is_resumed(response, offset) else 'downloaded',
+                                    received)
+
+    async def delete_media_file(self, media_name):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.delete_media_file`
+        """
+        path = '/users/%s/media/%s' % (self.user_id, self._encode_if_not_encoded(media_name))
+        await self._make_request('delete', path)
+
+    async def get_number_info(self, number):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.get_number_info`
+        """
+        encoded_number = self._encode_if_not_encoded(number)
+        number_info = self._get_cached('number_info', encoded_number)
+        if number_info is None:
+            number_info = self._set_cached('number_info', encoded_number, (await self._make_request(
+                'get', '/phoneNumbers/numberInfo/%s' % encoded_number))[0])
+        return number_info
+
+    async def get_number_info_many(self, numbers, concurrency=4):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.get_number_info_many`
+        """
+        inputs, misses, results = _group_numbers(self, numbers)
+        async for item in async_map_concurrently(self.get_number_info, misses, concurrency):
+            results[item['args']] = item['result'] if item['error'] is None else item['error']
+        return _get_number_infos(inputs, results)
+
+    def list_phone_numbers(
+            self,
+            application_id=None,
+            state=None,
+            name=None,
+            city=None,
+            number_state=None,
+            size=None,
+            **kwargs):
+        """
+        Async iterator version of :meth:`bandwidth.account.Client.list_phone_numbers`
+        """
+
+        kwargs['applicationId'] = application_id
+        kwargs['state'] = state
+        kwargs['name'] = name
+        kwargs['city'] = city
+        kwargs['numberState'] = number_state
+        kwargs['size'] = size
+
+        path = '/users/%s/phoneNumbers' % self.user_id
+        return get_async_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+
+    async def order_phone_number(self,
+                                 number=None,
+                                 name=None,
+                                 application_id=None,
+                                 fallback_number=None,
+                                 **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.order_phone_number`
+        """
+
+        kwargs['number'] = number
+        kwargs['name'] = name
+        kwargs['applicationId'] = application_id
+        kwargs['fallbackNumber'] = fallback_number
+
+        return (await self._make_request('post', '/users/%s/phoneNumbers' % self.user_id, json=kwargs))[2]
+
+    async def get_phone_number(self, number_id):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.get_phone_number`
+        """
+        phone_number = self._get_cached('phone_number', number_id)
+        if phone_number is None:
+            phone_number = self._set_cached('phone_number', number_id, (await self._make_request(
+                'get', '/users/%s/phoneNumbers/%s' % (self.user_id, number_id)))[0])
+        return phone_number
+
+    async def update_phone_number(self, number_id,
+                                  name=None,
+                                  application_id=None,
+                                  fallback_number=None,
+                                  **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.update_phone_number`
+        """
+        kwargs['name'] = name
+        kwargs['applicationId'] = application_id
+        kwargs['fallbackNumber'] = fallback_number
+
+        try:
+            await self._make_request(
+                'post', '/users/%s/phoneNumbers/%s' % (self.user_id, number_id), json=kwargs)
+        finally:
+            self.clear_cache('phone_number')
+
+    async def delete_phone_number(self, number_id):
+        """
+        Coroutine version of :meth:`bandwidth.account.Client.delete_phone_number`
+        """
+        try:
+            await self._make_request(
+                'delete', '/users/%s/phoneNumbers/%s' % (self.user_id, number_id))
+        finally:
+            self.clear_cache('phone_number')
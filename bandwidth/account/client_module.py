@@ -1,18 +1,28 @@
-import requests
 import six
 import urllib
 import json
-import itertools
+import copy
+import os
+import time
 from bandwidth.voice.lazy_enumerable import get_lazy_enumerator
-from bandwidth.convert_camel import convert_object_to_snake_case
+from bandwidth.convert_camel import check_key_style, KEY_STYLES
 from bandwidth.voice.decorators import play_audio
+from bandwidth.transport import get_transport
+from bandwidth.revalidation import ConditionalCache
+from bandwidth.metrics import start_request_metrics, set_response_metrics, finish_request_metrics, parse_json
+from bandwidth.cache import create_caches
+from bandwidth.batch import map_concurrently
+from bandwidth.media import UploadStream, DEFAULT_CHUNK_SIZE, get_content_type, list_files, get_local_file_path
+from bandwidth.sharding import split_time_range, get_boundary_item_id, list_sharded, TRANSACTIONS_TIME_FORMAT
+from bandwidth.json_stream import check_streaming_supported, iter_json_items
 from bandwidth.version import __version__ as version
 
 from .api_exception_module import BandwidthAccountAPIException
 
 quote = urllib.parse.quote if six.PY3 else urllib.quote
 unquote = urllib.parse.unquote if six.PY3 else urllib.unquote
-lazy_map = map if six.PY3 else itertools.imap
+
+CACHED_RESOURCES = ('application', 'domain', 'phone_number', 'number_info')
 
 
 class Client:
@@ -34,6 +44,49 @@ class Client:
         :param api_endpoint: catapult api endpoint (optional, default value is https://api.catapult.inetwork.com)
         :type api_version: str
         :param api_version: catapult api version (optional, default value is v1)
+        :type transport: bandwidth.transport.Transport
+        :param transport: pooled transport to share with other clients (optional)
+        :type pool_connections: int
+        :param pool_connections: number of host connection pools (optional, default value is 10)
+        :type pool_maxsize: int
+        :param pool_maxsize: max number of connections per host (optional, default value is 10)
+        :type keep_alive: bool
+        :param keep_alive: reuse connections between requests (optional, default value is True)
+        :type retry: bandwidth.retry.RetryPolicy
+        :param retry: policy of retrying of failed requests (optional, requests are not retried by default)
+        :type rate_limiter: bandwidth.rate_limiter.RateLimiter
+        :param rate_limiter: limiter of rate of requests (optional, requests are not limited by default)
+        :type prefetch_pages: int
+        :param prefetch_pages: number of next pages of lists to request in background while current page
+            is being consumed (optional, default value is 0 - prefetching is disabled)
+        :type stream_pages: bool
+        :param stream_pages: parse items of list pages incrementally while they are being consumed
+            instead of loading whole page in memory (optional, default value is False, requires ijson)
+        :type key_style: str
+        :param key_style: style of keys of returned objects: 'snake' - keys are converted to snake_case,
+            'lazy_snake' - keys are converted to snake_case when they are read, 'raw' - objects are returned
+            as they have been parsed from json (optional, default value is 'snake')
+        :type cache_ttls: dict
+        :param cache_ttls: time to live in seconds of cached results of ``get_application()`` ('application'),
+            ``get_domain()`` ('domain'), ``get_phone_number()`` ('phone_number') and ``get_number_info()``
+            ('number_info'). Changes made by this client invalidate cached results
+            (optional, results are not cached by default)
+        :type cache_max_size: int
+        :param cache_max_size: max number of cached results of each resource, least recently used results are evicted
+            (optional, default value is 1000)
+        :type conditional_get: bool
+        :param conditional_get: cache single resources (like calls or messages, not lists) returned
+            by GET requests with ETag or Last-Modified headers and revalidate them by conditional requests,
+            unchanged results are served from the cache (optional, default value is False). Results served
+            from the cache are shared and should not be modified. Statistics are available in field
+            ``conditional_cache``
+        :type conditional_get_max_size: int
+        :param conditional_get_max_size: max number of results cached for conditional requests
+            (optional, default value is 1000)
+        :type metrics: types.FunctionType
+        :param metrics: sink of metrics of requests, function which takes :class:`bandwidth.metrics.RequestMetrics`
+            after each request (optional, metrics are not collected by default).
+            See :class:`bandwidth.metrics.MetricsRecorder`
 
         :rtype: bandwidth.catapult.Client
         :returns: bandwidth client
@@ -52,6 +105,92 @@ class Client:
             'api_endpoint', 'https://api.catapult.inetwork.com')
         self.api_version = other_options.get('api_version', 'v1')
         self.auth = (api_token, api_secret)
+        self.transport, self._owns_transport = get_transport(other_options)
+        self.prefetch_pages = other_options.get('prefetch_pages', 0)
+        self.stream_pages = other_options.get('stream_pages', False)
+        if self.stream_pages:
+            check_streaming_supported()
+        self.key_style = check_key_style(other_options.get('key_style', 'snake'))
+        self.conditional_cache = None
+        if other_options.get('conditional_get'):
+            self.conditional_cache = ConditionalCache(other_options.get('conditional_get_max_size', 1000))
+        self.metrics = other_options.get('metrics')
+        cache_ttls = other_options.get('cache_ttls') or {}
+        for resource in cache_ttls:
+            if resource not in CACHED_RESOURCES:
+                raise ValueError('Unknown cached resource %s. Use one of %s' % (resource, ', '.join(CACHED_RESOURCES)))
+        self.caches = create_caches(cache_ttls, other_options.get('cache_max_size', 1000))
+
+    def close(self):
+        """
+        Close pooled connections of the client (a shared transport passed to the client is left open)
+
+        Example::
+
+            with bandwidth.client('voice', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET') as api:
+                api.get_call('c-abc123')
+        """
+        if self._owns_transport:
+            self.transport.close()
+
+    def with_key_style(self, key_style):
+        """
+        Returns a copy of the client (sharing its transport) which returns objects with another style of keys
+
+        :type key_style: str
+        :param key_style: 'snake', 'lazy_snake' or 'raw'
+
+        :rtype: same type as the client
+        :returns: client copy
+
+        Example: Fetch messages with original camelCase keys::
+
+            for message in api.with_key_style('raw').list_messages():
+                print(message['deliveryState'])
+        """
+        client = copy.copy(self)
+        client.key_style = check_key_style(key_style)
+        client._owns_transport = False
+        return client
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def clear_cache(self, resource=None):
+        """
+        Removes cached results
+
+        :type resource: str
+        :param resource: resource to clear ('application', 'domain', 'phone_number' or 'number_info',
+            optional, all resources are cleared by default)
+        """
+        for name, cache in self.caches.items():
+            if resource is None or name == resource:
+                cache.clear()
+
+    def _get_cached(self, resource, key):
+        cache = self.caches.get(resource)
+        if cache is None:
+            return None
+        value = cache.get((self.key_style, key))
+        # callers get own copies so changes of returned objects don't affect the cache
+        return None if value is None else copy.deepcopy(value)
+
+    def _set_cached(self, resource, key, value):
+        cache = self.caches.get(resource)
+        if cache is None:
+            return value
+        cache.set((self.key_style, key), value)
+        return copy.deepcopy(value)
+
+    def _invalidate_cached(self, resource, key):
+        cache = self.caches.get(resource)
+        if cache is not None:
+            for key_style in KEY_STYLES:
+                cache.invalidate((key_style, key))
 
     def _encode_if_not_encoded(self, str_):
         """
@@ -80,7 +219,7 @@ class Client:
         if url.startswith('/'):
             # relative url
             url = '%s/%s%s' % (self.api_endpoint, self.api_version, url)
-        return requests.request(method, url, auth=self.auth, headers=headers, *args, **kwargs)
+        return self.transport.request(method, url, auth=self.auth, headers=headers, *args, **kwargs)
 
     def _check_response(self, response):
         if response.status_code >= 400:
@@ -94,13 +233,50 @@ class Client:
                     response.status_code, response.content.decode('utf-8')[:79])
 
     def _make_request(self, method, url, *args, **kwargs):
-        response = self._request(method, url, *args, **kwargs)
+        metrics = start_request_metrics(self, method, url)
+        try:
+            if self.conditional_cache is not None and method == 'get':
+                key = self.conditional_cache.get_key(self.key_style, url, kwargs)
+                entry = self.conditional_cache.prepare(key, kwargs)
+                response = self._request(method, url, *args, **kwargs)
+                set_response_metrics(metrics, response)
+                return self.conditional_cache.resolve(key, entry, response,
+                                                      lambda response: self._parse_response(response, metrics))
+            response = self._request(method, url, *args, **kwargs)
+            set_response_metrics(metrics, response)
+            return self._parse_response(response, metrics)
+        finally:
+            finish_request_metrics(self, metrics)
+
+    def _send_request(self, method, url, *args, **kwargs):
+        # request which response is read by caller (like content of media file), it is measured by metrics too
+        metrics = start_request_metrics(self, method, url)
+        try:
+            response = self._request(method, url, *args, **kwargs)
+            set_response_metrics(metrics, response, kwargs.get('stream', False))
+            return response
+        finally:
+            finish_request_metrics(self, metrics)
+
+    def _make_page_request(self, method, url, *args, **kwargs):
+        if not self.stream_pages:
+            return self._make_request(method, url, *args, **kwargs)
+        metrics = start_request_metrics(self, method, url)
+        try:
+            response = self._request(method, url, stream=True, *args, **kwargs)
+            set_response_metrics(metrics, response, stream=True)
+            self._check_response(response)
+        finally:
+            finish_request_metrics(self, metrics)
+        return (iter_json_items(response, self.key_style), response, None)
+
+    def _parse_response(self, response, metrics=None):
         self._check_response(response)
         data = None
         id = None
         if response.headers.get('content-type') is not None and \
                 response.headers.get('content-type').startswith("application/json"):
-            data = convert_object_to_snake_case(response.json())
+            data = parse_json(response, self.key_style, metrics)
         location = response.headers.get('location')
         if location is not None:
             id = location.split('/')[-1]
@@ -130,6 +306,7 @@ class Client:
                                   trans_type=None,
                                   size=None,
                                   number=None,
+                                  cursor=None,
                                   **kwargs):
         """
         Get the transactions from the user's account
@@ -143,7 +320,8 @@ class Client:
         :param int size: Used for pagination to indicate the size of each page requested for querying a list of items. \
             If no value is specified the default value is 25. (Maximum value 1000)
         :param str number: Search transactions by phone number
-        :rtype: types.GeneratorType
+        :param dict cursor: position to resume the list from (field ``cursor`` of previously returned list)
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of transactions
 
         Example: Get transactions::
@@ -174,15 +352,51 @@ class Client:
         kwargs["number"] = number
 
         path = '/users/%s/account/transactions' % self.user_id
-        return get_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path, params=kwargs), cursor)
+
+    def list_account_transactions_sharded(self, from_date, to_date, shards=4, concurrency=None, ordered=True,
+                                          **kwargs):
+        """
+        Get the transactions of a time range by walking its sub-ranges at the same time
+
+        :param str from_date: Start of the time range (string in "yyyy-MM-dd'T'HH:mm:ssZ" format or datetime, required)
+        :param str to_date: End of the time range (string in "yyyy-MM-dd'T'HH:mm:ssZ" format or datetime, required)
+        :param int shards: number of sub-ranges to split the time range to (optional, default value is 4)
+        :param int concurrency: number of sub-ranges walked at once (optional, default value is number of shards)
+        :param bool ordered: return transactions in order of the api (newest first, transactions of older
+            sub-ranges are buffered while newer ones are being consumed) or in order of receiving
+            (optional, default value is True)
+        :param kwargs: other filters of ``list_account_transactions()`` (like ``trans_type`` or ``size``),
+            ``max_items`` limits total number of transactions
+        :rtype: types.GeneratorType
+        :returns: list of transactions (transactions at boundaries of sub-ranges are returned once)
+
+        Example: Export charges of a month with 8 workers::
+
+            transactions = api.list_account_transactions_sharded('2017-01-01T00:00:00Z', '2017-01-31T23:59:59Z',
+                                                                 shards=8, trans_type='charge', size=1000)
+            for transaction in transactions:
+                print(transaction['amount'])
+        """
+        # each sub-range returns at most max_items transactions, they are limited in total too
+        max_items = kwargs.get('max_items')
+        ranges = split_time_range(from_date, to_date, shards)
+        ranges.reverse()
+
+        def list_shard(start, end):
+            return self.list_account_transactions(from_date=start.strftime(TRANSACTIONS_TIME_FORMAT),
+                                                  to_date=end.strftime(TRANSACTIONS_TIME_FORMAT), **kwargs)
+        return list_sharded(list_shard, ranges, concurrency, ordered, max_items=max_items,
+                            get_unique_id=get_boundary_item_id(ranges))
 
-    def list_applications(self, size=None, **kwargs):
+    def list_applications(self, size=None, cursor=None, **kwargs):
         """
         Get a list of user's applications
 
         :param int size: Used for pagination to indicate the size of each page requested for querying a list
                 of items. If no value is specified the default value is 25. (Maximum value 1000)
-        :rtype: types.GeneratorType
+        :param dict cursor: position to resume the list from (field ``cursor`` of previously returned list)
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of applications
 
         Example: Fetch and print all applications::
@@ -213,7 +427,7 @@ class Client:
         """
         kwargs["size"] = size
         path = '/users/%s/applications' % self.user_id
-        return get_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path, params=kwargs), cursor)
 
     def create_application(self,
                            name,
@@ -313,7 +527,11 @@ class Client:
             print(my_app["id"])
             ## a-1232asf123
         """
-        return self._make_request('get', '/users/%s/applications/%s' % (self.user_id, app_id))[0]
+        application = self._get_cached('application', app_id)
+        if application is None:
+            application = self._set_cached('application', app_id, self._make_request(
+                'get', '/users/%s/applications/%s' % (self.user_id, app_id))[0])
+        return application
 
     def update_application(self, app_id,
                            name=None,
@@ -396,7 +614,10 @@ class Client:
         kwargs["callbackHttpMethod"] = callback_http_method
         kwargs["autoAnswer"] = auto_answer
 
-        self._make_request('post', '/users/%s/applications/%s' % (self.user_id, app_id), json=kwargs)
+        try:
+            self._make_request('post', '/users/%s/applications/%s' % (self.user_id, app_id), json=kwargs)
+        finally:
+            self._invalidate_cached('application', app_id)
 
     def delete_application(self, app_id):
         """
@@ -416,8 +637,11 @@ class Client:
             ## The application a-appId could not be found
 
         """
-        self._make_request(
-            'delete', '/users/%s/applications/%s' % (self.user_id, app_id))
+        try:
+            self._make_request(
+                'delete', '/users/%s/applications/%s' % (self.user_id, app_id))
+        finally:
+            self._invalidate_cached('application', app_id)
 
     def search_available_local_numbers(self,
                                        city=None,
@@ -610,13 +834,14 @@ class Client:
             item['id'] = item.get('location', '').split('/')[-1]
         return list
 
-    def list_domains(self, size=None, **kwargs):
+    def list_domains(self, size=None, cursor=None, **kwargs):
         """
         Get a list of domains
 
         :param int size: Used for pagination to indicate the size of each page requested for querying a list of items. \
             If no value is specified the default value is 25. (Maximum value 100)
-        :rtype: types.GeneratorType
+        :param dict cursor: position to resume the list from (field ``cursor`` of previously returned list)
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of domains
 
         Example: Fetch domains and print::
@@ -651,7 +876,7 @@ class Client:
         """
         kwargs['size'] = size
         path = '/users/%s/domains' % self.user_id
-        return get_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path, params=kwargs), cursor)
 
     def create_domain(self, name, description=None, **kwargs):
         """
@@ -699,7 +924,11 @@ class Client:
             ##     'id'          : 'rd-domainId',
             ##     'name'        : 'qwerty'}
         """
-        return self._make_request('get', '/users/%s/domains/%s' % (self.user_id, domain_id))[0]
+        domain = self._get_cached('domain', domain_id)
+        if domain is None:
+            domain = self._set_cached('domain', domain_id, self._make_request(
+                'get', '/users/%s/domains/%s' % (self.user_id, domain_id))[0])
+        return domain
 
     def delete_domain(self, domain_id):
         """
@@ -712,10 +941,13 @@ class Client:
 
             api.delete_domain('domainId')
         """
-        self._make_request('delete', '/users/%s/domains/%s' %
-                           (self.user_id, domain_id))
+        try:
+            self._make_request('delete', '/users/%s/domains/%s' %
+                               (self.user_id, domain_id))
+        finally:
+            self._invalidate_cached('domain', domain_id)
 
-    def list_domain_endpoints(self, domain_id, size=None, **kwargs):
+    def list_domain_endpoints(self, domain_id, size=None, cursor=None, **kwargs):
         """
         Get a list of domain's endpoints
 
@@ -723,7 +955,8 @@ class Client:
         :param domain_id: id of a domain
         :param int size: Used for pagination to indicate the size of each page requested for querying a list of items.\
             If no value is specified the default value is 25. (Maximum value 1000)
-        :rtype: types.GeneratorType
+        :param dict cursor: position to resume the list from (field ``cursor`` of previously returned list)
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of endpoints
 
         Example: List and iterate over::
@@ -773,7 +1006,7 @@ class Client:
         """
         kwargs['size'] = size
         path = '/users/%s/domains/%s/endpoints' % (self.user_id, domain_id)
-        return get_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path, params=kwargs), cursor)
 
     def create_domain_endpoint(
             self,
@@ -981,13 +1214,14 @@ class Client:
             self.user_id, domain_id, endpoint_id)
         return self._make_request('post', path, json=kwargs)[0]
 
-    def list_errors(self, size=None, **kwargs):
+    def list_errors(self, size=None, cursor=None, **kwargs):
         """
         Get a list of errors
 
         :param int size: Used for pagination to indicate the size of each page requested for querying a list
             of items. If no value is specified the default value is 25. (Maximum value 1000)
-        :rtype: types.GeneratorType
+        :param dict cursor: position to resume the list from (field ``cursor`` of previously returned list)
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of calls
 
         Example: List all errors::
@@ -1047,7 +1281,7 @@ class Client:
         """
         kwargs['size'] = size
         path = '/users/%s/errors' % self.user_id
-        return get_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path, params=kwargs), cursor)
 
     def get_error(self, error_id):
         """
@@ -1090,11 +1324,13 @@ class Client:
         """
         return self._make_request('get', '/users/%s/errors/%s' % (self.user_id, error_id))[0]
 
-    def list_media_files(self):
+    def list_media_files(self, cursor=None):
         """
         Gets a list of user's media files.
+        :type cursor: dict
+        :param cursor: position to resume the list from (field ``cursor`` of previously returned list)
 
-        :rtype: types.GeneratorType
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of media files
 
         Example: list media files and save any with the name `dog` in file name::
@@ -1108,12 +1344,15 @@ class Client:
 
         """
         path = '/users/%s/media' % self.user_id
-        return get_lazy_enumerator(self, lambda: self._make_request('get', path))
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path), cursor)
 
-    def upload_media_file(self, media_name, content=None, content_type='application/octet-stream', file_path=None):
+    def upload_media_file(self, media_name, content=None, content_type='application/octet-stream', file_path=None,
+                          chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
         """
         Upload a file
 
+        Files are sent by chunks, so they are never loaded in memory at once.
+
         :type media_name: str
         :param media_name: name of file on bandwidth server
 
@@ -1127,6 +1366,13 @@ class Client:
         :type file_path: str
         :param file_path: path to file to upload. Don't use together with content
 
+        :type chunk_size: int
+        :param chunk_size: max number of bytes of file read at once (optional, default value is 65536)
+
+        :type progress: types.FunctionType
+        :param progress: function which is called with media name, numbers of sent and total bytes
+            after each sent chunk of file (optional)
+
         Example: Upload text file::
 
             api.upload_media_file('file1.txt', 'content of file', 'text/plain')
@@ -1134,6 +1380,13 @@ class Client:
             # with file path
             api.upload_media_file('file1.txt', file_path='/path/to/file1.txt')
 
+        Example: Upload large file with progress::
+
+            def progress(media_name, sent, total):
+                print('%s: %d%%' % (media_name, sent * 100 / total))
+
+            api.upload_media_file('prompt.wav', file_path='/path/to/prompt.wav', content_type='audio/wav',
+                                  progress=progress)
         """
         is_file_path = False
         if file_path is not None and content is None:
@@ -1141,11 +1394,50 @@ class Client:
             is_file_path = True
         path = '/users/%s/media/%s' % (self.user_id, self._encode_if_not_encoded(media_name))
         try:
-            return self._make_request('put', path, data=content, headers={'content-type': content_type})
+            return self._make_request('put', path, data=_get_upload_stream(media_name, content, chunk_size, progress),
+                                      headers={'content-type': content_type})
         finally:
             if is_file_path:
                 content.close()
 
+    def upload_media_files(self, file_paths, concurrency=4, content_type=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                           progress=None):
+        """
+        Upload several files (or all files of a directory) in parallel
+
+        Each file is uploaded with its base name as media name.
+
+        :type file_paths: str|collections.Iterable
+        :param file_paths: path to a directory (its files are uploaded, subdirectories are skipped)
+            or paths of files to upload
+        :type concurrency: int
+        :param concurrency: number of files uploaded at once (optional, default value is 4)
+        :type content_type: str
+        :param content_type: mime type of files (optional, it is detected by file extension by default)
+        :type chunk_size: int
+        :param chunk_size: max number of bytes of file read at once (optional, default value is 65536)
+        :type progress: types.FunctionType
+        :param progress: function which is called with media name, numbers of sent and total bytes
+            after each sent chunk of a file (optional)
+
+        :rtype: list
+        :returns: results of uploads in order of files. Each result contains 'media_name', 'file_path',
+            'size' (number of sent bytes), 'md5' (hex checksum of sent data) and 'error' (exception or None)
+
+        Example: Upload IVR prompts::
+
+            for result in api.upload_media_files('/path/to/prompts', concurrency=8):
+                if result['error'] is not None:
+                    print(result['file_path'], result['error'])
+        """
+        def upload(file_path):
+            media_name = os.path.basename(file_path)
+            with open(file_path, 'rb') as f:
+                stream = UploadStream(f, chunk_size=chunk_size, progress=_bind_progress(media_name, progress))
+                self.upload_media_file(media_name, stream, content_type or get_content_type(file_path))
+            return {'media_name': media_name, 'file_path': file_path, 'size': stream.sent, 'md5': stream.md5}
+        return [_get_upload_result(item) for item in map_concurrently(upload, list_files(file_paths), concurrency)]
+
     def download_media_file(self, media_name):
         """
         Download a file
@@ -1163,13 +1455,89 @@ class Client:
                 if 'dog' in media['media_name'].lower():
                     stream, content_type = api.download_media_file(media['media_name'])
                     with io.open(media['media_name'], 'wb') as file:
-                        file.write(stream.read())
+                        shutil.copyfileobj(stream, file, 65536)
         """
         path = '/users/%s/media/%s' % (self.user_id, self._encode_if_not_encoded(media_name))
-        response = self._request('get', path, stream=True)
+        response = self._send_request('get', path, stream=True)
         response.raise_for_status()
+        # content is decoded if it is sent compressed (Content-Encoding: gzip)
+        response.raw.decode_content = True
         return response.raw, response.headers['content-type']
 
+    def download_media_files(self, media_names, dest_dir, concurrency=4, chunk_size=DEFAULT_CHUNK_SIZE,
+                             progress=None):
+        """
+        Download several files to a directory in parallel
+
+        Files are written to disk by chunks. A file is downloaded to ``<name>.part`` first and renamed when it is
+        complete, so an interrupted download is continued from the received part (by request with Range header).
+        Existing files with the same size as on the server are skipped.
+
+        :type media_names: collections.Iterable
+        :param media_names: names of files on bandwidth server
+        :type dest_dir: str
+        :param dest_dir: directory to save files
+        :type concurrency: int
+        :param concurrency: number of files downloaded at once (optional, default value is 4)
+        :type chunk_size: int
+        :param chunk_size: max number of bytes written at once (optional, default value is 65536)
+        :type progress: types.FunctionType
+        :param progress: function which is called with media name and number of written bytes of the file
+            (including the part written before for resumed downloads) after each written chunk (optional)
+
+        :rtype: dict
+        :returns: results of downloads in order of names ('files'), number of received bytes ('bytes'),
+            time of downloading in seconds ('elapsed') and throughput in bytes per second ('throughput').
+            Each result contains 'media_name', 'file_path', 'status' ('downloaded', 'resumed' or 'skipped'),
+            'bytes' (number of received bytes) and 'error' (exception or None). Names which are not plain
+            file names (like '../file') are not downloaded, their results contain ValueError.
+
+        Example: Download all media files::
+
+            names = [media['media_name'] for media in api.list_media_files()]
+            report = api.download_media_files(names, '/path/to/media', concurrency=8)
+            print('%.1f MB/s' % (report['throughput'] / 1e6))
+        """
+        started = time.time()
+
+        def download(media_name):
+            return self._download_media_file_to(media_name, get_local_file_path(dest_dir, media_name), chunk_size,
+                                                progress)
+        return _get_download_report(map_concurrently(download, media_names, concurrency), dest_dir, started)
+
+    def _download_media_file_to(self, media_name, file_path, chunk_size, progress):
+        path = '/users/%s/media/%s' % (self.user_id, self._encode_if_not_encoded(media_name))
+        if os.path.exists(file_path):
+            response = self._send_request('head', path)
+            self._check_response(response)
+            if _is_downloaded(file_path, response):
+                return _get_download_result(media_name, file_path, 'skipped', 0)
+        part_path = file_path + '.part'
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        response = self._send_request('get', path, stream=True, headers=_get_range_headers(offset))
+        received = 0
+        try:
+            if offset > 0 and response.status_code == 416:
+                if not _is_complete_part(response, offset):
+                    # the part is longer than the file on the server
+                    os.remove(part_path)
+                    return self._download_media_file_to(media_name, file_path, chunk_size, progress)
+            else:
+                self._check_response(response)
+                # progress of resumed download counts the part received before
+                start = offset if _is_resumed(response, offset) else 0
+                with open(part_path, 'ab' if start else 'wb') as f:
+                    for chunk in response.iter_content(chunk_size):
+                        f.write(chunk)
+                        received += len(chunk)
+                        if progress is not None:
+                            progress(media_name, start + received)
+        finally:
+            response.close()
+        _finish_download(part_path, file_path)
+        return _get_download_result(media_name, file_path, 'resumed' if _is_resumed(response, offset) else 'downloaded',
+                                    received)
+
     def delete_media_file(self, media_name):
         """
         Remove a file from the server
@@ -1204,8 +1572,41 @@ class Client:
             ##     'updated'    : '2017-02-10T09:11:50Z'}
 
         """
-        path = '/phoneNumbers/numberInfo/%s' % self._encode_if_not_encoded(number)
-        return self._make_request('get', path)[0]
+        encoded_number = self._encode_if_not_encoded(number)
+        number_info = self._get_cached('number_info', encoded_number)
+        if number_info is None:
+            number_info = self._set_cached('number_info', encoded_number, self._make_request(
+                'get', '/phoneNumbers/numberInfo/%s' % encoded_number)[0])
+        return number_info
+
+    def get_number_info_many(self, numbers, concurrency=4):
+        """
+        Gets CNAM information about several phone numbers
+
+        Numbers are deduplicated after encoding (so '+1234567890' and '%2B1234567890' are requested once).
+        Information cached by the client (option ``cache_ttls`` with key 'number_info') is not requested again,
+        other numbers are requested in parallel.
+
+        :type numbers: collections.Iterable
+        :param numbers: phone numbers to get information
+        :type concurrency: int
+        :param concurrency: number of requests to send in parallel (optional, default value is 4)
+
+        :rtype: dict
+        :returns: CNAM information (or exception raised by its request) of each input number
+
+        Example: Enrich incoming calls with caller names::
+
+            api = bandwidth.client('account', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET',
+                                   cache_ttls={'number_info': 3600})
+            infos = api.get_number_info_many(['+1234567890', '+1234567891'], concurrency=8)
+            print(infos['+1234567890']['name'])
+            ## RALEIGH, NC
+        """
+        inputs, misses, results = _group_numbers(self, numbers)
+        for item in map_concurrently(self.get_number_info, misses, concurrency):
+            results[item['args']] = item['result'] if item['error'] is None else item['error']
+        return _get_number_infos(inputs, results)
 
     def list_phone_numbers(
             self,
@@ -1215,6 +1616,7 @@ class Client:
             city=None,
             number_state=None,
             size=None,
+            cursor=None,
             **kwargs):
         """
         Get a list of user's phone numbers
@@ -1230,7 +1632,8 @@ class Client:
             by the number state.
         :param str size: Used for pagination to indicate the size of each page requested for querying a list
             of items. If no value is specified the default value is 25. (Maximum value 1000)
-        :rtype: types.GeneratorType
+        :param dict cursor: position to resume the list from (field ``cursor`` of previously returned list)
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of phone numbers
 
         Example: List all phone numbers::
@@ -1271,7 +1674,7 @@ class Client:
         kwargs['size'] = size
 
         path = '/users/%s/phoneNumbers' % self.user_id
-        return get_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path, params=kwargs), cursor)
 
     def order_phone_number(self,
                            number=None,
@@ -1338,7 +1741,11 @@ class Client:
             ## }
 
         """
-        return self._make_request('get', '/users/%s/phoneNumbers/%s' % (self.user_id, number_id))[0]
+        phone_number = self._get_cached('phone_number', number_id)
+        if phone_number is None:
+            phone_number = self._set_cached('phone_number', number_id, self._make_request(
+                'get', '/users/%s/phoneNumbers/%s' % (self.user_id, number_id))[0])
+        return phone_number
 
     def update_phone_number(self, number_id,
                             name=None,
@@ -1389,8 +1796,12 @@ class Client:
         kwargs['applicationId'] = application_id
         kwargs['fallbackNumber'] = fallback_number
 
-        self._make_request(
-            'post', '/users/%s/phoneNumbers/%s' % (self.user_id, number_id), json=kwargs)
+        try:
+            self._make_request(
+                'post', '/users/%s/phoneNumbers/%s' % (self.user_id, number_id), json=kwargs)
+        finally:
+            # a number can be cached by its id and by the number itself
+            self.clear_cache('phone_number')
 
     def delete_phone_number(self, number_id):
         """
@@ -1403,5 +1814,96 @@ class Client:
 
             api.delete_phone_number('numberId')
         """
-        self._make_request(
-            'delete', '/users/%s/phoneNumbers/%s' % (self.user_id, number_id))
+        try:
+            self._make_request(
+                'delete', '/users/%s/phoneNumbers/%s' % (self.user_id, number_id))
+        finally:
+            self.clear_cache('phone_number')
+
+
+def _group_numbers(client, numbers):
+    # returns input numbers with their encoded forms, encoded numbers to request and cached results
+    inputs = []
+    misses = []
+    results = {}
+    for number in numbers:
+        encoded_number = client._encode_if_not_encoded(number.strip())
+        inputs.append((number, encoded_number))
+        if encoded_number in results:
+            continue
+        results[encoded_number] = client._get_cached('number_info', encoded_number)
+        if results[encoded_number] is None:
+            misses.append(encoded_number)
+    return inputs, misses, results
+
+
+def _get_number_infos(inputs, results):
+    infos = {}
+    used = set()
+    for number, encoded_number in inputs:
+        info = results[encoded_number]
+        # every input number gets own copy of shared result
+        infos[number] = copy.deepcopy(info) if encoded_number in used and not isinstance(info, Exception) else info
+        used.add(encoded_number)
+    return infos
+
+
+def _bind_progress(media_name, progress):
+    if progress is None:
+        return None
+    return lambda sent, total: progress(media_name, sent, total)
+
+
+def _get_upload_stream(media_name, content, chunk_size, progress):
+    # files are wrapped to be read by bounded chunks, other content is sent as is
+    if isinstance(content, UploadStream) or not hasattr(content, 'read') or not hasattr(content, 'seek'):
+        return content
+    return UploadStream(content, chunk_size=chunk_size, progress=_bind_progress(media_name, progress))
+
+
+def _get_upload_result(item):
+    if item['error'] is None:
+        item['result']['error'] = None
+        return item['result']
+    file_path = item['args']
+    return {'media_name': os.path.basename(file_path), 'file_path': file_path, 'size': None, 'md5': None,
+            'error': item['error']}
+
+
+def _is_downloaded(file_path, response):
+    return response.headers.get('content-length') == str(os.path.getsize(file_path))
+
+
+def _get_range_headers(offset):
+    return {'Range': 'bytes=%d-' % offset} if offset > 0 else None
+
+
+def _is_complete_part(response, offset):
+    return response.headers.get('content-range', '').strip() == 'bytes */%d' % offset
+
+
+def _is_resumed(response, offset):
+    return offset > 0 and response.status_code in (206, 416)
+
+
+def _finish_download(part_path, file_path):
+    if os.path.exists(file_path):
+        os.remove(file_path)
+    os.rename(part_path, file_path)
+
+
+def _get_download_result(media_name, file_path, status, received):
+    return {'media_name': media_name, 'file_path': file_path, 'status': status, 'bytes': received, 'error': None}
+
+
+def _get_download_report(items, dest_dir, started):
+    files = []
+    for item in items:
+        if item['error'] is None:
+            files.append(item['result'])
+        else:
+            files.append({'media_name': item['args'], 'file_path': os.path.join(dest_dir, item['args']),
+                          'status': None, 'bytes': 0, 'error': item['error']})
+    received = sum(result['bytes'] for result in files)
+    elapsed = time.time() - started
+    return {'files': files, 'bytes': received, 'elapsed': elapsed, 'throughput': received / elapsed if elapsed else 0.0}
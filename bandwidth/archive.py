@@ -0,0 +1,171 @@
+import io
+import os
+import six
+from bandwidth.batch import map_concurrently
+from bandwidth.media import DEFAULT_CHUNK_SIZE, get_local_file_path
+
+
+def _get_media_name(recording):
+    """
+    Returns name of media file of a recording (empty string if the recording has no media yet)
+    """
+    return (recording.get('media') or '').split('/')[-1]
+
+
+class Checkpoint(object):
+
+    """
+    Ids of archived items stored in a text file (one id per line)
+
+    Ids are appended to the file as soon as items are archived, so interrupted runs keep their progress.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize the checkpoint.
+        :type path: str
+        :param path: path to the file of the checkpoint (it is created on first added id)
+        """
+        self.path = path
+        self._ids = set()
+        if os.path.exists(path):
+            with io.open(path, 'r', encoding='utf-8') as f:
+                self._ids = set(line.strip() for line in f if line.strip())
+
+    def add(self, id):
+        """
+        Marks an item as archived
+        """
+        if id in self._ids:
+            return
+        with io.open(self.path, 'a', encoding='utf-8') as f:
+            f.write(six.text_type(id) + u'\n')
+        self._ids.add(id)
+
+    def __contains__(self, id):
+        return id in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+
+def _get_file_path(sink, media_name):
+    """
+    Returns path of media file in sink directory (None for function sinks)
+
+    Raises ValueError if media name from the api is not a plain file name (like '../file')
+    """
+    if not isinstance(sink, six.string_types):
+        return None
+    return get_local_file_path(sink, media_name)
+
+
+def _open_sink(sink, media_name, recording):
+    """
+    Returns writable binary file for content of recording and function to call after all content is written
+
+    :type sink: str or types.FunctionType
+    :param sink: path to directory or function which returns writable binary file for a recording
+        (it takes recording and name of its media file)
+    """
+    if not isinstance(sink, six.string_types):
+        return sink(recording, media_name), None
+    file_path = _get_file_path(sink, media_name)
+    part_path = file_path + '.part'
+
+    def finish():
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        os.rename(part_path, file_path)
+    return io.open(part_path, 'wb'), finish
+
+
+def _get_archive_result(recording, media_name, status, size=0, error=None):
+    return {'recording_id': recording.get('id'), 'media_name': media_name, 'status': status, 'bytes': size,
+            'error': error}
+
+
+def _get_pending_recordings(recordings, checkpoint):
+    for recording in recordings:
+        if recording.get('id') not in checkpoint:
+            yield recording,
+
+
+def _archive_recording(account_client, recording, sink, chunk_size):
+    media_name = _get_media_name(recording)
+    if not media_name:
+        return _get_archive_result(recording, media_name, 'no_media')
+    # media name is checked before downloading
+    _get_file_path(sink, media_name)
+    content, content_type = account_client.download_media_file(media_name)
+    try:
+        dest, finish = _open_sink(sink, media_name, recording)
+        size = 0
+        with dest:
+            while True:
+                chunk = content.read(chunk_size)
+                if not chunk:
+                    break
+                dest.write(chunk)
+                size += len(chunk)
+        if finish is not None:
+            finish()
+    finally:
+        content.close()
+    return _get_archive_result(recording, media_name, 'archived', size)
+
+
+def archive_recordings(voice_client, account_client, sink, checkpoint=None, concurrency=4,
+                       chunk_size=DEFAULT_CHUNK_SIZE, **kwargs):
+    """
+    Downloads media files of recordings on a bounded pool while recordings are being listed
+
+    Only ``concurrency`` recordings are held in memory at once, content of media files is streamed to the sink
+    by chunks. Recordings without media (recording is in progress) are not added to the checkpoint.
+
+    :type voice_client: bandwidth.voice.Client
+    :param voice_client: client which lists recordings
+    :type account_client: bandwidth.account.Client
+    :param account_client: client which downloads media files
+    :type sink: str or types.FunctionType
+    :param sink: path to existing directory or function which takes recording and name of its media file
+        and returns writable binary file (it is closed after writing)
+    :type checkpoint: str or bandwidth.archive.Checkpoint
+    :param checkpoint: path to file with ids of archived recordings (optional). Archived recordings are skipped
+        without downloading and ids of newly archived recordings are appended to the file.
+    :type concurrency: int
+    :param concurrency: max number of downloads at once (optional, default value is 4)
+    :type chunk_size: int
+    :param chunk_size: size of chunks of downloaded content (optional, default value is 65536)
+    :param kwargs: query parameters of :meth:`bandwidth.voice.Client.list_recordings`
+
+    :rtype: types.GeneratorType
+    :returns: result of each new recording. Each result is a dictionary with keys 'recording_id',
+        'media_name', 'status' ('archived', 'no_media' or 'failed'), 'bytes' and 'error'.
+
+    Example: archive new recordings to a directory::
+
+        from bandwidth.archive import archive_recordings
+
+        for result in archive_recordings(voice_api, account_api, '/var/recordings',
+                                         checkpoint='/var/recordings/.archived'):
+            if result['error'] is not None:
+                print(result['recording_id'], result['error'])
+    """
+    if isinstance(checkpoint, six.string_types):
+        checkpoint = Checkpoint(checkpoint)
+    recordings = voice_client.list_recordings(**kwargs)
+    # recordings are passed as tuples of arguments because dictionaries are treated as keyword arguments
+    recordings = _get_pending_recordings(recordings, checkpoint if checkpoint is not None else ())
+
+    def archive(recording):
+        return _archive_recording(account_client, recording, sink, chunk_size)
+    for item in map_concurrently(archive, recordings, concurrency):
+        if item['error'] is not None:
+            recording = item['args'][0]
+            yield _get_archive_result(recording, _get_media_name(recording), 'failed', error=item['error'])
+            continue
+        result = item['result']
+        if checkpoint is not None and result['status'] == 'archived':
+            checkpoint.add(result['recording_id'])
+        yield result
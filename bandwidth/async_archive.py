@@ -0,0 +1,55 @@
+import six
+from bandwidth.async_batch import async_map_concurrently
+from bandwidth.archive import Checkpoint, _get_media_name, _get_file_path, _open_sink, _get_archive_result
+from bandwidth.media import DEFAULT_CHUNK_SIZE
+
+
+async def _get_pending_recordings(recordings, checkpoint):
+    async for recording in recordings:
+        if recording.get('id') not in checkpoint:
+            yield recording,
+
+
+async def _archive_recording(account_client, recording, sink, chunk_size):
+    media_name = _get_media_name(recording)
+    if not media_name:
+        return _get_archive_result(recording, media_name, 'no_media')
+    # media name is checked before downloading
+    _get_file_path(sink, media_name)
+    response = await account_client._get_media_file_response(media_name)
+    try:
+        dest, finish = _open_sink(sink, media_name, recording)
+        size = 0
+        with dest:
+            async for chunk in response.raw.iter_chunked(chunk_size):
+                dest.write(chunk)
+                size += len(chunk)
+        if finish is not None:
+            finish()
+    finally:
+        # the connection is released to the pool if all content has been read and closed otherwise
+        response.close()
+    return _get_archive_result(recording, media_name, 'archived', size)
+
+
+async def async_archive_recordings(voice_client, account_client, sink, checkpoint=None, concurrency=4,
+                                   chunk_size=DEFAULT_CHUNK_SIZE, **kwargs):
+    """
+    Async iterator version of :func:`bandwidth.archive.archive_recordings` for async clients
+    """
+    if isinstance(checkpoint, six.string_types):
+        checkpoint = Checkpoint(checkpoint)
+    recordings = _get_pending_recordings(voice_client.list_recordings(**kwargs),
+                                         checkpoint if checkpoint is not None else ())
+
+    def archive(recording):
+        return _archive_recording(account_client, recording, sink, chunk_size)
+    async for item in async_map_concurrently(archive, recordings, concurrency):
+        if item['error'] is not None:
+            recording = item['args'][0]
+            yield _get_archive_result(recording, _get_media_name(recording), 'failed', error=item['error'])
+            continue
+        result = item['result']
+        if checkpoint is not None and result['status'] == 'archived':
+            checkpoint.add(result['recording_id'])
+        yield result
@@ -0,0 +1,87 @@
+import asyncio
+import collections
+from bandwidth.batch import _get_call_args
+
+
+async def _get_result(args, future):
+    try:
+        return {'args': args, 'result': await future, 'error': None}
+    except Exception as e:
+        return {'args': args, 'result': None, 'error': e}
+
+
+async def _iterate(items):
+    if hasattr(items, '__aiter__'):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def async_map_concurrently(func, args_iter, concurrency=4):
+    """
+    Async iterator version of :func:`bandwidth.batch.map_concurrently` for coroutine functions
+    (arguments can be an async iterator too)
+    """
+    pending = collections.deque()
+    try:
+        async for args in _iterate(args_iter):
+            call_args, call_kwargs = _get_call_args(args)
+            pending.append((args, asyncio.ensure_future(func(*call_args, **call_kwargs))))
+            if len(pending) >= concurrency:
+                args, future = pending.popleft()
+                yield await _get_result(args, future)
+        while len(pending) > 0:
+            args, future = pending.popleft()
+            yield await _get_result(args, future)
+    finally:
+        for args, future in pending:
+            future.cancel()
+
+
+class AsyncBatch(object):
+
+    """
+    Async version of :class:`bandwidth.batch.Batch` for async clients
+
+    :Example:
+
+        async with api.batch(concurrency=8) as batch:
+            async for member in api.list_conference_members('conferenceId'):
+                batch.hangup_call(member['call_id'])
+    """
+
+    def __init__(self, client, concurrency=4):
+        self.client = client
+        self.concurrency = concurrency
+        self.results = None
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._calls = []
+
+    async def _call(self, method, args, kwargs):
+        async with self._semaphore:
+            return await method(*args, **kwargs)
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+
+        def add_call(*args, **kwargs):
+            self._calls.append(((name, args, kwargs), asyncio.ensure_future(self._call(method, args, kwargs))))
+        return add_call
+
+    async def wait(self):
+        """
+        Waits for all calls of the batch
+
+        :rtype: list
+        :returns: results of calls in order of calls (like :meth:`bandwidth.batch.Batch.wait`)
+        """
+        self.results = [await _get_result(args, future) for args, future in self._calls]
+        return self.results
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.wait()
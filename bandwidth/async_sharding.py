@@ -0,0 +1,52 @@
+import asyncio
+from bandwidth.sharding import _ItemFilter, _ShardError, _SHARD_END
+
+
+async def async_list_sharded(list_shard, ranges, concurrency=None, ordered=True, buffer_size=10000, max_items=None,
+                             get_unique_id=None):
+    """
+    Async iterator version of :func:`bandwidth.sharding.list_sharded` (list_shard returns async iterators)
+    """
+    ranges = list(ranges)
+    semaphore = asyncio.Semaphore(concurrency or max(1, len(ranges)))
+    if ordered:
+        queues = [asyncio.Queue(maxsize=buffer_size) for _ in ranges]
+    else:
+        queues = [asyncio.Queue(maxsize=buffer_size)] * len(ranges)
+
+    async def walk(index):
+        q = queues[index]
+        async with semaphore:
+            shard = list_shard(*ranges[index])
+            try:
+                async for item in shard:
+                    await q.put(item)
+                await q.put(_SHARD_END)
+            except Exception as e:
+                await q.put(_ShardError(e))
+            finally:
+                # a shard which has not been read to the end (the walk is cancelled) releases its pages
+                aclose = getattr(shard, 'aclose', None)
+                if aclose is not None:
+                    await aclose()
+
+    items = _ItemFilter(max_items, get_unique_id)
+    if items.is_done():
+        return
+    tasks = [asyncio.ensure_future(walk(index)) for index in range(len(ranges))]
+    try:
+        for q in (queues if ordered else queues[:1] * len(ranges)):
+            while True:
+                item = await q.get()
+                if item is _SHARD_END:
+                    break
+                if isinstance(item, _ShardError):
+                    raise item.error
+                if items.accept(item):
+                    yield item
+                    if items.is_done():
+                        return
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
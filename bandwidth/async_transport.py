@@ -0,0 +1,226 @@
+import asyncio
+import base64
+import json
+from bandwidth.transport import is_stream
+from bandwidth.metrics import start_request_metrics, set_response_metrics, finish_request_metrics, _timer
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class AsyncResponse(object):
+
+    """
+    Response of async transport with the same interface as requests.Response
+    """
+
+    def __init__(self, response, content=None):
+        self.status_code = response.status
+        self.headers = response.headers
+        self.content = content
+        self.raw = response.content
+        self.network_time = None
+        self._response = response
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        self._response.raise_for_status()
+
+    def close(self):
+        self._response.close()
+
+
+class AsyncTransport(object):
+
+    """
+    Non-blocking pooled HTTP transport for async clients (requires aiohttp)
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, keep_alive=True, timeout=None, retry=None,
+                 rate_limiter=None):
+        """
+        Initialize the transport.
+        :type pool_connections: int
+        :param pool_connections: max number of connections for all hosts (optional, default value is 10)
+        :type pool_maxsize: int
+        :param pool_maxsize: max number of connections per host (optional, default value is 10)
+        :type keep_alive: bool
+        :param keep_alive: reuse connections between requests (optional, default value is True)
+        :type timeout: float
+        :param timeout: total timeout of request in seconds (optional)
+        :type retry: bandwidth.retry.RetryPolicy
+        :param retry: policy of retrying of failed requests (optional, requests are not retried by default)
+        :type rate_limiter: bandwidth.rate_limiter.RateLimiter
+        :param rate_limiter: limiter of rate of requests (optional, requests are not limited by default)
+
+        :rtype: bandwidth.async_transport.AsyncTransport
+        :returns: transport
+        """
+        if aiohttp is None:
+            raise ImportError('Async clients require aiohttp. Use "pip install bandwidth_sdk[async]"')
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.session = None
+
+    def _get_session(self):
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=max(self.pool_connections, self.pool_maxsize),
+                                             limit_per_host=self.pool_maxsize,
+                                             force_close=not self.keep_alive)
+            self.session = aiohttp.ClientSession(connector=connector,
+                                                 timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self.session
+
+    async def request(self, method, url, *args, **kwargs):
+        """
+        Make a http request over pooled connections (and retry it according to retry policy)
+
+        :rtype: bandwidth.async_transport.AsyncResponse
+        :returns: response with read body (or with not read stream ``raw`` if stream is True).
+            Its ``network_time`` is time of the attempt in seconds, without waiting for rate limiter
+            and previous attempts.
+        """
+        retry = self.retry
+        if retry is None or is_stream(kwargs.get('data')):
+            return await self._send(method, url, *args, **kwargs)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self._send(method, url, *args, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                delay = retry.get_delay(method, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = retry.get_delay(method, attempt, response=response)
+                if delay is None:
+                    return response
+                if kwargs.get('stream'):
+                    response.close()
+            await asyncio.sleep(delay)
+
+    async def _send(self, method, url, auth=None, headers=None, params=None, stream=False, **kwargs):
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve(method, url)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        if auth is not None:
+            headers = dict(headers or {})
+            headers['Authorization'] = 'Basic %s' % base64.b64encode(('%s:%s' % auth).encode('utf-8')).decode('ascii')
+        if params is not None:
+            # like requests skip parameters without values
+            params = dict((k, v) for k, v in params.items() if v is not None)
+        started = _timer()
+        response = await self._get_session().request(method, url, headers=headers, params=params, **kwargs)
+        if stream:
+            result = AsyncResponse(response)
+        else:
+            async with response:
+                result = AsyncResponse(response, await response.read())
+        result.network_time = _timer() - started
+        return result
+
+    async def close(self):
+        """
+        Close all pooled connections
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+
+def get_async_transport(options):
+    """
+    Returns async transport passed to client options or creates new one from pool options
+
+    :type options: dict
+    :param options: client options
+
+    :rtype: (bandwidth.async_transport.AsyncTransport, bool)
+    :returns: transport and flag which is True if transport has been created for the client
+    """
+    transport = options.get('transport')
+    if transport is not None:
+        return transport, False
+    return AsyncTransport(pool_connections=options.get('pool_connections', 10),
+                          pool_maxsize=options.get('pool_maxsize', 10),
+                          keep_alive=options.get('keep_alive', True),
+                          timeout=options.get('timeout'),
+                          retry=options.get('retry'),
+                          rate_limiter=options.get('rate_limiter')), True
+
+
+class AsyncClientMixin(object):
+
+    """
+    Common part of async voice, messaging and account clients
+    """
+
+    def _init_async_transport(self, options):
+        transport, owns_transport = get_async_transport(options)
+        options['transport'] = transport
+        return owns_transport
+
+    async def _make_request(self, method, url, *args, **kwargs):
+        metrics = start_request_metrics(self, method, url)
+        try:
+            if self.conditional_cache is not None and method == 'get':
+                key = self.conditional_cache.get_key(self.key_style, url, kwargs)
+                entry = self.conditional_cache.prepare(key, kwargs)
+                response = await self._request(method, url, *args, **kwargs)
+                set_response_metrics(metrics, response)
+                return self.conditional_cache.resolve(key, entry, response,
+                                                      lambda response: self._parse_response(response, metrics))
+            response = await self._request(method, url, *args, **kwargs)
+            set_response_metrics(metrics, response)
+            return self._parse_response(response, metrics)
+        finally:
+            finish_request_metrics(self, metrics)
+
+    async def _send_request(self, method, url, *args, **kwargs):
+        # request which response is read by caller (like content of media file), it is measured by metrics too
+        metrics = start_request_metrics(self, method, url)
+        try:
+            response = await self._request(method, url, *args, **kwargs)
+            set_response_metrics(metrics, response, kwargs.get('stream', False))
+            return response
+        finally:
+            finish_request_metrics(self, metrics)
+
+    async def close(self):
+        """
+        Close pooled connections of the client (a shared transport passed to the client is left open)
+
+        Example::
+
+            async with bandwidth.client('voice', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET',
+                                        mode='async') as api:
+                await api.get_call('c-abc123')
+        """
+        if self._owns_transport:
+            await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
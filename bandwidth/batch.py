@@ -0,0 +1,102 @@
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _get_call_args(args):
+    if isinstance(args, dict):
+        return (), args
+    if isinstance(args, tuple):
+        return args, {}
+    return (args,), {}
+
+
+def _get_result(args, future):
+    try:
+        return {'args': args, 'result': future.result(), 'error': None}
+    except Exception as e:
+        return {'args': args, 'result': None, 'error': e}
+
+
+def map_concurrently(func, args_iter, concurrency=4):
+    """
+    Calls function for each item of arguments concurrently on a thread pool
+
+    :type func: types.FunctionType
+    :param func: function to call
+    :type args_iter: collections.Iterable
+    :param args_iter: arguments of calls. Each item is a tuple of positional arguments,
+        a dictionary of keyword arguments or a single argument. Items are read on demand.
+    :type concurrency: int
+    :param concurrency: max number of calls running at once (optional, default value is 4)
+
+    :rtype: types.GeneratorType
+    :returns: results of calls in order of arguments. Each result is a dictionary
+        with keys 'args', 'result' and 'error' (exception raised by the call or None)
+    """
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending = collections.deque()
+    try:
+        for args in args_iter:
+            call_args, call_kwargs = _get_call_args(args)
+            pending.append((args, executor.submit(func, *call_args, **call_kwargs)))
+            if len(pending) >= concurrency:
+                args, future = pending.popleft()
+                yield _get_result(args, future)
+        while len(pending) > 0:
+            args, future = pending.popleft()
+            yield _get_result(args, future)
+    finally:
+        for args, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+class Batch(object):
+
+    """
+    Collects calls of client methods and runs them concurrently on a thread pool
+
+    Calls are started as soon as they are added. Results are available after exit from ``with`` block
+    (or call of ``wait()``) in order of calls.
+
+    :Example:
+
+        with api.batch(concurrency=8) as batch:
+            for member in api.list_conference_members('conferenceId'):
+                batch.hangup_call(member['call_id'])
+        for item in batch.results:
+            if item['error'] is not None:
+                print(item['args'], item['error'])
+    """
+
+    def __init__(self, client, concurrency=4):
+        self.client = client
+        self.concurrency = concurrency
+        self.results = None
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+        self._calls = []
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+
+        def add_call(*args, **kwargs):
+            self._calls.append(((name, args, kwargs), self._executor.submit(method, *args, **kwargs)))
+        return add_call
+
+    def wait(self):
+        """
+        Waits for all calls of the batch
+
+        :rtype: list
+        :returns: results of calls in order of calls. Each result is a dictionary with keys 'args'
+            (tuple of method name, positional and keyword arguments), 'result' and 'error'
+        """
+        self.results = [_get_result(args, future) for args, future in self._calls]
+        self._executor.shutdown(wait=False)
+        return self.results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.wait()
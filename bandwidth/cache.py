@@ -0,0 +1,87 @@
+import collections
+import threading
+import time
+
+_monotonic = getattr(time, 'monotonic', time.time)
+
+
+class TTLCache(object):
+
+    """
+    Thread safe cache with time to live of entries and LRU eviction
+    """
+
+    def __init__(self, ttl, max_size=1000):
+        """
+        Initialize the cache.
+        :type ttl: float
+        :param ttl: time to live of entries in seconds
+        :type max_size: int
+        :param max_size: max number of entries, least recently used entries are evicted
+            (optional, default value is 1000)
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Returns cached value or default value if there is no entry or it has expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= _monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            # move the entry to the end of LRU order
+            del self._entries[key]
+            self._entries[key] = entry
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value):
+        """
+        Adds or replaces an entry
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            while len(self._entries) >= self.max_size:
+                self._entries.popitem(last=False)
+            self._entries[key] = (value, _monotonic() + self.ttl)
+
+    def invalidate(self, key):
+        """
+        Removes an entry
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """
+        Removes all entries
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def create_caches(cache_ttls, max_size=1000):
+    """
+    Creates caches of resources
+
+    :type cache_ttls: dict
+    :param cache_ttls: time to live in seconds of entries of each resource
+    :type max_size: int
+    :param max_size: max number of entries of each resource
+
+    :rtype: dict
+    :returns: caches of resources
+    """
+    return dict((resource, TTLCache(ttl, max_size)) for resource, ttl in (cache_ttls or {}).items() if ttl)
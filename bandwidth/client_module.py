@@ -1,4 +1,5 @@
 _SUPPORTED_CLIENTS = ['voice', 'messaging', 'account', 'numbers']
+_SUPPORTED_MODES = ['sync', 'async']
 
 
 _client_classes = {}
@@ -15,6 +16,7 @@ def client(client_name, *args, **kwargs):
     :param str api_endpoint: catapult api endpoint
         (optional, default value is https://api.catapult.inetwork.com, for 'catapult' only)
     :param str api_version: catapult api version (optional, default value is v1, for 'catapult' only)
+    :param str mode: 'sync' (default) or 'async' for client with coroutine methods (requires aiohttp)
 
 
     :rtype: bandwidth.catapult.Client
@@ -28,6 +30,8 @@ def client(client_name, *args, **kwargs):
 
     >>> messaging_api = bandwidth.client('messaging', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET')
 
+    >>> voice_api = bandwidth.client('voice', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET', mode='async')
+
     """
 
     global _client_classes
@@ -35,8 +39,16 @@ def client(client_name, *args, **kwargs):
     if name not in _SUPPORTED_CLIENTS:
         client_names = ', '.join(map(lambda k: '"%s"' % k, _SUPPORTED_CLIENTS))
         raise ValueError('Invalid client name "%s". Valid values are %s' % (client_name, client_names))
-    client_class = _client_classes.get(name)
+    mode = kwargs.pop('mode', 'sync')
+    if mode not in _SUPPORTED_MODES:
+        raise ValueError('Invalid mode "%s". Valid values are "sync", "async"' % mode)
+    key = name if mode == 'sync' else '%s_%s' % (name, mode)
+    client_class = _client_classes.get(key)
     if client_class is None:
-        client_class = getattr(__import__('bandwidth.%s' % name), name).Client
-        _client_classes[name] = client_class
+        if mode == 'sync':
+            client_class = getattr(__import__('bandwidth.%s' % name), name).Client
+        else:
+            module = __import__('bandwidth.%s.async_client_module' % name)
+            client_class = getattr(module, name).async_client_module.AsyncClient
+        _client_classes[key] = client_class
     return client_class(*args, **kwargs)
@@ -1,4 +1,15 @@
 import re
+try:
+    from collections.abc import MutableMapping
+except ImportError:  # pragma: no cover
+    from collections import MutableMapping
+
+_CAMEL_CASE_RE = re.compile('((?<=[a-z0-9])[A-Z]|(?!^)[A-Z](?=[a-z]))')
+
+# api uses small set of keys so converted keys are cached (cache is cleared when it becomes full)
+_SNAKE_CASE_CACHE_SIZE = 1024
+KEY_STYLES = ('snake', 'lazy_snake', 'raw')
+_snake_case_cache = {}
 
 
 def convert_string_to_snake_case(s):
@@ -8,8 +19,13 @@ def convert_string_to_snake_case(s):
     :rtype: String
     :rertuns: String converted to snake_case
     """
-    a = re.compile('((?<=[a-z0-9])[A-Z]|(?!^)[A-Z](?=[a-z]))')
-    return a.sub(r'_\1', s).lower()
+    converted = _snake_case_cache.get(s)
+    if converted is None:
+        converted = _CAMEL_CASE_RE.sub(r'_\1', s).lower()
+        if len(_snake_case_cache) >= _SNAKE_CASE_CACHE_SIZE:
+            _snake_case_cache.clear()
+        _snake_case_cache[s] = converted
+    return converted
 
 
 def convert_list_to_snake_case(a):
@@ -40,14 +56,14 @@ def convert_dict_to_snake_case(d):
     :rertuns: dictionary with each key converted to snake_case
     """
     out = {}
-    for k in d:
+    for k, v in d.items():
         new_k = convert_string_to_snake_case(k)
-        if isinstance(d[k], dict):
-            out[new_k] = convert_dict_to_snake_case(d[k])
-        elif isinstance(d[k], list):
-            out[new_k] = convert_list_to_snake_case(d[k])
+        if isinstance(v, dict):
+            out[new_k] = convert_dict_to_snake_case(v)
+        elif isinstance(v, list):
+            out[new_k] = convert_list_to_snake_case(v)
         else:
-            out[new_k] = d[k]
+            out[new_k] = v
     return out
 
 
@@ -67,3 +83,107 @@ def convert_object_to_snake_case(o):
         return convert_string_to_snake_case(o)
     else:
         return o
+
+
+def convert_string_to_camel_case(s):
+    """
+    Changes String to from snake_case to camelCase
+    :param s: String to convert
+    :rtype: String
+    :rertuns: String converted to camelCase
+    """
+    words = s.split('_')
+    return words[0] + ''.join(w.capitalize() for w in words[1:])
+
+
+def _wrap_value(value):
+    if isinstance(value, dict):
+        return SnakeCaseView(value)
+    elif isinstance(value, list):
+        return [_wrap_value(i) for i in value]
+    return value
+
+
+class SnakeCaseView(MutableMapping):
+
+    """
+    Dictionary-like view of parsed json object with snake_case keys.
+    Keys are converted on first access only and nested objects are wrapped when they are read.
+    Changes are written to the underlying object.
+    """
+
+    __slots__ = ('_data', '_keys', '_values')
+
+    def __init__(self, data):
+        self._data = data
+        self._keys = None
+        self._values = {}
+
+    def _get_keys(self):
+        if self._keys is None:
+            self._keys = dict((convert_string_to_snake_case(k), k) for k in self._data)
+        return self._keys
+
+    def __getitem__(self, key):
+        if key in self._values:
+            return self._values[key]
+        value = _wrap_value(self._data[self._get_keys()[key]])
+        self._values[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        keys = self._get_keys()
+        if key not in keys:
+            keys[key] = key
+        self._data[keys[key]] = value
+        self._values[key] = value
+
+    def __delitem__(self, key):
+        keys = self._get_keys()
+        del self._data[keys.pop(key)]
+        self._values.pop(key, None)
+
+    def __iter__(self):
+        return iter(self._get_keys())
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    @property
+    def raw(self):
+        """
+        Underlying json object with original keys
+        """
+        return self._data
+
+
+def check_key_style(key_style):
+    """
+    Checks if key style is supported
+    :param key_style: key style to check
+    :rtype: str
+    :rertuns: key style
+    """
+    if key_style not in KEY_STYLES:
+        raise ValueError('Invalid key style "%s". Valid values are %s' %
+                         (key_style, ', '.join(map(lambda k: '"%s"' % k, KEY_STYLES))))
+    return key_style
+
+
+def convert_object_to_key_style(o, key_style):
+    """
+    Converts parsed json object to required key style
+    :param o: Dictionary or Array of dictionaries to convert
+    :param key_style: 'snake' (keys are converted to snake_case),
+        'lazy_snake' (keys are converted to snake_case on access) or 'raw' (object is returned as is)
+    :rtype: o
+    :rertuns: converted object
+    """
+    if key_style == 'snake':
+        return convert_object_to_snake_case(o)
+    elif key_style == 'lazy_snake':
+        return _wrap_value(o)
+    return o
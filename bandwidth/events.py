@@ -0,0 +1,183 @@
+import json
+import six
+from dateutil import parser
+
+
+class Field(object):
+
+    """
+    Attribute of event which is read from its callback data on access
+    """
+
+    def __init__(self, key, convert=None):
+        self.key = key
+        self.convert = convert
+
+    def __get__(self, event, owner):
+        if event is None:
+            return self
+        if self.convert is None:
+            return event.data.get(self.key)
+        decoded = event._decoded
+        if decoded is None:
+            decoded = event._decoded = {}
+        if self.key not in decoded:
+            value = event.data.get(self.key)
+            decoded[self.key] = None if value is None else self.convert(value)
+        return decoded[self.key]
+
+
+class TimeField(Field):
+
+    """
+    Attribute of event with time which is parsed to datetime on first access
+    """
+
+    def __init__(self, key):
+        super(TimeField, self).__init__(key, parser.parse)
+
+
+class Event(object):
+
+    """
+    Callback event. Attributes are decoded from callback data on first access.
+
+    Event classes define ``__slots__`` and have no per-instance dictionary.
+    """
+
+    __slots__ = ('data', '_decoded')
+
+    EVENT_TYPE = None
+
+    event_type = Field('eventType')
+    time = TimeField('time')
+    tag = Field('tag')
+
+    def __init__(self, data):
+        """
+        Initialize the event.
+        :type data: dict
+        :param data: callback data (keys in camelCase)
+        """
+        self.data = data
+        self._decoded = None
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def get(self, key, default=None):
+        """
+        Returns value of callback data by its key in camelCase
+        """
+        return self.data.get(key, default)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.data)
+
+
+def get_event_classes(*classes):
+    """
+    Returns table of event classes by their event types
+    """
+    return dict((event_class.EVENT_TYPE, event_class) for event_class in classes)
+
+
+def parse_event(body, event_classes):
+    """
+    Parses callback body to an event
+
+    :type body: str or bytes or dict
+    :param body: JSON text of callback or decoded JSON
+    :type event_classes: dict
+    :param event_classes: event classes by event types. Base class :class:`bandwidth.events.Event`
+        is used for unknown event types.
+
+    :rtype: bandwidth.events.Event
+    :returns: event
+    """
+    if isinstance(body, bytes):
+        body = body.decode('utf-8')
+    data = json.loads(body) if isinstance(body, six.string_types) else body
+    if not isinstance(data, dict):
+        raise ValueError('Callback body should be a JSON object')
+    return event_classes.get(data.get('eventType'), Event)(data)
+
+
+class EventDispatcher(object):
+
+    """
+    Calls handlers of callback events by their event types
+
+    :Example:
+
+        dispatcher = EventDispatcher(event_classes)
+
+        @dispatcher.on('answer')
+        def on_answer(event):
+            print(event.call_id)
+
+        dispatcher.dispatch(request_body)
+    """
+
+    event_classes = {}
+
+    def __init__(self, event_classes=None, default=None):
+        """
+        Initialize the dispatcher.
+        :type event_classes: dict
+        :param event_classes: event classes by event types (optional, event classes of the dispatcher class
+            by default)
+        :type default: types.FunctionType
+        :param default: handler of events without own handler (optional, such events are ignored by default)
+        """
+        if event_classes is not None:
+            self.event_classes = event_classes
+        self.default = default
+        self.handlers = {}
+
+    def register(self, event_type, handler):
+        """
+        Sets handler of events
+
+        :type event_type: str or type
+        :param event_type: event type or event class
+        :type handler: types.FunctionType
+        :param handler: function which takes event
+        """
+        if isinstance(event_type, type):
+            event_type = event_type.EVENT_TYPE
+        self.handlers[event_type] = handler
+
+    def on(self, event_type):
+        """
+        Decorator which sets handler of events
+        """
+        def decorator(handler):
+            self.register(event_type, handler)
+            return handler
+        return decorator
+
+    def dispatch(self, body):
+        """
+        Parses callback body and calls handler of the event
+
+        :type body: str or bytes or dict
+        :param body: JSON text of callback or decoded JSON
+
+        :returns: result of the handler (None if there is no handler)
+        """
+        return self.handle(parse_event(body, self.event_classes))
+
+    def handle(self, event):
+        """
+        Calls handler of parsed event
+
+        :type event: bandwidth.events.Event
+        :param event: event
+
+        :returns: result of the handler (None if there is no handler)
+        """
+        handler = self.handlers.get(event.event_type, self.default)
+        if handler is None:
+            return None
+        return handler(event)
@@ -0,0 +1,44 @@
+from bandwidth.convert_camel import convert_object_to_key_style
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+
+def check_streaming_supported():
+    """
+    Raises ImportError if streaming json parser is not installed
+    """
+    if ijson is None:
+        raise ImportError('Streaming of list pages requires ijson. Use "pip install bandwidth_sdk[streaming]"')
+
+
+def is_json_response(response):
+    content_type = response.headers.get('content-type')
+    return content_type is not None and content_type.startswith('application/json')
+
+
+def iter_json_items(response, key_style):
+    """
+    Parses items of json array from body of streamed response one by one
+
+    Only one item is kept in memory at once. The response is closed when all items have been read
+    or the generator has been closed.
+
+    :type response: requests.Response
+    :param response: response of request with stream=True
+    :type key_style: str
+    :param key_style: style of keys of returned items ('snake', 'lazy_snake' or 'raw')
+
+    :rtype: types.GeneratorType
+    :returns: items of array converted to key style
+    """
+    try:
+        if not is_json_response(response):
+            return
+        response.raw.decode_content = True
+        for item in ijson.items(response.raw, 'item', use_float=True):
+            yield convert_object_to_key_style(item, key_style)
+    finally:
+        response.close()
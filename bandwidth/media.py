@@ -0,0 +1,119 @@
+import hashlib
+import io
+import mimetypes
+import os
+import six
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+class UploadStream(io.RawIOBase):
+
+    """
+    Readable stream which reads a file by bounded chunks while it is being sent,
+    reports progress and computes md5 checksum of sent data
+    """
+
+    def __init__(self, fileobj, size=None, chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+        """
+        Initialize the stream.
+        :type fileobj: file
+        :param fileobj: file opened in binary mode (reading starts from its current position)
+        :type size: int
+        :param size: number of bytes to send (optional, rest of file by default)
+        :type chunk_size: int
+        :param chunk_size: max number of bytes read at once (optional, default value is 65536)
+        :type progress: types.FunctionType
+        :param progress: function which is called with numbers of sent and total bytes after each chunk (optional)
+        """
+        super(UploadStream, self).__init__()
+        if size is None:
+            size = get_remaining_size(fileobj)
+        self.fileobj = fileobj
+        self.size = size
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.sent = 0
+        self._md5 = hashlib.md5()
+
+    @property
+    def md5(self):
+        """
+        Hex md5 checksum of sent data
+        """
+        return self._md5.hexdigest()
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        remaining = self.size - self.sent
+        if size is None or size < 0 or size > self.chunk_size:
+            size = self.chunk_size
+        chunk = self.fileobj.read(min(size, remaining)) if remaining > 0 else b''
+        if chunk:
+            self.sent += len(chunk)
+            self._md5.update(chunk)
+            if self.progress is not None:
+                self.progress(self.sent, self.size)
+        return chunk
+
+    def readinto(self, buffer):
+        chunk = self.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+    def tell(self):
+        return self.sent
+
+    def __len__(self):
+        return self.size
+
+
+def get_remaining_size(fileobj):
+    """
+    Returns number of bytes from current position to end of a seekable file
+    """
+    position = fileobj.tell()
+    fileobj.seek(0, os.SEEK_END)
+    size = fileobj.tell() - position
+    fileobj.seek(position)
+    return size
+
+
+def get_content_type(file_path):
+    """
+    Returns mime type of file by its extension (application/octet-stream for unknown types)
+    """
+    return mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+
+
+def list_files(paths):
+    """
+    Returns paths of files of a directory (not recursively) or iterable of file paths as is
+    """
+    if isinstance(paths, six.string_types):
+        return [os.path.join(paths, name) for name in sorted(os.listdir(paths))
+                if os.path.isfile(os.path.join(paths, name))]
+    return list(paths)
+
+
+def get_local_file_path(dest_dir, media_name):
+    """
+    Returns path of a local copy of a media file in a directory
+
+    Media names come from the api, names which are not plain file names (with path separators,
+    drive or '.' and '..') are rejected, so files are never written outside of the directory.
+
+    :type dest_dir: str
+    :param dest_dir: directory of local copies
+    :type media_name: str
+    :param media_name: name of file on bandwidth server
+
+    :rtype: str
+    :returns: path of the file in the directory
+    """
+    if not media_name or media_name in ('.', '..') or '/' in media_name or '\\' in media_name or \
+            os.path.basename(media_name) != media_name or os.path.splitdrive(media_name)[0]:
+        raise ValueError('Invalid media name for local file: %r' % media_name)
+    return os.path.join(dest_dir, media_name)
@@ -0,0 +1,144 @@
+import asyncio
+import collections
+import itertools
+from bandwidth.async_transport import AsyncClientMixin
+from bandwidth.voice.async_lazy_enumerable import get_async_lazy_enumerator
+from bandwidth.async_sharding import async_list_sharded
+from bandwidth.sharding import split_time_range, get_boundary_item_id, MESSAGES_TIME_FORMAT
+
+from .client_module import Client, _get_bulk_results
+
+
+class AsyncClient(AsyncClientMixin, Client):
+
+    """
+    Catapult client with coroutine methods (requires aiohttp)
+
+    Methods which return lists are async iterators.
+    """
+
+    def __init__(self, user_id=None, api_token=None, api_secret=None, **other_options):
+        """
+        Initialize the async client. Takes the same arguments as :class:`bandwidth.messaging.Client`
+        (option ``transport`` should be an instance of :class:`bandwidth.async_transport.AsyncTransport`).
+
+        Init the async client::
+
+            api = bandwidth.client('messaging', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET', mode='async')
+        """
+        owns_transport = self._init_async_transport(other_options)
+        Client.__init__(self, user_id, api_token, api_secret, **other_options)
+        self._owns_transport = owns_transport
+
+    def list_messages(self,
+                      from_=None,
+                      to=None,
+                      from_date_time=None,
+                      to_date_time=None,
+                      direction=None,
+                      state=None,
+                      delivery_state=None,
+                      sort_order=None,
+                      size=None,
+                      **kwargs):
+        """
+        Async iterator version of :meth:`bandwidth.messaging.Client.list_messages`
+        """
+
+        kwargs['from'] = from_
+        kwargs['to'] = to
+        kwargs['fromDateTime'] = from_date_time
+        kwargs['toDateTime'] = to_date_time
+        kwargs['direction'] = direction
+        kwargs['state'] = state
+        kwargs['deliveryState'] = delivery_state
+        kwargs['sortOrder'] = sort_order
+        kwargs['size'] = size
+
+        path = '/users/%s/messages' % self.user_id
+        return get_async_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+
+    def list_messages_sharded(self, from_date_time, to_date_time, shards=4, concurrency=None, ordered=True,
+                              sort_order='asc', **kwargs):
+        """
+        Async iterator version of :meth:`bandwidth.messaging.Client.list_messages_sharded`
+        """
+        # max_items limits all messages, it is not a filter of list_messages()
+        max_items = kwargs.pop('max_items', None)
+        ranges = split_time_range(from_date_time, to_date_time, shards)
+        if sort_order == 'desc':
+            ranges.reverse()
+
+        def list_shard(start, end):
+            return self.list_messages(from_date_time=start.strftime(MESSAGES_TIME_FORMAT),
+                                      to_date_time=end.strftime(MESSAGES_TIME_FORMAT),
+                                      sort_order=sort_order, **kwargs)
+        return async_list_sharded(list_shard, ranges, concurrency, ordered, max_items=max_items,
+                                  get_unique_id=get_boundary_item_id(ranges))
+
+    async def send_message(self, from_, to,
+                           text=None,
+                           media=None,
+                           receipt_requested=None,
+                           callback_url=None,
+                           callback_http_method=None,
+                           callback_timeout=None,
+                           fallback_url=None,
+                           tag=None,
+                           **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.messaging.Client.send_message`
+        """
+        kwargs['from'] = from_
+        kwargs['to'] = to
+        kwargs['text'] = text
+        kwargs['media'] = media
+        kwargs['receiptRequested'] = receipt_requested
+        kwargs['callbackUrl'] = callback_url
+        kwargs['callbackHttpMethod'] = callback_http_method
+        kwargs['callbackTimeout'] = callback_timeout
+        kwargs['fallbackUrl'] = fallback_url
+        kwargs['tag'] = tag
+
+        return (await self._make_request('post', '/users/%s/messages' % self.user_id, json=kwargs))[2]
+
+    async def send_messages(self, messages_data):
+        """
+        Coroutine version of :meth:`bandwidth.messaging.Client.send_messages`
+        """
+        results = (await self._make_request(
+            'post', '/users/%s/messages' % self.user_id, json=messages_data))[0]
+        for i in range(0, len(messages_data)):
+            item = results[i]
+            item['id'] = item.get('location', '').split('/')[-1]
+            item['message'] = messages_data[i]
+        return results
+
+    async def send_messages_bulk(self, messages, chunk_size=100, concurrency=4):
+        """
+        Async iterator version of :meth:`bandwidth.messaging.Client.send_messages_bulk`
+        """
+        items = iter(messages)
+        pending = collections.deque()
+        try:
+            while True:
+                chunk = list(itertools.islice(items, chunk_size))
+                if len(chunk) > 0:
+                    pending.append((chunk, asyncio.ensure_future(self.send_messages(chunk))))
+                if len(pending) == 0:
+                    break
+                if len(chunk) > 0 and len(pending) < concurrency:
+                    continue
+                chunk, future = pending.popleft()
+                await asyncio.wait([future])
+                for result in _get_bulk_results(chunk, future):
+                    yield result
+        finally:
+            for chunk, future in pending:
+                future.cancel()
+
+    async def get_message(self, id):
+        """
+        Coroutine version of :meth:`bandwidth.messaging.Client.get_message`
+        """
+        return (await self._make_request('get', '/users/%s/messages/%s' % (self.user_id, id)))[0]
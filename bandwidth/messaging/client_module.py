@@ -1,16 +1,22 @@
-import requests
 import six
 import urllib
 import json
+import copy
 import itertools
+import collections
+from concurrent.futures import ThreadPoolExecutor
 from bandwidth.voice.lazy_enumerable import get_lazy_enumerator
-from bandwidth.convert_camel import convert_object_to_snake_case
+from bandwidth.convert_camel import check_key_style
+from bandwidth.transport import get_transport
+from bandwidth.revalidation import ConditionalCache
+from bandwidth.metrics import start_request_metrics, set_response_metrics, finish_request_metrics, parse_json
+from bandwidth.sharding import split_time_range, get_boundary_item_id, list_sharded, MESSAGES_TIME_FORMAT
+from bandwidth.json_stream import check_streaming_supported, iter_json_items
 from bandwidth.version import __version__ as version
 
 from .api_exception_module import BandwidthMessageAPIException
 
 quote = urllib.parse.quote if six.PY3 else urllib.quote
-lazy_map = map if six.PY3 else itertools.imap
 
 
 class Client:
@@ -32,6 +38,41 @@ class Client:
         :param api_endpoint: catapult api endpoint (optional, default value is https://api.catapult.inetwork.com)
         :type api_version: str
         :param api_version: catapult api version (optional, default value is v1)
+        :type transport: bandwidth.transport.Transport
+        :param transport: pooled transport to share with other clients (optional)
+        :type pool_connections: int
+        :param pool_connections: number of host connection pools (optional, default value is 10)
+        :type pool_maxsize: int
+        :param pool_maxsize: max number of connections per host (optional, default value is 10)
+        :type keep_alive: bool
+        :param keep_alive: reuse connections between requests (optional, default value is True)
+        :type retry: bandwidth.retry.RetryPolicy
+        :param retry: policy of retrying of failed requests (optional, requests are not retried by default)
+        :type rate_limiter: bandwidth.rate_limiter.RateLimiter
+        :param rate_limiter: limiter of rate of requests (optional, requests are not limited by default)
+        :type prefetch_pages: int
+        :param prefetch_pages: number of next pages of lists to request in background while current page
+            is being consumed (optional, default value is 0 - prefetching is disabled)
+        :type stream_pages: bool
+        :param stream_pages: parse items of list pages incrementally while they are being consumed
+            instead of loading whole page in memory (optional, default value is False, requires ijson)
+        :type key_style: str
+        :param key_style: style of keys of returned objects: 'snake' - keys are converted to snake_case,
+            'lazy_snake' - keys are converted to snake_case when they are read, 'raw' - objects are returned
+            as they have been parsed from json (optional, default value is 'snake')
+        :type conditional_get: bool
+        :param conditional_get: cache single resources (like calls or messages, not lists) returned
+            by GET requests with ETag or Last-Modified headers and revalidate them by conditional requests,
+            unchanged results are served from the cache (optional, default value is False). Results served
+            from the cache are shared and should not be modified. Statistics are available in field
+            ``conditional_cache``
+        :type conditional_get_max_size: int
+        :param conditional_get_max_size: max number of results cached for conditional requests
+            (optional, default value is 1000)
+        :type metrics: types.FunctionType
+        :param metrics: sink of metrics of requests, function which takes :class:`bandwidth.metrics.RequestMetrics`
+            after each request (optional, metrics are not collected by default).
+            See :class:`bandwidth.metrics.MetricsRecorder`
 
         :rtype: bandwidth.catapult.Client
         :returns: bandwidth client
@@ -50,6 +91,54 @@ class Client:
             'api_endpoint', 'https://api.catapult.inetwork.com')
         self.api_version = other_options.get('api_version', 'v1')
         self.auth = (api_token, api_secret)
+        self.transport, self._owns_transport = get_transport(other_options)
+        self.prefetch_pages = other_options.get('prefetch_pages', 0)
+        self.stream_pages = other_options.get('stream_pages', False)
+        if self.stream_pages:
+            check_streaming_supported()
+        self.key_style = check_key_style(other_options.get('key_style', 'snake'))
+        self.conditional_cache = None
+        if other_options.get('conditional_get'):
+            self.conditional_cache = ConditionalCache(other_options.get('conditional_get_max_size', 1000))
+        self.metrics = other_options.get('metrics')
+
+    def close(self):
+        """
+        Close pooled connections of the client (a shared transport passed to the client is left open)
+
+        Example::
+
+            with bandwidth.client('voice', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET') as api:
+                api.get_call('c-abc123')
+        """
+        if self._owns_transport:
+            self.transport.close()
+
+    def with_key_style(self, key_style):
+        """
+        Returns a copy of the client (sharing its transport) which returns objects with another style of keys
+
+        :type key_style: str
+        :param key_style: 'snake', 'lazy_snake' or 'raw'
+
+        :rtype: same type as the client
+        :returns: client copy
+
+        Example: Fetch messages with original camelCase keys::
+
+            for message in api.with_key_style('raw').list_messages():
+                print(message['deliveryState'])
+        """
+        client = copy.copy(self)
+        client.key_style = check_key_style(key_style)
+        client._owns_transport = False
+        return client
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     def _request(self, method, url, *args, **kwargs):
         user_agent = 'PythonSDK_' + version
@@ -63,7 +152,7 @@ class Client:
         if url.startswith('/'):
             # relative url
             url = '%s/%s%s' % (self.api_endpoint, self.api_version, url)
-        return requests.request(method, url, auth=self.auth, headers=headers, *args, **kwargs)
+        return self.transport.request(method, url, auth=self.auth, headers=headers, *args, **kwargs)
 
     def _check_response(self, response):
         if response.status_code >= 400:
@@ -77,13 +166,40 @@ class Client:
                     response.status_code, response.content.decode('utf-8')[:79])
 
     def _make_request(self, method, url, *args, **kwargs):
-        response = self._request(method, url, *args, **kwargs)
+        metrics = start_request_metrics(self, method, url)
+        try:
+            if self.conditional_cache is not None and method == 'get':
+                key = self.conditional_cache.get_key(self.key_style, url, kwargs)
+                entry = self.conditional_cache.prepare(key, kwargs)
+                response = self._request(method, url, *args, **kwargs)
+                set_response_metrics(metrics, response)
+                return self.conditional_cache.resolve(key, entry, response,
+                                                      lambda response: self._parse_response(response, metrics))
+            response = self._request(method, url, *args, **kwargs)
+            set_response_metrics(metrics, response)
+            return self._parse_response(response, metrics)
+        finally:
+            finish_request_metrics(self, metrics)
+
+    def _make_page_request(self, method, url, *args, **kwargs):
+        if not self.stream_pages:
+            return self._make_request(method, url, *args, **kwargs)
+        metrics = start_request_metrics(self, method, url)
+        try:
+            response = self._request(method, url, stream=True, *args, **kwargs)
+            set_response_metrics(metrics, response, stream=True)
+            self._check_response(response)
+        finally:
+            finish_request_metrics(self, metrics)
+        return (iter_json_items(response, self.key_style), response, None)
+
+    def _parse_response(self, response, metrics=None):
         self._check_response(response)
         data = None
         id = None
         if response.headers.get('content-type') is not None and \
                 response.headers.get('content-type').startswith("application/json"):
-            data = convert_object_to_snake_case(response.json())
+            data = parse_json(response, self.key_style, metrics)
         location = response.headers.get('location')
         if location is not None:
             id = location.split('/')[-1]
@@ -99,6 +215,7 @@ class Client:
                       delivery_state=None,
                       sort_order=None,
                       size=None,
+                      cursor=None,
                       **kwargs):
         """
         Get a list of user's messages
@@ -120,7 +237,8 @@ class Client:
         :param str sort_order: How to sort the messages. Values are 'asc' or 'desc'
         :param str size: Used for pagination to indicate the size of each page requested for querying a list
             of items. If no value is specified the default value is 25. (Maximum value 1000)
-        :rtype: types.GeneratorType
+        :param dict cursor: position to resume the list from (field ``cursor`` of previously returned list)
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of messages
 
         Example: Search for all messages and are in error::
@@ -147,7 +265,46 @@ class Client:
         kwargs['size'] = size
 
         path = '/users/%s/messages' % self.user_id
-        return get_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path, params=kwargs), cursor)
+
+    def list_messages_sharded(self, from_date_time, to_date_time, shards=4, concurrency=None, ordered=True,
+                              sort_order='asc', **kwargs):
+        """
+        Get a list of user's messages of a time range by walking its sub-ranges at the same time
+
+        :param str from_date_time: The starting date time to filter the messages
+            (string in yyyy-MM-dd hh:mm:ss format or datetime, required)
+        :param str to_date_time: The ending date time to filter the messages
+            (string in yyyy-MM-dd hh:mm:ss format or datetime, required)
+        :param int shards: number of sub-ranges to split the time range to (optional, default value is 4)
+        :param int concurrency: number of sub-ranges walked at once (optional, default value is number of shards)
+        :param bool ordered: return messages in sort order (messages of next sub-ranges are buffered while
+            previous ones are being consumed) or in order of receiving (optional, default value is True)
+        :param str sort_order: How to sort the messages. Values are 'asc' or 'desc' (optional, default value is 'asc')
+        :param kwargs: other filters of ``list_messages()`` (like ``direction`` or ``size``) and ``max_items``
+            (max total number of messages)
+        :rtype: types.GeneratorType
+        :returns: list of messages (messages at boundaries of sub-ranges are returned once)
+
+        Example: Export messages of a month with 8 workers::
+
+            messages = api.list_messages_sharded('2017-01-01 00:00:00', '2017-01-31 23:59:59',
+                                                 shards=8, size=1000)
+            for message in messages:
+                print(message['id'])
+        """
+        # max_items limits all messages, it is not a filter of list_messages()
+        max_items = kwargs.pop('max_items', None)
+        ranges = split_time_range(from_date_time, to_date_time, shards)
+        if sort_order == 'desc':
+            ranges.reverse()
+
+        def list_shard(start, end):
+            return self.list_messages(from_date_time=start.strftime(MESSAGES_TIME_FORMAT),
+                                      to_date_time=end.strftime(MESSAGES_TIME_FORMAT),
+                                      sort_order=sort_order, **kwargs)
+        return list_sharded(list_shard, ranges, concurrency, ordered, max_items=max_items,
+                            get_unique_id=get_boundary_item_id(ranges))
 
     def send_message(self, from_, to,
                      text=None,
@@ -259,6 +416,56 @@ class Client:
             item['message'] = messages_data[i]
         return results
 
+    def send_messages_bulk(self, messages, chunk_size=100, concurrency=4):
+        """
+        Send a large number of messages by batches in parallel
+
+        Messages are read from iterable on demand, so only ``chunk_size * concurrency`` messages
+        are kept in memory at once.
+
+        :type messages: collections.Iterable
+        :param messages: messages to send (in format of ``send_messages()``), can be a generator
+        :type chunk_size: int
+        :param chunk_size: number of messages to send by one request (optional, default value is 100)
+        :type concurrency: int
+        :param concurrency: number of requests to send in parallel (optional, default value is 4)
+
+        :rtype: types.GeneratorType
+        :returns: results of sent messages in order of input messages. Each result contains
+            'id' of sent message, 'message' data and 'error' (None, error data of the message or
+            exception raised by request of whole batch)
+
+        Example: Send campaign messages::
+
+            def campaign():
+                for number in numbers:
+                    yield {'from': '+1234567980', 'to': number, 'text': 'Hello'}
+
+            for result in api.send_messages_bulk(campaign(), chunk_size=100, concurrency=8):
+                if result['error'] is not None:
+                    print(result['message']['to'], result['error'])
+        """
+        items = iter(messages)
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        pending = collections.deque()
+        try:
+            while True:
+                chunk = list(itertools.islice(items, chunk_size))
+                if len(chunk) > 0:
+                    pending.append((chunk, executor.submit(self.send_messages, chunk)))
+                if len(pending) == 0:
+                    break
+                if len(chunk) > 0 and len(pending) < concurrency:
+                    continue
+                chunk, future = pending.popleft()
+                for result in _get_bulk_results(chunk, future):
+                    yield result
+        finally:
+            # batches which have not been sent yet are not sent after the generator is closed
+            for chunk, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
     def get_message(self, id):
         """
         Get information about a message
@@ -289,3 +496,15 @@ class Client:
             ## }
         """
         return self._make_request('get', '/users/%s/messages/%s' % (self.user_id, id))[0]
+
+
+def _get_bulk_results(chunk, future):
+    try:
+        results = future.result()
+    except Exception as e:
+        return [{'id': None, 'message': message, 'error': e} for message in chunk]
+    for item in results:
+        item['error'] = item.get('error')
+        if item['id'] == '':
+            item['id'] = None
+    return results
@@ -0,0 +1,71 @@
+"""
+Events of messaging callbacks
+
+:Example:
+
+    from bandwidth.messaging.events import parse_event
+
+    event = parse_event(request_body)
+    if event.direction == 'in':
+        print(event.from_, event.text)
+"""
+from bandwidth import events
+from bandwidth.events import Event, Field
+
+
+class MessageEvent(Event):
+
+    """
+    Base class of events of a message
+    """
+
+    __slots__ = ()
+
+    direction = Field('direction')
+    from_ = Field('from')
+    to = Field('to')
+    message_id = Field('messageId')
+    message_uri = Field('messageUri')
+    text = Field('text')
+    application_id = Field('applicationId')
+    state = Field('state')
+    delivery_state = Field('deliveryState')
+    delivery_code = Field('deliveryCode', int)
+    delivery_description = Field('deliveryDescription')
+
+
+class SmsEvent(MessageEvent):
+    __slots__ = ()
+    EVENT_TYPE = 'sms'
+
+
+class MmsEvent(MessageEvent):
+    __slots__ = ()
+    EVENT_TYPE = 'mms'
+
+    media = Field('media')
+
+
+EVENT_CLASSES = events.get_event_classes(SmsEvent, MmsEvent)
+
+
+def parse_event(body):
+    """
+    Parses body of messaging callback to an event
+
+    :type body: str or bytes or dict
+    :param body: JSON text of callback or decoded JSON
+
+    :rtype: bandwidth.events.Event
+    :returns: event of class by its event type (base class Event for unknown event types)
+    """
+    return events.parse_event(body, EVENT_CLASSES)
+
+
+class EventDispatcher(events.EventDispatcher):
+
+    """
+    Calls handlers of messaging callback events by their event types
+    """
+
+    event_classes = EVENT_CLASSES
@@ -0,0 +1,178 @@
+import threading
+import time
+from bandwidth.convert_camel import convert_object_to_key_style
+
+_timer = getattr(time, 'perf_counter', time.time)
+
+# segments of api paths which are not ids
+STATIC_SEGMENTS = frozenset([
+    'account', 'applications', 'audio', 'availableNumbers', 'bridges', 'calls', 'conferences', 'domains', 'dtmf',
+    'endpoints', 'errors', 'events', 'gather', 'local', 'media', 'members', 'messages', 'numberInfo',
+    'phoneNumbers', 'recordings', 'tokens', 'tollFree', 'transactions', 'transcriptions', 'users'
+])
+
+
+def get_endpoint_template(url, api_version='v1'):
+    """
+    Returns path of api url with ids replaced by ``{id}`` (like ``/users/{id}/calls/{id}``)
+    """
+    path = url.split('?', 1)[0]
+    if '://' in path:
+        path = '/' + path.split('://', 1)[1].partition('/')[2]
+    prefix = '/' + api_version + '/'
+    if path.startswith(prefix):
+        path = path[len(prefix) - 1:]
+    return '/'.join(segment if not segment or segment in STATIC_SEGMENTS else '{id}'
+                    for segment in path.split('/'))
+
+
+class RequestMetrics(object):
+
+    """
+    Metrics of one api request. Times are in seconds, decode and conversion times are None if response
+    has no JSON body or it is parsed lazily (stream of list page).
+
+    ``network_time`` is time of the attempt which returned the response (sending of request and receiving
+    of response, only its headers for streamed responses). ``wait_time`` is the rest of time of getting
+    the response: waiting for rate limiter, failed attempts and delays between retries. It is None
+    if the transport doesn't measure attempts, then ``network_time`` includes it.
+    """
+
+    __slots__ = ('method', 'endpoint', 'status', 'network_time', 'wait_time', 'decode_time', 'conversion_time',
+                 'payload_size', '_started')
+
+    def __init__(self, method, endpoint):
+        self.method = method
+        self.endpoint = endpoint
+        self.status = None
+        self.network_time = None
+        self.wait_time = None
+        self.decode_time = None
+        self.conversion_time = None
+        self.payload_size = None
+        self._started = _timer()
+
+    def set_response(self, response, stream=False):
+        """
+        Stores status, network and wait times (and size of read body)
+        """
+        elapsed = _timer() - self._started
+        # time of the attempt is measured by transport
+        network_time = getattr(response, 'network_time', None)
+        if network_time is None:
+            self.network_time = elapsed
+        else:
+            self.network_time = network_time
+            self.wait_time = max(0, elapsed - network_time)
+        self.status = response.status_code
+        if stream:
+            length = response.headers.get('content-length')
+            self.payload_size = int(length) if length is not None else None
+        else:
+            self.payload_size = len(response.content or b'')
+
+    def to_dict(self):
+        """
+        Returns metrics as a dictionary
+        """
+        return dict((name, getattr(self, name)) for name in self.__slots__ if not name.startswith('_'))
+
+    def __repr__(self):
+        return 'RequestMetrics(%r)' % self.to_dict()
+
+
+def start_request_metrics(client, method, url):
+    """
+    Returns metrics of a new request of the client or None if the client has no metrics sink
+    """
+    if client.metrics is None:
+        return None
+    return RequestMetrics(method, get_endpoint_template(url, client.api_version))
+
+
+def set_response_metrics(metrics, response, stream=False):
+    """
+    Stores status, network time and payload size of response to metrics (if they are collected)
+    """
+    if metrics is not None:
+        metrics.set_response(response, stream)
+
+
+def finish_request_metrics(client, metrics):
+    """
+    Passes metrics of finished (or failed) request to metrics sink of the client
+    """
+    if metrics is None:
+        return
+    if metrics.network_time is None:
+        # the request has failed without response
+        metrics.network_time = _timer() - metrics._started
+    client.metrics(metrics)
+
+
+def parse_json(response, key_style, metrics=None):
+    """
+    Decodes JSON body of response and converts it to key style measuring time of both steps
+    """
+    if metrics is None:
+        return convert_object_to_key_style(response.json(), key_style)
+    started = _timer()
+    data = response.json()
+    decoded = _timer()
+    data = convert_object_to_key_style(data, key_style)
+    metrics.decode_time = decoded - started
+    metrics.conversion_time = _timer() - decoded
+    return data
+
+
+class MetricsRecorder(object):
+
+    """
+    Metrics sink which aggregates metrics of requests by method and endpoint template
+
+    :Example:
+
+        recorder = MetricsRecorder()
+        api = bandwidth.client('voice', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET', metrics=recorder)
+        ...
+        for (method, endpoint), stats in recorder.stats().items():
+            print(method, endpoint, stats['count'], stats['network_time'] / stats['count'])
+    """
+
+    _FIELDS = ('network_time', 'wait_time', 'decode_time', 'conversion_time', 'payload_size')
+
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, metrics):
+        key = (metrics.method, metrics.endpoint)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = {'count': 0, 'errors': 0}
+                stats.update((name, 0) for name in self._FIELDS)
+            stats['count'] += 1
+            if metrics.status is None or metrics.status >= 400:
+                stats['errors'] += 1
+            for name in self._FIELDS:
+                stats[name] += getattr(metrics, name) or 0
+
+    def stats(self):
+        """
+        Returns aggregated metrics
+
+        :rtype: dict
+        :returns: dictionary with keys (method, endpoint template) and values with number of requests ('count'),
+            failed requests ('errors') and totals of 'network_time', 'wait_time', 'decode_time',
+            'conversion_time' and 'payload_size'
+        """
+        with self._lock:
+            return dict((key, dict(stats)) for key, stats in self._stats.items())
+
+    def clear(self):
+        """
+        Removes all aggregated metrics
+        """
+        with self._lock:
+            self._stats.clear()
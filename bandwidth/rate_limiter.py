@@ -0,0 +1,116 @@
+import re
+import threading
+import time
+
+_monotonic = getattr(time, 'monotonic', time.time)
+_USER_PATH_RE = re.compile(r'/users/([^/?]+)(?:/([^/?]+))?')
+
+
+class TokenBucket(object):
+
+    """
+    Thread safe token bucket
+    """
+
+    def __init__(self, rate, capacity=1):
+        """
+        Initialize the bucket.
+        :type rate: float
+        :param rate: number of tokens added per second
+        :type capacity: int
+        :param capacity: max number of tokens in bucket (size of burst)
+        """
+        self.rate = float(rate)
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = _monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Takes a token from the bucket
+
+        :rtype: float
+        :returns: delay in seconds before the token can be used
+        """
+        with self._lock:
+            now = _monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0
+            return -self.tokens / self.rate
+
+
+class RateLimiter(object):
+
+    """
+    Client side rate limiter with separate token buckets for messages, calls and other requests of each account
+    """
+
+    def __init__(self, messages_rps=None, calls_rps=None, default_rps=None, burst=1):
+        """
+        Initialize the rate limiter.
+        :type messages_rps: float
+        :param messages_rps: max rate of requests to messages (optional, not limited by default)
+        :type calls_rps: float
+        :param calls_rps: max rate of requests to calls (optional, not limited by default)
+        :type default_rps: float
+        :param default_rps: max rate of other requests (optional, not limited by default)
+        :type burst: int
+        :param burst: number of requests which can be sent at once after idle time (optional, default value is 1)
+
+        :rtype: bandwidth.rate_limiter.RateLimiter
+        :returns: rate limiter
+
+        Send at most 10 messages per second from all threads using the client::
+
+            api = bandwidth.client('messaging', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET',
+                                   rate_limiter=bandwidth.RateLimiter(messages_rps=10))
+        """
+        self.rates = {
+            'messages': messages_rps,
+            'calls': calls_rps,
+            'default': default_rps
+        }
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def get_bucket_key(self, url):
+        """
+        Returns account id and endpoint family ('messages', 'calls' or 'default') of request url
+        """
+        match = _USER_PATH_RE.search(url)
+        if match is None:
+            return None, 'default'
+        family = match.group(2)
+        return match.group(1), family if family in ('messages', 'calls') else 'default'
+
+    def reserve(self, method, url):
+        """
+        Takes a token for the request
+
+        :rtype: float
+        :returns: delay in seconds before the request can be sent
+        """
+        key = self.get_bucket_key(url)
+        rate = self.rates[key[1]]
+        if not rate:
+            return 0
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._buckets[key] = TokenBucket(rate, self.burst)
+        return bucket.reserve()
+
+    def acquire(self, method, url):
+        """
+        Waits until the request can be sent
+        """
+        delay = self.reserve(method, url)
+        if delay > 0:
+            time.sleep(delay)
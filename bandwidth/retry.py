@@ -0,0 +1,114 @@
+import random
+import time
+from email.utils import parsedate_tz, mktime_tz
+
+IDEMPOTENT_METHODS = ('get', 'head', 'options', 'put', 'delete')
+
+
+class RetryPolicy(object):
+
+    """
+    Policy of retrying of failed requests with exponential backoff
+    """
+
+    def __init__(self,
+                 max_attempts=3,
+                 backoff_factor=0.5,
+                 max_backoff=30,
+                 max_retry_after=60,
+                 retry_statuses=(429, 500, 502, 503, 504),
+                 retry_non_idempotent=False,
+                 jitter=True):
+        """
+        Initialize the retry policy.
+        :type max_attempts: int
+        :param max_attempts: max number of attempts of a request including first one
+            (optional, default value is 3)
+        :type backoff_factor: float
+        :param backoff_factor: delay before second attempt in seconds, each next delay is doubled
+            (optional, default value is 0.5)
+        :type max_backoff: float
+        :param max_backoff: max delay between attempts in seconds (optional, default value is 30)
+        :type max_retry_after: float
+        :param max_retry_after: max delay requested by header Retry-After which will be honored.
+            Requests with longer delays are not retried (optional, default value is 60)
+        :type retry_statuses: tuple
+        :param retry_statuses: http statuses to retry (optional, default value is (429, 500, 502, 503, 504))
+        :type retry_non_idempotent: bool
+        :param retry_non_idempotent: retry POST requests too (like create_call() or send_message()).
+            They may be executed twice if the server has handled the first attempt (optional, default value is False)
+        :type jitter: bool
+        :param jitter: use random delay between zero and computed backoff (optional, default value is True)
+
+        :rtype: bandwidth.retry.RetryPolicy
+        :returns: retry policy
+
+        Retry failed requests of a client::
+
+            api = bandwidth.client('voice', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET',
+                                   retry=bandwidth.RetryPolicy(max_attempts=5))
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = retry_statuses
+        self.retry_non_idempotent = retry_non_idempotent
+        self.jitter = jitter
+
+    def is_retryable_method(self, method):
+        return self.retry_non_idempotent or method.lower() in IDEMPOTENT_METHODS
+
+    def get_backoff(self, attempt):
+        """
+        Returns delay in seconds before next attempt
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        return backoff
+
+    def get_delay(self, method, attempt, response=None, error=None):
+        """
+        Returns delay in seconds before next attempt of failed request or None if request should not be retried
+
+        :type method: str
+        :param method: http method of request
+        :type attempt: int
+        :param attempt: number of finished attempt (starting from 1)
+        :type response: requests.Response
+        :param response: response of finished attempt
+        :type error: Exception
+        :param error: connection error of finished attempt
+
+        :rtype: float
+        :returns: delay or None
+        """
+        if attempt >= self.max_attempts or not self.is_retryable_method(method):
+            return None
+        if error is not None:
+            return self.get_backoff(attempt)
+        if response is None or response.status_code not in self.retry_statuses:
+            return None
+        retry_after = get_retry_after(response)
+        if retry_after is None:
+            return self.get_backoff(attempt)
+        if retry_after > self.max_retry_after:
+            return None
+        return retry_after
+
+
+def get_retry_after(response):
+    """
+    Returns delay in seconds requested by header Retry-After (number of seconds or http date) or None
+    """
+    value = response.headers.get('retry-after')
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    date = parsedate_tz(value)
+    if date is None:
+        return None
+    return max(0.0, mktime_tz(date) - time.time())
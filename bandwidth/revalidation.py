@@ -0,0 +1,108 @@
+import threading
+from bandwidth.cache import TTLCache
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # pragma: no cover
+    from collections import Mapping
+
+
+class ConditionalCache(object):
+
+    """
+    Cache of results of GET requests which are revalidated by conditional requests
+    (with headers If-None-Match and If-Modified-Since) when the server sends ETag or Last-Modified
+
+    Only single resources (JSON objects like a call or a message) are cached, lists (like pages of list
+    methods) are never cached. Cached results are returned as is without copying, they are shared
+    by all requests of the resource and should not be modified.
+    """
+
+    def __init__(self, max_size=1000):
+        """
+        Initialize the cache.
+        :type max_size: int
+        :param max_size: max number of cached results, least recently used results are evicted
+            (optional, default value is 1000)
+        """
+        self.requests = 0
+        self.revalidations = 0
+        self.not_modified = 0
+        self._entries = TTLCache(float('inf'), max_size)
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self):
+        """
+        Part of conditional requests which have been served from the cache (0 if there were no such requests)
+        """
+        return float(self.not_modified) / self.revalidations if self.revalidations else 0.0
+
+    def stats(self):
+        """
+        Returns counters of the cache
+
+        :rtype: dict
+        :returns: number of GET requests ('requests'), conditional requests ('revalidations'),
+            requests served from the cache ('not_modified') and 'hit_rate'
+        """
+        return {
+            'requests': self.requests,
+            'revalidations': self.revalidations,
+            'not_modified': self.not_modified,
+            'hit_rate': self.hit_rate
+        }
+
+    def get_key(self, key_style, url, kwargs):
+        params = kwargs.get('params')
+        return key_style, url, repr(sorted(params.items())) if params else None
+
+    def prepare(self, key, kwargs):
+        """
+        Adds validators of cached result to request options
+
+        :rtype: tuple
+        :returns: cached entry or None
+        """
+        entry = self._entries.get(key)
+        with self._lock:
+            self.requests += 1
+            if entry is not None:
+                self.revalidations += 1
+        if entry is None:
+            return None
+        headers = dict(kwargs.get('headers') or {})
+        etag, last_modified = entry[0], entry[1]
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        kwargs['headers'] = headers
+        return entry
+
+    def resolve(self, key, entry, response, parse_response):
+        """
+        Returns cached result for response 304 or parses and caches response with validators
+        (if it is a single resource)
+
+        :rtype: tuple
+        :returns: parsed data, response and id of location
+        """
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                self.not_modified += 1
+            return entry[2], response, entry[3]
+        data, response, id = parse_response(response)
+        etag = response.headers.get('etag')
+        last_modified = response.headers.get('last-modified')
+        if response.status_code == 200 and (etag or last_modified) and isinstance(data, Mapping):
+            self._entries.set(key, (etag, last_modified, data, id))
+        elif entry is not None:
+            self._entries.invalidate(key)
+        return data, response, id
+
+    def clear(self):
+        """
+        Removes all cached results
+        """
+        self._entries.clear()
@@ -0,0 +1,193 @@
+import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dateutil import parser, tz
+from six.moves import queue
+
+MESSAGES_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+TRANSACTIONS_TIME_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+ITEM_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+
+def parse_time(value):
+    """
+    Converts string or datetime to naive datetime in UTC
+    """
+    if not isinstance(value, datetime.datetime):
+        value = parser.parse(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(tz.tzutc()).replace(tzinfo=None)
+    return value.replace(microsecond=0)
+
+
+def split_time_range(from_time, to_time, shards):
+    """
+    Splits time range to adjacent sub-ranges of equal length (with precision of one second)
+
+    End of each sub-range is start of the next one, so no time between sub-ranges is skipped whether
+    the api treats end of a range as inclusive or exclusive. Items at boundaries can be returned
+    by both adjacent sub-ranges (see :func:`get_boundary_item_id`).
+
+    :type from_time: str or datetime.datetime
+    :param from_time: start of the range
+    :type to_time: str or datetime.datetime
+    :param to_time: end of the range
+    :type shards: int
+    :param shards: max number of sub-ranges
+
+    :rtype: list
+    :returns: list of tuples with start and end of each sub-range in ascending order
+    """
+    if from_time is None or to_time is None:
+        raise ValueError('Both bounds of time range are required for sharded listing')
+    start = parse_time(from_time)
+    end = parse_time(to_time)
+    if end < start:
+        raise ValueError('End of time range is before its start')
+    seconds = int((end - start).total_seconds())
+    step = datetime.timedelta(seconds=max(1, -(-seconds // max(1, shards))))
+    ranges = []
+    while True:
+        range_end = min(start + step, end)
+        ranges.append((start, range_end))
+        if range_end >= end:
+            return ranges
+        start = range_end
+
+
+def get_boundary_item_id(ranges, time_key='time', id_key='id'):
+    """
+    Returns function which returns id of an item which can be listed by two adjacent sub-ranges
+    (time of the item is in a second of their common boundary) or None for other items
+
+    :type ranges: list
+    :param ranges: sub-ranges returned by :func:`split_time_range` (in any order)
+
+    :rtype: types.FunctionType
+    :returns: function which takes item
+    """
+    times = [time for time_range in ranges for time in time_range]
+    boundaries = frozenset(time.strftime(ITEM_TIME_FORMAT) for time in set(times) - {min(times), max(times)})
+
+    def get_id(item):
+        time = item.get(time_key)
+        if time is None:
+            return item.get(id_key)
+        if isinstance(time, datetime.datetime):
+            time = parse_time(time).strftime(ITEM_TIME_FORMAT)
+        # times of items are in UTC like '2017-01-01T00:00:00Z' or '2017-01-01T00:00:00.123Z'
+        return item.get(id_key) if time[:19] in boundaries else None
+    return get_id
+
+
+class _ItemFilter(object):
+
+    """
+    Drops items which have been returned by other sub-range and limits total number of items
+    """
+
+    def __init__(self, max_items=None, get_unique_id=None):
+        self.remaining = max_items
+        self.get_unique_id = get_unique_id
+        self.ids = set()
+
+    def is_done(self):
+        return self.remaining is not None and self.remaining <= 0
+
+    def accept(self, item):
+        if self.get_unique_id is not None:
+            id = self.get_unique_id(item)
+            if id is not None:
+                if id in self.ids:
+                    return False
+                self.ids.add(id)
+        if self.remaining is not None:
+            self.remaining -= 1
+        return True
+
+
+class _ShardError(object):
+
+    def __init__(self, error):
+        self.error = error
+
+
+_SHARD_END = object()
+
+
+def list_sharded(list_shard, ranges, concurrency=None, ordered=True, buffer_size=10000, max_items=None,
+                 get_unique_id=None):
+    """
+    Walks lists of several time ranges at the same time on a thread pool
+
+    :type list_shard: types.FunctionType
+    :param list_shard: function which returns lazy list of items of a time range (takes its start and end)
+    :type ranges: list
+    :param ranges: time ranges in order of output
+    :type concurrency: int
+    :param concurrency: number of lists walked at once (optional, all lists are walked at once by default)
+    :type ordered: bool
+    :param ordered: return items of ranges in order of ranges (items of next ranges are buffered while
+        previous ranges are being consumed) or in order of receiving (optional, default value is True)
+    :type buffer_size: int
+    :param buffer_size: max number of received items waiting to be consumed per range
+        (optional, default value is 10000)
+    :type max_items: int
+    :param max_items: max total number of returned items (optional, all items are returned by default)
+    :type get_unique_id: types.FunctionType
+    :param get_unique_id: function which returns id of an item which can be returned by several ranges
+        or None for other items, items with already returned ids are dropped (optional)
+
+    :rtype: types.GeneratorType
+    :returns: items of all ranges
+    """
+    ranges = list(ranges)
+    stopped = threading.Event()
+    if ordered:
+        queues = [queue.Queue(maxsize=buffer_size) for _ in ranges]
+    else:
+        queues = [queue.Queue(maxsize=buffer_size)] * len(ranges)
+
+    def put(q, value):
+        while not stopped.is_set():
+            try:
+                q.put(value, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def walk(index):
+        q = queues[index]
+        try:
+            for item in list_shard(*ranges[index]):
+                if stopped.is_set():
+                    return
+                put(q, item)
+            put(q, _SHARD_END)
+        except Exception as e:
+            put(q, _ShardError(e))
+
+    items = _ItemFilter(max_items, get_unique_id)
+    if items.is_done():
+        return
+    executor = ThreadPoolExecutor(max_workers=concurrency or max(1, len(ranges)))
+    futures = []
+    try:
+        futures = [executor.submit(walk, index) for index in range(len(ranges))]
+        # in unordered mode all ranges share one queue, so it is read until all ranges have ended
+        for q in (queues if ordered else queues[:1] * len(ranges)):
+            while True:
+                item = q.get()
+                if item is _SHARD_END:
+                    break
+                if isinstance(item, _ShardError):
+                    raise item.error
+                if items.accept(item):
+                    yield item
+                    if items.is_done():
+                        return
+    finally:
+        stopped.set()
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
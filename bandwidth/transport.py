@@ -0,0 +1,129 @@
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from bandwidth.metrics import _timer
+
+RETRYABLE_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+
+class Transport(object):
+
+    """
+    Pooled HTTP transport which can be shared by voice, messaging and account clients
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, keep_alive=True, pool_block=False, retry=None,
+                 rate_limiter=None):
+        """
+        Initialize the transport.
+        :type pool_connections: int
+        :param pool_connections: number of host connection pools to keep (optional, default value is 10)
+        :type pool_maxsize: int
+        :param pool_maxsize: max number of connections to keep per host (optional, default value is 10)
+        :type keep_alive: bool
+        :param keep_alive: reuse connections between requests (optional, default value is True)
+        :type pool_block: bool
+        :param pool_block: wait for a free connection instead of opening a new one
+            when the pool is full (optional, default value is False)
+        :type retry: bandwidth.retry.RetryPolicy
+        :param retry: policy of retrying of failed requests (optional, requests are not retried by default)
+        :type rate_limiter: bandwidth.rate_limiter.RateLimiter
+        :param rate_limiter: limiter of rate of requests (optional, requests are not limited by default)
+
+        :rtype: bandwidth.transport.Transport
+        :returns: transport
+
+        Share one connection pool between clients::
+
+            transport = bandwidth.Transport(pool_maxsize=50)
+            voice_api = bandwidth.client('voice', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET',
+                                         transport=transport)
+            account_api = bandwidth.client('account', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET',
+                                           transport=transport)
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+
+    def request(self, method, url, *args, **kwargs):
+        """
+        Make a http request over pooled connections (and retry it according to retry policy)
+
+        Attribute ``network_time`` of returned response is time of the attempt in seconds, without waiting
+        for rate limiter and previous attempts.
+        """
+        retry = self.retry
+        if retry is None or is_stream(kwargs.get('data')):
+            return self._send(method, url, *args, **kwargs)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = self._send(method, url, *args, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                delay = retry.get_delay(method, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = retry.get_delay(method, attempt, response=response)
+                if delay is None:
+                    return response
+                if kwargs.get('stream'):
+                    response.close()
+            time.sleep(delay)
+
+    def _send(self, method, url, *args, **kwargs):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method, url)
+        started = _timer()
+        response = self.session.request(method, url, *args, **kwargs)
+        response.network_time = _timer() - started
+        return response
+
+    def close(self):
+        """
+        Close all pooled connections
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def get_transport(options):
+    """
+    Returns transport passed to client options or creates new one from pool options
+
+    :type options: dict
+    :param options: client options
+
+    :rtype: (bandwidth.transport.Transport, bool)
+    :returns: transport and flag which is True if transport has been created for the client
+    """
+    transport = options.get('transport')
+    if transport is not None:
+        return transport, False
+    return Transport(pool_connections=options.get('pool_connections', 10),
+                     pool_maxsize=options.get('pool_maxsize', 10),
+                     keep_alive=options.get('keep_alive', True),
+                     pool_block=options.get('pool_block', False),
+                     retry=options.get('retry'),
+                     rate_limiter=options.get('rate_limiter')), True
+
+
+def is_stream(data):
+    """
+    Returns True if request body is a stream which can't be sent again
+    """
+    return hasattr(data, 'read')
@@ -0,0 +1,582 @@
+import asyncio
+import inspect
+from bandwidth.async_transport import AsyncClientMixin
+from bandwidth.metrics import _timer
+from bandwidth.async_batch import AsyncBatch, async_map_concurrently
+from bandwidth.voice.async_lazy_enumerable import get_async_lazy_enumerator, async_lazy_map
+
+from .client_module import Client, _set_media_name, _get_member_outcome
+
+
+async def _measure_step(timings, name, awaitable):
+    started = _timer()
+    try:
+        return await awaitable
+    finally:
+        timings[name] = _timer() - started
+
+
+async def _prepare_audio(audio):
+    audio_kwargs = audio()
+    if inspect.isawaitable(audio_kwargs):
+        audio_kwargs = await audio_kwargs
+    return audio_kwargs
+
+
+async def _hangup_calls(client, call_ids):
+    await asyncio.gather(*[client.hangup_call(call_id) for call_id in call_ids], return_exceptions=True)
+
+
+async def _release_bridge(client, bridge_id):
+    try:
+        await client.update_bridge(bridge_id, call_ids=[])
+    except Exception:
+        pass
+
+
+async def _select_members(members, predicate=None):
+    async for member in members:
+        if member.get('state') == 'active' and (predicate is None or predicate(member)):
+            yield member['id']
+
+
+class AsyncClient(AsyncClientMixin, Client):
+
+    """
+    Catapult client with coroutine methods (requires aiohttp)
+
+    Methods which return lists are async iterators. Helper methods like ``answer_call()``
+    or ``speak_sentence_to_call()`` are inherited from :class:`bandwidth.voice.Client`
+    and return awaitable results of the coroutines below.
+    """
+
+    def __init__(self, user_id=None, api_token=None, api_secret=None, **other_options):
+        """
+        Initialize the async catapult client. Takes the same arguments as :class:`bandwidth.voice.Client`
+        (option ``transport`` should be an instance of :class:`bandwidth.async_transport.AsyncTransport`).
+
+        Init the async client::
+
+            api = bandwidth.voice.async_client_module.AsyncClient('YOUR_USER_ID', 'YOUR_API_TOKEN',
+                                                                  'YOUR_API_SECRET')
+            # or
+            api = bandwidth.client('voice', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET', mode='async')
+            call_id = await api.create_call(from_='+1234567890', to='+1234567891')
+            async for call in api.list_calls():
+                print(call['id'])
+        """
+        owns_transport = self._init_async_transport(other_options)
+        Client.__init__(self, user_id, api_token, api_secret, **other_options)
+        self._owns_transport = owns_transport
+
+    def batch(self, concurrency=4):
+        """
+        Async context manager version of :meth:`bandwidth.voice.Client.batch`
+        """
+        return AsyncBatch(self, concurrency)
+
+    def map(self, method, args_iter, concurrency=4):
+        """
+        Async iterator version of :meth:`bandwidth.voice.Client.map`
+        """
+        func = getattr(self, method) if isinstance(method, str) else method
+        return async_map_concurrently(func, args_iter, concurrency)
+
+    def list_calls(self, bridge_id=None, conference_id=None, from_=None, to=None, size=None, sort_order=None, **kwargs):
+        """
+        Async iterator version of :meth:`bandwidth.voice.Client.list_calls`
+        """
+
+        kwargs["bridgeId"] = bridge_id
+        kwargs["conferenceId"] = conference_id
+        kwargs["from"] = from_
+        kwargs["to"] = to
+        kwargs["size"] = size
+        kwargs["sortOrder"] = sort_order
+
+        path = '/users/%s/calls' % self.user_id
+        return get_async_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+
+    async def create_call(self,
+                          from_,
+                          to,
+                          call_timeout=None,
+                          callback_url=None,
+                          callback_timeout=None,
+                          callback_http_method=None,
+                          fallback_url=None,
+                          bridge_id=None,
+                          conference_id=None,
+                          recording_enabled=False,
+                          recording_file_format=None,
+                          recording_max_duration=None,
+                          transcription_enabled=False,
+                          tag=None,
+                          sip_headers=None,
+                          **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.create_call`
+        """
+        kwargs["from"] = from_
+        kwargs["to"] = to
+        kwargs["callTimeout"] = call_timeout
+        kwargs["callbackUrl"] = callback_url
+        kwargs["callbackTimeout"] = callback_timeout
+        kwargs["callbackHttpMethod"] = callback_http_method
+        kwargs["fallbackUrl"] = fallback_url
+        kwargs["bridgeId"] = bridge_id
+        kwargs["conferenceId"] = conference_id
+        kwargs["recordingEnabled"] = recording_enabled
+        kwargs["recordingFileFormat"] = recording_file_format
+        kwargs["recordingMaxDuration"] = recording_max_duration
+        kwargs["transcriptionEnabled"] = transcription_enabled
+        kwargs["tag"] = tag
+        kwargs["sipHeaders"] = sip_headers
+        return (await self._make_request('post', '/users/%s/calls' % self.user_id, json=kwargs))[2]
+
+    async def get_call(self, call_id):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.get_call`
+        """
+        return self._mirror_state('call', call_id, (await self._make_request(
+            'get', '/users/%s/calls/%s' % (self.user_id, call_id)))[0])
+
+    async def update_call(self,
+                          call_id,
+                          state=None,
+                          recording_enabled=None,
+                          recording_file_format=None,
+                          transfer_to=None,
+                          transfer_caller_id=None,
+                          whisper_audio=None,
+                          callback_url=None,
+                          **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.update_call`
+        """
+
+        kwargs["state"] = state
+        kwargs["recordingEnabled"] = recording_enabled
+        kwargs["recordingFileFormat"] = recording_file_format
+        kwargs["transferTo"] = transfer_to
+        kwargs["transferCallerId"] = transfer_caller_id
+        kwargs["whisperAudio"] = whisper_audio
+        kwargs["callbackUrl"] = callback_url
+        id = (await self._make_request('post', '/users/%s/calls/%s' % (self.user_id, call_id), json=kwargs))[2]
+        self._mirror_state('call', call_id, kwargs)
+        return id
+
+    async def play_audio_to_call(self,
+                                 call_id,
+                                 file_url=None,
+                                 sentence=None,
+                                 gender=None,
+                                 locale=None,
+                                 voice=None,
+                                 loop_enabled=None,
+                                 **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.play_audio_to_call`
+        """
+        kwargs["fileUrl"] = file_url
+        kwargs["sentence"] = sentence
+        kwargs["gender"] = gender
+        kwargs["locale"] = locale
+        kwargs["voice"] = voice
+        kwargs["loopEnabled"] = loop_enabled
+        await self._make_request(
+            'post', '/users/%s/calls/%s/audio' % (self.user_id, call_id), json=kwargs)
+
+    async def send_dtmf_to_call(self, call_id, dtmf_out, **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.send_dtmf_to_call`
+        """
+        kwargs["dtmfOut"] = dtmf_out
+        await self._make_request('post', '/users/%s/calls/%s/dtmf' %
+                                 (self.user_id, call_id), json=kwargs)
+
+    def list_call_recordings(self, call_id):
+        """
+        Async iterator version of :meth:`bandwidth.voice.Client.list_call_recordings`
+        """
+        path = '/users/%s/calls/%s/recordings' % (self.user_id, call_id)
+        return get_async_lazy_enumerator(self, lambda: self._make_request('get', path))
+
+    def list_call_transcriptions(self, call_id):
+        """
+        Async iterator version of :meth:`bandwidth.voice.Client.list_call_transcriptions`
+        """
+        path = '/users/%s/calls/%s/transcriptions' % (self.user_id, call_id)
+        return get_async_lazy_enumerator(self, lambda: self._make_request('get', path))
+
+    def list_call_events(self, call_id):
+        """
+        Async iterator version of :meth:`bandwidth.voice.Client.list_call_events`
+        """
+        path = '/users/%s/calls/%s/events' % (self.user_id, call_id)
+        return get_async_lazy_enumerator(self, lambda: self._make_request('get', path))
+
+    async def get_call_event(self, call_id, event_id):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.get_call_event`
+        """
+        return (await self._make_request('get', '/users/%s/calls/%s/events/%s' % (self.user_id, call_id, event_id)))[0]
+
+    async def create_call_gather(self, call_id,
+                                 max_digits=None,
+                                 inter_digit_timeout=None,
+                                 terminating_digits=None,
+                                 tag=None,
+                                 **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.create_call_gather`
+        """
+
+        kwargs['maxDigits'] = max_digits
+        kwargs['interDigitTimeout'] = inter_digit_timeout
+        kwargs['terminatingDigits'] = terminating_digits
+        kwargs['tag'] = tag
+
+        return (await self._make_request('post', '/users/%s/calls/%s/gather' % (self.user_id, call_id), json=kwargs))[2]
+
+    async def get_call_gather(self, call_id, gather_id):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.get_call_gather`
+        """
+        return (await self._make_request('get', '/users/%s/calls/%s/gather/%s' % (self.user_id, call_id, gather_id)))[0]
+
+    async def update_call_gather(self, call_id, gather_id, state=None, **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.update_call_gather`
+        """
+        kwargs['state'] = state
+        return await self._make_request('post', '/users/%s/calls/%s/gather/%s' % (self.user_id, call_id, gather_id),
+                                        json=kwargs)
+
+    async def toggle_call_recording(self, call_id):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.toggle_call_recording`
+        """
+        recording_enabled = self._get_mirrored_state('call', call_id, 'recording_enabled')
+        if not isinstance(recording_enabled, bool):
+            call_status = await self.get_call(call_id)
+            recording_enabled = call_status[self._response_key('recording_enabled')]
+
+        if recording_enabled is True:
+            return await self.disable_call_recording(call_id)
+        elif recording_enabled is False:
+            return await self.enable_call_recording(call_id)
+        else:
+            return call_status
+
+    def list_bridges(self, size=None, **kwargs):
+        """
+        Async iterator version of :meth:`bandwidth.voice.Client.list_bridges`
+        """
+        kwargs["size"] = size
+        path = '/users/%s/bridges' % self.user_id
+        return get_async_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+
+    async def create_bridge(self, call_ids=None, bridge_audio=None, **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.create_bridge`
+        """
+        kwargs["callIds"] = call_ids
+        kwargs["bridgeAudio"] = bridge_audio
+        return (await self._make_request('post', '/users/%s/bridges' % self.user_id, json=kwargs))[2]
+
+    async def create_bridged_calls(self, legs, bridge_audio=True, audio=None, **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.create_bridged_calls`
+        (function which prepares audio can be a coroutine function)
+        """
+        started = _timer()
+        timings = {}
+        prepared_audio = None
+        if callable(audio):
+            prepared_audio = asyncio.ensure_future(_measure_step(timings, 'prepare_audio', _prepare_audio(audio)))
+        try:
+            results = await asyncio.gather(*[
+                _measure_step(timings, 'create_call_%d' % index, self.create_call(**leg))
+                for index, leg in enumerate(legs)], return_exceptions=True)
+            call_ids = [result for result in results if not isinstance(result, Exception)]
+            errors = [result for result in results if isinstance(result, Exception)]
+            if errors:
+                await _hangup_calls(self, call_ids)
+                raise errors[0]
+            bridge_id = None
+            try:
+                bridge_id = await _measure_step(timings, 'create_bridge', self.create_bridge(
+                    call_ids=call_ids, bridge_audio=bridge_audio, **kwargs))
+                audio_kwargs = (await prepared_audio) if prepared_audio is not None else audio
+                if audio_kwargs:
+                    await _measure_step(timings, 'play_audio', self.play_audio_to_bridge(bridge_id, **audio_kwargs))
+            except Exception:
+                await _hangup_calls(self, call_ids)
+                if bridge_id is not None:
+                    await _release_bridge(self, bridge_id)
+                raise
+        finally:
+            if prepared_audio is not None and not prepared_audio.done():
+                prepared_audio.cancel()
+        timings['total'] = _timer() - started
+        return {'call_ids': call_ids, 'bridge_id': bridge_id, 'timings': timings}
+
+    async def get_bridge(self, bridge_id):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.get_bridge`
+        """
+        return self._mirror_state('bridge', bridge_id, (await self._make_request(
+            'get', '/users/%s/bridges/%s' % (self.user_id, bridge_id)))[0])
+
+    async def update_bridge(self, bridge_id, call_ids=None, bridge_audio=None, **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.update_bridge`
+        """
+        kwargs["callIds"] = call_ids
+        kwargs["bridgeAudio"] = bridge_audio
+        await self._make_request('post', '/users/%s/bridges/%s' %
+                                 (self.user_id, bridge_id), json=kwargs)
+        self._mirror_state('bridge', bridge_id, kwargs)
+
+    def list_bridge_calls(self, bridge_id):
+        """
+        Async iterator version of :meth:`bandwidth.voice.Client.list_bridge_calls`
+        """
+        path = '/users/%s/bridges/%s/calls' % (self.user_id, bridge_id)
+        return get_async_lazy_enumerator(self, lambda: self._make_request('get', path))
+
+    async def play_audio_to_bridge(self, bridge_id,
+                                   file_url=None,
+                                   sentence=None,
+                                   gender=None,
+                                   locale=None,
+                                   voice=None,
+                                   loop_enabled=None,
+                                   **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.play_audio_to_bridge`
+        """
+        kwargs["fileUrl"] = file_url
+        kwargs["sentence"] = sentence
+        kwargs["gender"] = gender
+        kwargs["locale"] = locale
+        kwargs["voice"] = voice
+        kwargs["loopEnabled"] = loop_enabled
+        await self._make_request(
+            'post', '/users/%s/bridges/%s/audio' % (self.user_id, bridge_id), json=kwargs)
+
+    async def create_conference(self,
+                                from_,
+                                callback_url=None,
+                                callback_timeout=None,
+                                callback_http_method=None,
+                                fallback_url=None,
+                                tag=None,
+                                **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.create_conference`
+        """
+
+        kwargs["from"] = from_
+        kwargs["callbackUrl"] = callback_url
+        kwargs["callbackTimeout"] = callback_timeout
+        kwargs["callbackHttpMethod"] = callback_http_method
+        kwargs["fallbackUrl"] = fallback_url
+        kwargs["tag"] = tag
+
+        return (await self._make_request('post', '/users/%s/conferences' % self.user_id, json=kwargs))[2]
+
+    async def get_conference(self, conference_id):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.get_conference`
+        """
+        return self._mirror_state('conference', conference_id, (await self._make_request(
+            'get', '/users/%s/conferences/%s' % (self.user_id, conference_id)))[0])
+
+    async def update_conference(self,
+                                conference_id,
+                                state=None,
+                                mute=None,
+                                hold=None,
+                                callback_url=None,
+                                callback_timeout=None,
+                                callback_http_method=None,
+                                fallback_url=None,
+                                tag=None,
+                                **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.update_conference`
+        """
+
+        kwargs["state"] = state
+        kwargs["mute"] = mute
+        kwargs["hold"] = hold
+        kwargs["callbackUrl"] = callback_url
+        kwargs["callbackTimeout"] = callback_timeout
+        kwargs["callbackHttpMethod"] = callback_http_method
+        kwargs["fallbackUrl"] = fallback_url
+        kwargs["tag"] = tag
+
+        await self._make_request('post', '/users/%s/conferences/%s' %
+                                 (self.user_id, conference_id), json=kwargs)
+        self._mirror_state('conference', conference_id, kwargs)
+
+    async def play_audio_to_conference(self,
+                                       conference_id,
+                                       file_url=None,
+                                       sentence=None,
+                                       gender=None,
+                                       locale=None,
+                                       voice=None,
+                                       loop_enabled=None,
+                                       **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.play_audio_to_conference`
+        """
+        kwargs['fileUrl'] = file_url
+        kwargs['sentence'] = sentence
+        kwargs['gender'] = gender
+        kwargs['locale'] = locale
+        kwargs['voice'] = voice
+        kwargs['loopEnabled'] = loop_enabled
+
+        await self._make_request('post', '/users/%s/conferences/%s/audio' %
+                                 (self.user_id, conference_id), json=kwargs)
+
+    def list_conference_members(self, conference_id):
+        """
+        Async iterator version of :meth:`bandwidth.voice.Client.list_conference_members`
+        """
+        path = '/users/%s/conferences/%s/members' % (
+            self.user_id, conference_id)
+        return get_async_lazy_enumerator(self, lambda: self._make_request('get', path))
+
+    async def create_conference_member(self,
+                                       conference_id,
+                                       call_id=None,
+                                       join_tone=None,
+                                       leaving_tone=None,
+                                       mute=None,
+                                       hold=None,
+                                       **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.create_conference_member`
+        """
+        kwargs['callId'] = call_id
+        kwargs['joinTone'] = join_tone
+        kwargs['leavingTone'] = leaving_tone
+        kwargs['mute'] = mute
+        kwargs['hold'] = hold
+
+        path = '/users/%s/conferences/%s/members' % (
+            self.user_id, conference_id)
+        return (await self._make_request('post', path, json=kwargs))[2]
+
+    async def get_conference_member(self, conference_id, member_id):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.get_conference_member`
+        """
+        path = '/users/%s/conferences/%s/members/%s' % (
+            self.user_id, conference_id, member_id)
+        return (await self._make_request('get', path))[0]
+
+    async def update_conference_member(self,
+                                       conference_id,
+                                       member_id,
+                                       join_tone=None,
+                                       leaving_tone=None,
+                                       mute=None,
+                                       hold=None,
+                                       **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.update_conference_member`
+        """
+        kwargs['joinTone'] = join_tone
+        kwargs['leavingTone'] = leaving_tone
+        kwargs['mute'] = mute
+        kwargs['hold'] = hold
+
+        path = '/users/%s/conferences/%s/members/%s' % (
+            self.user_id, conference_id, member_id)
+        await self._make_request('post', path, json=kwargs)
+
+    async def update_conference_members(self, conference_id, members=None, concurrency=10, **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.update_conference_members`
+        """
+        if members is None or callable(members):
+            member_ids = _select_members(self.list_conference_members(conference_id), members)
+        else:
+            member_ids = members
+
+        def update(member_id):
+            return self.update_conference_member(conference_id, member_id, **kwargs)
+        return [_get_member_outcome(item) async for item in async_map_concurrently(update, member_ids, concurrency)]
+
+    async def play_audio_to_conference_member(self,
+                                              conference_id,
+                                              member_id,
+                                              file_url=None,
+                                              sentence=None,
+                                              gender=None,
+                                              locale=None,
+                                              voice=None,
+                                              loop_enabled=None,
+                                              **kwargs):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.play_audio_to_conference_member`
+        """
+
+        kwargs['fileUrl'] = file_url
+        kwargs['sentence'] = sentence
+        kwargs['gender'] = gender
+        kwargs['locale'] = locale
+        kwargs['voice'] = voice
+        kwargs['loopEnabled'] = loop_enabled
+
+        path = '/users/%s/conferences/%s/members/%s/audio' % (
+            self.user_id, conference_id, member_id)
+        await self._make_request('post', path, json=kwargs)
+
+    def list_recordings(self, size=None, **kwargs):
+        """
+        Async iterator version of :meth:`bandwidth.voice.Client.list_recordings`
+        """
+        kwargs['size'] = size
+        path = '/users/%s/recordings' % self.user_id
+        media_name_key = self._response_key('media_name')
+        return async_lazy_map(lambda recording: _set_media_name(recording, media_name_key),
+                              get_async_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs)))
+
+    async def get_recording(self, recording_id):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.get_recording`
+        """
+        path = '/users/%s/recordings/%s' % (self.user_id, recording_id)
+        return _set_media_name((await self._make_request('get', path))[0], self._response_key('media_name'))
+
+    def list_transcriptions(self, recording_id, size=None, **kwargs):
+        """
+        Async iterator version of :meth:`bandwidth.voice.Client.list_transcriptions`
+        """
+        kwargs['size'] = size
+        path = '/users/%s/recordings/%s/transcriptions' % (
+            self.user_id, recording_id)
+        return get_async_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+
+    async def create_transcription(self, recording_id):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.create_transcription`
+        """
+        path = '/users/%s/recordings/%s/transcriptions' % (
+            self.user_id, recording_id)
+        return (await self._make_request('post', path, json={}))[2]
+
+    async def get_transcription(self, recording_id, transcription_id):
+        """
+        Coroutine version of :meth:`bandwidth.voice.Client.get_transcription`
+        """
+        path = '/users/%s/recordings/%s/transcriptions/%s' % (
+            self.user_id, recording_id, transcription_id)
+        return (await self._make_request('get', path))[0]
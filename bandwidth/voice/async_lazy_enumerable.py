@@ -0,0 +1,39 @@
+from bandwidth.voice.lazy_enumerable import get_next_page_url
+
+
+async def get_async_lazy_enumerator(client, get_first_page):
+    """
+    Returns api results as "lazy" asynchronous collection.
+    Makes api requests for new parts of data on demand only.
+    :type client: bandwidth.voice.AsyncClient
+    :param client: async client
+    :type get_first_page: types.FunctionType
+    :param get_first_page: function which returns coroutine with content of first part (page) of data
+
+    :rtype: types.AsyncGeneratorType
+    :returns: lazy collection
+
+    Example::
+
+        async for call in get_async_lazy_enumerator(client, lambda: client._make_request('get', path)):
+            print(call['id'])
+    """
+    get_data = get_first_page
+    while True:
+        items, response, _ = await get_data()
+        for item in items:
+            yield item
+        next_page_url = get_next_page_url(response)
+        if len(next_page_url) == 0:
+            break
+
+        def get_data():
+            return client._make_request('get', next_page_url)
+
+
+async def async_lazy_map(func, items):
+    """
+    Applies function to each item of asynchronous collection on demand
+    """
+    async for item in items:
+        yield func(item)
@@ -1,5 +1,12 @@
+import re
 from lxml import etree as ET
 from lxml.builder import E
+from bandwidth.voice.bxml_builder import _escape, _TEXT_ESCAPES, _ATTRIBUTE_ESCAPES
+
+_SLOT_START = u'\ue000'
+_SLOT_END = u'\ue001'
+# slot markers are serialized by lxml as character references because they are not ASCII
+_SLOT_PATTERN = re.compile(br'&#57344;(\w+)&#57345;')
 
 
 class Response:
@@ -48,3 +55,71 @@ class Response:
         xml = str(response)
         """
         return self.to_xml().decode('utf-8')
+
+
+def slot(name):
+    """
+    Returns placeholder of a value for text or attribute of BXML verb of a template
+
+    :type name: str
+    :param name: name of the slot (letters, digits and underscores)
+
+    :rtype str
+    :returns placeholder
+    """
+    if not re.match(r'^\w+$', name):
+        raise ValueError('Invalid slot name: %s' % name)
+    return _SLOT_START + name + _SLOT_END
+
+
+class Template:
+    """
+    Precompiled BXML Response with slots which are filled on rendering
+
+    Verbs are serialized once, rendering joins the serialized fragments with escaped values of slots.
+    Rendered XML is the same as XML of Response with the values in place of slots.
+
+    :Example:
+        from bandwidth.voice.bxml import Template, slot
+        template = Template(E.SpeakSentence(slot('sentence'), {'voice': 'susan'}), E.PlayAudio(slot('url')))
+        xml = template.render(sentence='Hello', url='http://example.com/audio.mp3')
+    """
+
+    def __init__(self, *response_verbs):
+        """
+        Initialize template
+
+        :type response_verbs: list
+        :param response_verbs: on or several of BXML verbs (texts and attributes can contain slots)
+        """
+        xml = Response(*response_verbs).to_xml()
+        self._fragments = []
+        self._slots = []
+        position = 0
+        for match in _SLOT_PATTERN.finditer(xml):
+            self._fragments.append(xml[position:match.start()])
+            # markup before a slot ends with '>' for text and with '<' for attribute value
+            in_attribute = xml.rfind(b'<', 0, match.start()) > xml.rfind(b'>', 0, match.start())
+            self._slots.append((match.group(1).decode('ascii'), _ATTRIBUTE_ESCAPES if in_attribute else _TEXT_ESCAPES))
+            position = match.end()
+        self._fragments.append(xml[position:])
+        self.slots = frozenset(name for name, escapes in self._slots)
+
+    def render(self, **values):
+        """
+        Build XML with values of slots
+
+        :rtype bytes
+        :returns XML text
+
+        :Example:
+        xml = template.render(sentence='Hello')
+        """
+        missing = self.slots.difference(values)
+        if missing:
+            raise KeyError('Missing values of slots: %s' % ', '.join(sorted(missing)))
+        parts = [self._fragments[0]]
+        for (name, escapes), fragment in zip(self._slots, self._fragments[1:]):
+            parts.append(_escape(values[name], escapes))
+            parts.append(fragment)
+        return b''.join(parts)
@@ -0,0 +1,210 @@
+"""
+BXML builder which doesn't require lxml
+
+Verbs are serialized directly to bytes, XML is the same as XML of :class:`bandwidth.voice.bxml.Response`
+with the same verbs built by ``lxml.builder.E``.
+"""
+import re
+import six
+from bandwidth.convert_camel import convert_string_to_camel_case
+
+_INVALID_CHARS = re.compile(u'[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+# the same escaping as lxml uses for text and attribute values
+_TEXT_ESCAPES = ((u'&', u'&amp;'), (u'<', u'&lt;'), (u'>', u'&gt;'), (u'\r', u'&#13;'))
+_ATTRIBUTE_ESCAPES = _TEXT_ESCAPES + ((u'"', u'&quot;'), (u'\t', u'&#9;'), (u'\n', u'&#10;'))
+# most values don't contain special characters, they are returned as is
+_SPECIAL_CHARS = re.compile(u'[&<>"\x00-\x1f\ufffe\uffff]')
+
+
+def _escape_text(value, escapes):
+    if isinstance(value, bytes):
+        value = value.decode('utf-8')
+    elif not isinstance(value, six.text_type):
+        value = six.text_type(value)
+    if _SPECIAL_CHARS.search(value) is None:
+        return value
+    if _INVALID_CHARS.search(value):
+        raise ValueError('All strings must be XML compatible: Unicode or ASCII, no NULL bytes or control characters')
+    for char, escaped in escapes:
+        value = value.replace(char, escaped)
+    return value
+
+
+def _escape(value, escapes):
+    return _escape_text(value, escapes).encode('ascii', 'xmlcharrefreplace')
+
+
+def _get_attribute_names(verb_class):
+    # names of keyword attributes are converted once per verb class
+    names = verb_class.__dict__.get('_attribute_names')
+    if names is None:
+        names = dict((convert_string_to_camel_case(name).lower(), name) for name in verb_class.attributes)
+        verb_class._attribute_names = names
+    return names
+
+
+def _format_attribute_value(value):
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return value
+
+
+class Verb(object):
+    """
+    Base class of BXML verbs
+
+    Positional arguments are texts, nested verbs and dictionaries of attributes (with names as is),
+    keyword arguments are attributes with names in snake_case (trailing underscore is removed, e.g. ``from_``).
+    """
+
+    tag = None
+    attributes = ()
+
+    def __init__(self, *children, **attributes):
+        self.attrib = {}
+        self.children = []
+        for child in children:
+            if isinstance(child, dict):
+                self.attrib.update(child)
+            elif isinstance(child, (Verb, six.string_types, bytes)):
+                self.children.append(child)
+            else:
+                raise TypeError('Invalid child of %s: %r' % (self.tag, child))
+        if attributes:
+            names = _get_attribute_names(type(self))
+            for name, value in attributes.items():
+                attribute = names.get(name.rstrip('_').replace('_', '').lower())
+                if attribute is None:
+                    raise TypeError('%s has no attribute %s' % (self.tag, name))
+                self.attrib[attribute] = _format_attribute_value(value)
+
+    def _serialize(self, parts):
+        parts.append(u'<' + self.tag)
+        for name, value in self.attrib.items():
+            parts.append(u' %s="%s"' % (name, _escape_text(value, _ATTRIBUTE_ESCAPES)))
+        if not self.children:
+            parts.append(u'/>')
+            return
+        parts.append(u'>')
+        for child in self.children:
+            if isinstance(child, Verb):
+                child._serialize(parts)
+            else:
+                parts.append(_escape_text(child, _TEXT_ESCAPES))
+        parts.append(u'</%s>' % self.tag)
+
+    def to_xml(self):
+        """
+        Convert verb to XML presentation
+
+        :rtype bytes
+        :returns XML text
+        """
+        parts = []
+        self._serialize(parts)
+        return u''.join(parts).encode('ascii', 'xmlcharrefreplace')
+
+
+class Call(Verb):
+    tag = 'Call'
+    attributes = ('from', 'to', 'requestUrl', 'requestUrlTimeout', 'timeout', 'tag')
+
+
+class Conference(Verb):
+    tag = 'Conference'
+    attributes = ('from', 'joinTone', 'leavingTone', 'mute', 'hold', 'tag')
+
+
+class Gather(Verb):
+    tag = 'Gather'
+    attributes = ('requestUrl', 'requestUrlTimeout', 'terminatingDigits', 'maxDigits', 'interDigitTimeout',
+                  'bargeable', 'tag')
+
+
+class Hangup(Verb):
+    tag = 'Hangup'
+
+
+class Pause(Verb):
+    tag = 'Pause'
+    attributes = ('duration',)
+
+
+class PlayAudio(Verb):
+    tag = 'PlayAudio'
+    attributes = ('digits',)
+
+
+class Record(Verb):
+    tag = 'Record'
+    attributes = ('requestUrl', 'requestUrlTimeout', 'fileFormat', 'terminatingDigits', 'maxDuration', 'transcribe',
+                  'transcribeCallbackUrl', 'tag')
+
+
+class Redirect(Verb):
+    tag = 'Redirect'
+    attributes = ('requestUrl', 'requestUrlTimeout', 'context')
+
+
+class Reject(Verb):
+    tag = 'Reject'
+    attributes = ('reason',)
+
+
+class SendMessage(Verb):
+    tag = 'SendMessage'
+    attributes = ('from', 'to', 'requestUrl', 'requestUrlTimeout', 'statusCallbackUrl', 'tag')
+
+
+class SpeakSentence(Verb):
+    tag = 'SpeakSentence'
+    attributes = ('voice', 'gender', 'locale')
+
+
+class Transfer(Verb):
+    tag = 'Transfer'
+    attributes = ('transferTo', 'transferCallerId', 'callTimeout', 'requestUrl', 'requestUrlTimeout', 'tag')
+
+
+class Response(object):
+    """
+    BXML Response element
+
+    :Example:
+        from bandwidth.voice.bxml_builder import Response, SpeakSentence, Hangup
+        response = Response(SpeakSentence('Hello', voice='susan'), Hangup())
+    """
+
+    def __init__(self, *response_verbs):
+        """
+        Initialize Response element
+
+        :type response_verbs: list
+        :param response_verbs: on or several of BXML verbs
+        """
+        self.verbs = list(response_verbs)
+
+    def to_xml(self):
+        """
+        Convert response object to XML presentation
+
+        :rtype bytes
+        :returns XML text
+        """
+        if not self.verbs:
+            return b'<xml><Response/></xml>'
+        parts = [u'<xml><Response>']
+        for verb in self.verbs:
+            verb._serialize(parts)
+        parts.append(u'</Response></xml>')
+        # characters which are not ASCII are written as character references like lxml does
+        return u''.join(parts).encode('ascii', 'xmlcharrefreplace')
+
+    def __str__(self):
+        """
+        Convert response object to XML presentation implicitly
+
+        :rtype str
+        :returns XML text
+        """
+        return self.to_xml().decode('utf-8')
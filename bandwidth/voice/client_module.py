@@ -1,24 +1,83 @@
-import requests
 import six
 import urllib
 import json
-import itertools
+import copy
+from concurrent.futures import ThreadPoolExecutor
 from bandwidth.voice.lazy_enumerable import get_lazy_enumerator
-from bandwidth.convert_camel import convert_object_to_snake_case
+from bandwidth.convert_camel import convert_string_to_camel_case, check_key_style
 from bandwidth.voice.decorators import play_audio
+from bandwidth.transport import get_transport
+from bandwidth.revalidation import ConditionalCache
+from bandwidth.metrics import start_request_metrics, set_response_metrics, finish_request_metrics, parse_json, _timer
+from bandwidth.voice.state import StateMirror
+from bandwidth.json_stream import check_streaming_supported, iter_json_items
+from bandwidth.batch import Batch, map_concurrently
 from bandwidth.version import __version__ as version
 
 from .api_exception_module import BandwidthVoiceAPIException
 
 quote = urllib.parse.quote if six.PY3 else urllib.quote
-lazy_map = map if six.PY3 else itertools.imap
 
 
-def _set_media_name(recording):
-    recording['media_name'] = recording.get('media', '').split('/')[-1]
+def _set_media_name(recording, key='media_name'):
+    recording[key] = recording.get('media', '').split('/')[-1]
     return recording
 
 
+def _get_state_mirror(options):
+    mirror_state = options.get('mirror_state')
+    if isinstance(mirror_state, StateMirror):
+        return mirror_state
+    return StateMirror(options.get('mirror_state_ttl', 30)) if mirror_state else None
+
+
+def _measure_step(timings, name, func, *args, **kwargs):
+    started = _timer()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        timings[name] = _timer() - started
+
+
+def _hangup_calls(client, call_ids):
+    for call_id in call_ids:
+        try:
+            client.hangup_call(call_id)
+        except Exception:
+            pass
+
+
+def _release_bridge(client, bridge_id):
+    try:
+        client.update_bridge(bridge_id, call_ids=[])
+    except Exception:
+        pass
+
+
+def _get_call_ids(client, calls):
+    call_ids = []
+    error = None
+    for call in calls:
+        try:
+            call_ids.append(call.result())
+        except Exception as e:
+            error = error or e
+    if error is not None:
+        _hangup_calls(client, call_ids)
+        raise error
+    return call_ids
+
+
+def _select_members(members, predicate=None):
+    for member in members:
+        if member.get('state') == 'active' and (predicate is None or predicate(member)):
+            yield member['id']
+
+
+def _get_member_outcome(item):
+    return {'member_id': item['args'], 'error': item['error']}
+
+
 @play_audio('call')
 @play_audio('bridge')
 @play_audio('conference')
@@ -41,6 +100,47 @@ class Client:
         :param api_endpoint: catapult api endpoint (optional, default value is https://api.catapult.inetwork.com)
         :type api_version: str
         :param api_version: catapult api version (optional, default value is v1)
+        :type transport: bandwidth.transport.Transport
+        :param transport: pooled transport to share with other clients (optional)
+        :type pool_connections: int
+        :param pool_connections: number of host connection pools (optional, default value is 10)
+        :type pool_maxsize: int
+        :param pool_maxsize: max number of connections per host (optional, default value is 10)
+        :type keep_alive: bool
+        :param keep_alive: reuse connections between requests (optional, default value is True)
+        :type retry: bandwidth.retry.RetryPolicy
+        :param retry: policy of retrying of failed requests (optional, requests are not retried by default)
+        :type rate_limiter: bandwidth.rate_limiter.RateLimiter
+        :param rate_limiter: limiter of rate of requests (optional, requests are not limited by default)
+        :type prefetch_pages: int
+        :param prefetch_pages: number of next pages of lists to request in background while current page
+            is being consumed (optional, default value is 0 - prefetching is disabled)
+        :type stream_pages: bool
+        :param stream_pages: parse items of list pages incrementally while they are being consumed
+            instead of loading whole page in memory (optional, default value is False, requires ijson)
+        :type key_style: str
+        :param key_style: style of keys of returned objects: 'snake' - keys are converted to snake_case,
+            'lazy_snake' - keys are converted to snake_case when they are read, 'raw' - objects are returned
+            as they have been parsed from json (optional, default value is 'snake')
+        :type conditional_get: bool
+        :param conditional_get: cache single resources (like calls or messages, not lists) returned
+            by GET requests with ETag or Last-Modified headers and revalidate them by conditional requests,
+            unchanged results are served from the cache (optional, default value is False). Results served
+            from the cache are shared and should not be modified. Statistics are available in field
+            ``conditional_cache``
+        :type conditional_get_max_size: int
+        :param conditional_get_max_size: max number of results cached for conditional requests
+            (optional, default value is 1000)
+        :type metrics: types.FunctionType
+        :param metrics: sink of metrics of requests, function which takes :class:`bandwidth.metrics.RequestMetrics`
+            after each request (optional, metrics are not collected by default).
+            See :class:`bandwidth.metrics.MetricsRecorder`
+        :type mirror_state: bool or bandwidth.voice.state.StateMirror
+        :param mirror_state: keep local copy of state of calls, bridges and conferences in field
+            ``state_mirror``, helpers like ``toggle_call_recording()`` use fresh state from it instead of
+            requesting it (optional, default value is False). A mirror can be passed to share it.
+        :type mirror_state_ttl: float
+        :param mirror_state_ttl: time in seconds while mirrored fields are fresh (optional, default value is 30)
 
         :rtype: bandwidth.catapult.Client
         :returns: bandwidth client
@@ -59,6 +159,119 @@ class Client:
             'api_endpoint', 'https://api.catapult.inetwork.com')
         self.api_version = other_options.get('api_version', 'v1')
         self.auth = (api_token, api_secret)
+        self.transport, self._owns_transport = get_transport(other_options)
+        self.prefetch_pages = other_options.get('prefetch_pages', 0)
+        self.stream_pages = other_options.get('stream_pages', False)
+        if self.stream_pages:
+            check_streaming_supported()
+        self.key_style = check_key_style(other_options.get('key_style', 'snake'))
+        self.conditional_cache = None
+        if other_options.get('conditional_get'):
+            self.conditional_cache = ConditionalCache(other_options.get('conditional_get_max_size', 1000))
+        self.metrics = other_options.get('metrics')
+        self.state_mirror = _get_state_mirror(other_options)
+
+    def close(self):
+        """
+        Close pooled connections of the client (a shared transport passed to the client is left open)
+
+        Example::
+
+            with bandwidth.client('voice', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET') as api:
+                api.get_call('c-abc123')
+        """
+        if self._owns_transport:
+            self.transport.close()
+
+    def with_key_style(self, key_style):
+        """
+        Returns a copy of the client (sharing its transport) which returns objects with another style of keys
+
+        :type key_style: str
+        :param key_style: 'snake', 'lazy_snake' or 'raw'
+
+        :rtype: same type as the client
+        :returns: client copy
+
+        Example: Fetch messages with original camelCase keys::
+
+            for message in api.with_key_style('raw').list_messages():
+                print(message['deliveryState'])
+        """
+        client = copy.copy(self)
+        client.key_style = check_key_style(key_style)
+        client._owns_transport = False
+        return client
+
+    def _response_key(self, key):
+        # key of returned objects in the client key style
+        return convert_string_to_camel_case(key) if self.key_style == 'raw' else key
+
+    def _mirror_state(self, resource, id, fields):
+        if self.state_mirror is not None:
+            self.state_mirror.update(resource, id, fields)
+        return fields
+
+    def _get_mirrored_state(self, resource, id, field):
+        if self.state_mirror is None:
+            return None
+        return self.state_mirror.get(resource, id, field)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def batch(self, concurrency=4):
+        """
+        Returns a batch which runs calls of client methods concurrently on a thread pool
+
+        All calls share connection pool of the client, so concurrency should not exceed its ``pool_maxsize``.
+
+        :type concurrency: int
+        :param concurrency: max number of calls running at once (optional, default value is 4)
+
+        :rtype: bandwidth.batch.Batch
+        :returns: batch. Results of calls are available in its field ``results`` after exit from ``with`` block.
+            Each result is a dictionary with keys 'args' (tuple of method name, positional and keyword arguments),
+            'result' and 'error' (exception raised by the call or None)
+
+        Example: Hang up all calls of a conference::
+
+            with api.batch(concurrency=8) as batch:
+                for member in api.list_conference_members('conferenceId'):
+                    batch.hangup_call(member['call_id'])
+            failed = [item for item in batch.results if item['error'] is not None]
+        """
+        return Batch(self, concurrency)
+
+    def map(self, method, args_iter, concurrency=4):
+        """
+        Calls a client method for each item of arguments concurrently on a thread pool
+
+        All calls share connection pool of the client, so concurrency should not exceed its ``pool_maxsize``.
+
+        :type method: str
+        :param method: name of client method (or any callable)
+        :type args_iter: collections.Iterable
+        :param args_iter: arguments of calls. Each item is a tuple of positional arguments,
+            a dictionary of keyword arguments or a single argument. Items are read on demand.
+        :type concurrency: int
+        :param concurrency: max number of calls running at once (optional, default value is 4)
+
+        :rtype: types.GeneratorType
+        :returns: results of calls in order of arguments. Each result is a dictionary with keys 'args',
+            'result' and 'error' (exception raised by the call or None)
+
+        Example: Get information about several calls::
+
+            for item in api.map('get_call', ['c-1', 'c-2', 'c-3'], concurrency=3):
+                if item['error'] is None:
+                    print(item['result']['state'])
+        """
+        func = getattr(self, method) if isinstance(method, six.string_types) else method
+        return map_concurrently(func, args_iter, concurrency)
 
     def _request(self, method, url, *args, **kwargs):
         user_agent = 'PythonSDK_' + version
@@ -72,7 +285,7 @@ class Client:
         if url.startswith('/'):
             # relative url
             url = '%s/%s%s' % (self.api_endpoint, self.api_version, url)
-        return requests.request(method, url, auth=self.auth, headers=headers, *args, **kwargs)
+        return self.transport.request(method, url, auth=self.auth, headers=headers, *args, **kwargs)
 
     def _check_response(self, response):
         if response.status_code >= 400:
@@ -86,13 +299,40 @@ class Client:
                     response.status_code, response.content.decode('utf-8')[:79])
 
     def _make_request(self, method, url, *args, **kwargs):
-        response = self._request(method, url, *args, **kwargs)
+        metrics = start_request_metrics(self, method, url)
+        try:
+            if self.conditional_cache is not None and method == 'get':
+                key = self.conditional_cache.get_key(self.key_style, url, kwargs)
+                entry = self.conditional_cache.prepare(key, kwargs)
+                response = self._request(method, url, *args, **kwargs)
+                set_response_metrics(metrics, response)
+                return self.conditional_cache.resolve(key, entry, response,
+                                                      lambda response: self._parse_response(response, metrics))
+            response = self._request(method, url, *args, **kwargs)
+            set_response_metrics(metrics, response)
+            return self._parse_response(response, metrics)
+        finally:
+            finish_request_metrics(self, metrics)
+
+    def _make_page_request(self, method, url, *args, **kwargs):
+        if not self.stream_pages:
+            return self._make_request(method, url, *args, **kwargs)
+        metrics = start_request_metrics(self, method, url)
+        try:
+            response = self._request(method, url, stream=True, *args, **kwargs)
+            set_response_metrics(metrics, response, stream=True)
+            self._check_response(response)
+        finally:
+            finish_request_metrics(self, metrics)
+        return (iter_json_items(response, self.key_style), response, None)
+
+    def _parse_response(self, response, metrics=None):
         self._check_response(response)
         data = None
         id = None
         if response.headers.get('content-type') is not None and \
                 response.headers.get('content-type').startswith("application/json"):
-            data = convert_object_to_snake_case(response.json())
+            data = parse_json(response, self.key_style, metrics)
         location = response.headers.get('location')
         if location is not None:
             id = location.split('/')[-1]
@@ -149,7 +389,8 @@ class Client:
         kwargs["loopEnabled"] = loop_enabled
         return kwargs
 
-    def list_calls(self, bridge_id=None, conference_id=None, from_=None, to=None, size=None, sort_order=None, **kwargs):
+    def list_calls(self, bridge_id=None, conference_id=None, from_=None, to=None, size=None, sort_order=None,
+                   cursor=None, **kwargs):
         """
         Get a list of calls
 
@@ -161,8 +402,9 @@ class Client:
             Values are asc or desc If no value is specified the default value is desc
         :param int size: Used for pagination to indicate the size of each page requested for querying a list of items. \
             If no value is specified the default value is 25. (Maximum value 1000)
+        :param dict cursor: position to resume the list from (field ``cursor`` of previously returned list)
 
-        :rtype: types.GeneratorType
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of calls
 
         Example: Fetch calls from specific telephone number::
@@ -229,7 +471,7 @@ class Client:
         kwargs["sortOrder"] = sort_order
 
         path = '/users/%s/calls' % self.user_id
-        return get_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path, params=kwargs), cursor)
 
     def create_call(self,
                     from_,
@@ -347,7 +589,8 @@ class Client:
             ##     'transcription_enabled': False,
             ##     'transcriptions'      : 'https://api..../v1/users/u-abc/calls/c-abc123/transcriptions'}
         """
-        return self._make_request('get', '/users/%s/calls/%s' % (self.user_id, call_id))[0]
+        return self._mirror_state('call', call_id,
+                                  self._make_request('get', '/users/%s/calls/%s' % (self.user_id, call_id))[0])
 
     def update_call(self,
                     call_id,
@@ -400,7 +643,9 @@ class Client:
         kwargs["transferCallerId"] = transfer_caller_id
         kwargs["whisperAudio"] = whisper_audio
         kwargs["callbackUrl"] = callback_url
-        return self._make_request('post', '/users/%s/calls/%s' % (self.user_id, call_id), json=kwargs)[2]
+        id = self._make_request('post', '/users/%s/calls/%s' % (self.user_id, call_id), json=kwargs)[2]
+        self._mirror_state('call', call_id, kwargs)
+        return id
 
     def play_audio_to_call(self,
                            call_id,
@@ -456,14 +701,16 @@ class Client:
         self._make_request('post', '/users/%s/calls/%s/dtmf' %
                            (self.user_id, call_id), json=kwargs)
 
-    def list_call_recordings(self, call_id):
+    def list_call_recordings(self, call_id, cursor=None):
         """
         Get a list of recordings of a call
 
         :type call_id: str
         :param call_id: id of a call
+        :type cursor: dict
+        :param cursor: position to resume the list from (field ``cursor`` of previously returned list)
 
-        :rtype: types.GeneratorType
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of recordings
 
         Fetch all call recordings for a call::
@@ -471,16 +718,18 @@ class Client:
             list = api.get_call_recordings('callId')
         """
         path = '/users/%s/calls/%s/recordings' % (self.user_id, call_id)
-        return get_lazy_enumerator(self, lambda: self._make_request('get', path))
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path), cursor)
 
-    def list_call_transcriptions(self, call_id):
+    def list_call_transcriptions(self, call_id, cursor=None):
         """
         Get a list of transcriptions of a call
 
         :type call_id: str
         :param call_id: id of a call
+        :type cursor: dict
+        :param cursor: position to resume the list from (field ``cursor`` of previously returned list)
 
-        :rtype: types.GeneratorType
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of transcriptions
 
         Get all transcriptions for calls::
@@ -488,15 +737,16 @@ class Client:
             list = api.get_call_transcriptions('callId')
         """
         path = '/users/%s/calls/%s/transcriptions' % (self.user_id, call_id)
-        return get_lazy_enumerator(self, lambda: self._make_request('get', path))
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path), cursor)
 
-    def list_call_events(self, call_id):
+    def list_call_events(self, call_id, cursor=None):
         """
         Get a list of events of a call
 
         :param str call_id: id of a call
+        :param dict cursor: position to resume the list from (field ``cursor`` of previously returned list)
 
-        :rtype: types.GeneratorType
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of events
 
         Fetch all events for calls::
@@ -504,7 +754,7 @@ class Client:
             list = api.get_call_events('callId')
         """
         path = '/users/%s/calls/%s/events' % (self.user_id, call_id)
-        return get_lazy_enumerator(self, lambda: self._make_request('get', path))
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path), cursor)
 
     def get_call_event(self, call_id, event_id):
         """
@@ -667,6 +917,7 @@ class Client:
     def toggle_call_recording(self, call_id):
         """
         Fetches the current call state and either toggles recording on or off
+        (fresh state of the call from ``state_mirror`` is used without fetching if the client mirrors state)
 
         :param str call_id: id of the call to toggle
 
@@ -688,8 +939,10 @@ class Client:
             ## False
 
         """
-        call_status = self.get_call(call_id)
-        recording_enabled = call_status['recording_enabled']
+        recording_enabled = self._get_mirrored_state('call', call_id, 'recording_enabled')
+        if not isinstance(recording_enabled, bool):
+            call_status = self.get_call(call_id)
+            recording_enabled = call_status[self._response_key('recording_enabled')]
 
         if recording_enabled is True:
             return self.disable_call_recording(call_id)
@@ -746,14 +999,15 @@ class Client:
                                 whisper_audio=whisper_audio,
                                 **kwargs)
 
-    def list_bridges(self, size=None, **kwargs):
+    def list_bridges(self, size=None, cursor=None, **kwargs):
         """
         Get a list of bridges
 
         :param int size: Used for pagination to indicate the size of each page requested for querying a list of items.
             If no value is specified the default value is 25. (Maximum value 1000)
+        :param dict cursor: position to resume the list from (field ``cursor`` of previously returned list)
 
-        :rtype: types.GeneratorType
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of bridges
 
         Example: List bridges 1000 at a time::
@@ -771,7 +1025,7 @@ class Client:
         """
         kwargs["size"] = size
         path = '/users/%s/bridges' % self.user_id
-        return get_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path, params=kwargs), cursor)
 
     def create_bridge(self, call_ids=None, bridge_audio=None, **kwargs):
         """
@@ -795,6 +1049,62 @@ class Client:
         kwargs["bridgeAudio"] = bridge_audio
         return self._make_request('post', '/users/%s/bridges' % self.user_id, json=kwargs)[2]
 
+    def create_bridged_calls(self, legs, bridge_audio=True, audio=None, **kwargs):
+        """
+        Create calls and a bridge between them, then play audio to the bridge
+
+        Calls (and preparation of audio) are created concurrently, the bridge is created as soon as all calls
+        are created, and audio is played as soon as the bridge and the audio are ready. If a step fails,
+        created calls are hung up, calls are removed from the created bridge and the error is raised.
+
+        :type legs: list
+        :param legs: keyword arguments of ``create_call()`` for each call
+        :type bridge_audio: bool
+        :param bridge_audio: enable two way audio path between calls (optional, default value is True)
+        :type audio: dict or types.FunctionType
+        :param audio: keyword arguments of ``play_audio_to_bridge()`` or function which prepares audio
+            while calls are being created and returns such arguments (optional, audio is not played by default)
+        :param kwargs: other arguments of ``create_bridge()``
+
+        :rtype: dict
+        :returns: ids of calls ('call_ids'), id of the bridge ('bridge_id') and durations of steps in seconds
+            ('timings' with keys 'create_call_0', 'create_call_1', ..., 'prepare_audio', 'create_bridge',
+            'play_audio' and 'total')
+
+        Example: Click to call::
+
+            result = api.create_bridged_calls([{'from_': '+19192223333', 'to': '+19192223334'},
+                                               {'from_': '+19192223333', 'to': '+19192223335'}],
+                                              audio={'sentence': 'Connecting your call'})
+            print(result['bridge_id'], result['timings'])
+        """
+        started = _timer()
+        timings = {}
+        executor = ThreadPoolExecutor(max_workers=len(legs) + 1)
+        try:
+            calls = [executor.submit(_measure_step, timings, 'create_call_%d' % index, self.create_call, **leg)
+                     for index, leg in enumerate(legs)]
+            prepared_audio = None
+            if callable(audio):
+                prepared_audio = executor.submit(_measure_step, timings, 'prepare_audio', audio)
+            call_ids = _get_call_ids(self, calls)
+            bridge_id = None
+            try:
+                bridge_id = _measure_step(timings, 'create_bridge', self.create_bridge, call_ids=call_ids,
+                                          bridge_audio=bridge_audio, **kwargs)
+                audio_kwargs = prepared_audio.result() if prepared_audio is not None else audio
+                if audio_kwargs:
+                    _measure_step(timings, 'play_audio', self.play_audio_to_bridge, bridge_id, **audio_kwargs)
+            except Exception:
+                _hangup_calls(self, call_ids)
+                if bridge_id is not None:
+                    _release_bridge(self, bridge_id)
+                raise
+        finally:
+            executor.shutdown(wait=True)
+        timings['total'] = _timer() - started
+        return {'call_ids': call_ids, 'bridge_id': bridge_id, 'timings': timings}
+
     def get_bridge(self, bridge_id):
         """
         Gets information about a bridge
@@ -819,7 +1129,8 @@ class Client:
             print(my_bridge["state"])
             ## created
         """
-        return self._make_request('get', '/users/%s/bridges/%s' % (self.user_id, bridge_id))[0]
+        return self._mirror_state('bridge', bridge_id,
+                                  self._make_request('get', '/users/%s/bridges/%s' % (self.user_id, bridge_id))[0])
 
     def update_bridge(self, bridge_id, call_ids=None, bridge_audio=None, **kwargs):
         """
@@ -851,15 +1162,18 @@ class Client:
         kwargs["bridgeAudio"] = bridge_audio
         self._make_request('post', '/users/%s/bridges/%s' %
                            (self.user_id, bridge_id), json=kwargs)
+        self._mirror_state('bridge', bridge_id, kwargs)
 
-    def list_bridge_calls(self, bridge_id):
+    def list_bridge_calls(self, bridge_id, cursor=None):
         """
         Get a list of calls of a bridge
 
         :type bridge_id: str
         :param bridge_id: id of a bridge
+        :type cursor: dict
+        :param cursor: position to resume the list from (field ``cursor`` of previously returned list)
 
-        :rtype: types.GeneratorType
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of calls
 
         Example: Fetch all calls that were in a bridge::
@@ -897,7 +1211,7 @@ class Client:
             ## ]
         """
         path = '/users/%s/bridges/%s/calls' % (self.user_id, bridge_id)
-        return get_lazy_enumerator(self, lambda: self._make_request('get', path))
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path), cursor)
 
     def play_audio_to_bridge(self, bridge_id,
                              file_url=None,
@@ -1034,7 +1348,8 @@ class Client:
             ##     'mute'              : False,
             ##     'state'             : 'created'}
         """
-        return self._make_request('get', '/users/%s/conferences/%s' % (self.user_id, conference_id))[0]
+        return self._mirror_state('conference', conference_id, self._make_request(
+            'get', '/users/%s/conferences/%s' % (self.user_id, conference_id))[0])
 
     def update_conference(self,
                           conference_id,
@@ -1082,6 +1397,7 @@ class Client:
 
         self._make_request('post', '/users/%s/conferences/%s' %
                            (self.user_id, conference_id), json=kwargs)
+        self._mirror_state('conference', conference_id, kwargs)
 
     def play_audio_to_conference(self,
                                  conference_id,
@@ -1130,14 +1446,16 @@ class Client:
         self._make_request('post', '/users/%s/conferences/%s/audio' %
                            (self.user_id, conference_id), json=kwargs)
 
-    def list_conference_members(self, conference_id):
+    def list_conference_members(self, conference_id, cursor=None):
         """
         Get a list of members of a conference
 
         :type conference_id: str
         :param conference_id: id of a conference
+        :type cursor: dict
+        :param cursor: position to resume the list from (field ``cursor`` of previously returned list)
 
-        :rtype: types.GeneratorType
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of recordings
 
         Example: Fetch and list conference members::
@@ -1177,7 +1495,7 @@ class Client:
         """
         path = '/users/%s/conferences/%s/members' % (
             self.user_id, conference_id)
-        return get_lazy_enumerator(self, lambda: self._make_request('get', path))
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path), cursor)
 
     def create_conference_member(self,
                                  conference_id,
@@ -1450,13 +1768,13 @@ class Client:
 
             api.speak_sentence_to_conference_member('conferenceId', 'memberId', 'Hello')
         """
-        self.play_audio_to_conference_member(conference_id, member_id,
-                                             sentence=sentence,
-                                             gender=gender,
-                                             voice=voice,
-                                             locale=locale,
-                                             tag=tag
-                                             )
+        return self.play_audio_to_conference_member(conference_id, member_id,
+                                                    sentence=sentence,
+                                                    gender=gender,
+                                                    voice=voice,
+                                                    locale=locale,
+                                                    tag=tag
+                                                    )
 
     def play_audio_file_to_conference_member(self, conference_id, member_id, file_url, tag=None):
         """
@@ -1479,10 +1797,10 @@ class Client:
             api.play_audio_file_to_conference_member('conferenceId', 'memberId', 'http://host/path/file.mp3')
         """
 
-        self.play_audio_to_conference_member(conference_id, member_id,
-                                             file_url=file_url,
-                                             tag=tag
-                                             )
+        return self.play_audio_to_conference_member(conference_id, member_id,
+                                                    file_url=file_url,
+                                                    tag=tag
+                                                    )
 
     def remove_conference_member(self, conference_id, member_id):
         """
@@ -1540,7 +1858,7 @@ class Client:
             ##    'state'      : 'completed'}]
 
         """
-        self.update_conference_member(
+        return self.update_conference_member(
             conference_id, member_id, state='completed')
 
     def hold_conference_member(self, conference_id, member_id, hold):
@@ -1560,7 +1878,7 @@ class Client:
 
             api.hold_conference_member('conferenceId', 'memberId', True)
         """
-        self.update_conference_member(conference_id, member_id, hold=hold)
+        return self.update_conference_member(conference_id, member_id, hold=hold)
 
     def mute_conference_member(self, conference_id, member_id, mute):
         """
@@ -1579,7 +1897,109 @@ class Client:
 
             api.mute_conference_member('conferenceId', 'memberId', True)
         """
-        self.update_conference_member(conference_id, member_id, mute=mute)
+        return self.update_conference_member(conference_id, member_id, mute=mute)
+
+    def update_conference_members(self, conference_id, members=None, concurrency=10, **kwargs):
+        """
+        Update several members of a conference concurrently
+
+        All updates share connection pool of the client, so concurrency should not exceed its ``pool_maxsize``.
+
+        :type conference_id: str
+        :param conference_id: id of a conference
+        :type members: list or types.FunctionType
+        :param members: ids of members or function which takes a member (item of ``list_conference_members()``)
+            and returns True for members to update (optional, all active members are updated by default).
+            Only active members are passed to the function, members are updated while the list is being read.
+        :type concurrency: int
+        :param concurrency: max number of updates at once (optional, default value is 10)
+        :param kwargs: fields to update (the same as arguments of ``update_conference_member()``)
+
+        :rtype: list
+        :returns: outcome of each member. Each outcome is a dictionary with keys 'member_id' and 'error'
+            (exception raised by the update or None)
+
+        Example: Mute all members except moderator::
+
+            outcomes = api.update_conference_members('conferenceId',
+                                                     lambda member: member['id'] != moderator_id, mute=True)
+            failed = [outcome['member_id'] for outcome in outcomes if outcome['error'] is not None]
+        """
+        if members is None or callable(members):
+            member_ids = _select_members(self.list_conference_members(conference_id), members)
+        else:
+            member_ids = members
+
+        def update(member_id):
+            return self.update_conference_member(conference_id, member_id, **kwargs)
+        return [_get_member_outcome(item) for item in map_concurrently(update, member_ids, concurrency)]
+
+    def mute_conference_members(self, conference_id, mute, members=None, concurrency=10):
+        """
+        Mute or unmute several members of a conference concurrently
+
+        :type conference_id: str
+        :param conference_id: id of a conference
+        :type mute: bool
+        :param mute: mute (if true) or unmute (if false) members
+        :type members: list or types.FunctionType
+        :param members: ids of members or function which selects members
+            (see ``update_conference_members()``, all active members by default)
+        :type concurrency: int
+        :param concurrency: max number of updates at once (optional, default value is 10)
+
+        :rtype: list
+        :returns: outcome of each member (dictionaries with keys 'member_id' and 'error')
+
+        Example: Mute all members of a conference::
+
+            api.mute_conference_members('conferenceId', True)
+        """
+        return self.update_conference_members(conference_id, members, concurrency, mute=mute)
+
+    def hold_conference_members(self, conference_id, hold, members=None, concurrency=10):
+        """
+        Hold or unhold several members of a conference concurrently
+
+        :type conference_id: str
+        :param conference_id: id of a conference
+        :type hold: bool
+        :param hold: hold (if true) or unhold (if false) members
+        :type members: list or types.FunctionType
+        :param members: ids of members or function which selects members
+            (see ``update_conference_members()``, all active members by default)
+        :type concurrency: int
+        :param concurrency: max number of updates at once (optional, default value is 10)
+
+        :rtype: list
+        :returns: outcome of each member (dictionaries with keys 'member_id' and 'error')
+
+        Example: Put specific members on hold::
+
+            api.hold_conference_members('conferenceId', True, ['memberId1', 'memberId2'])
+        """
+        return self.update_conference_members(conference_id, members, concurrency, hold=hold)
+
+    def remove_conference_members(self, conference_id, members=None, concurrency=10):
+        """
+        Remove several members of a conference concurrently
+
+        :type conference_id: str
+        :param conference_id: id of a conference
+        :type members: list or types.FunctionType
+        :param members: ids of members or function which selects members
+            (see ``update_conference_members()``, all active members by default)
+        :type concurrency: int
+        :param concurrency: max number of updates at once (optional, default value is 10)
+
+        :rtype: list
+        :returns: outcome of each member (dictionaries with keys 'member_id' and 'error')
+
+        Example: Remove muted members::
+
+            api.remove_conference_members('conferenceId', lambda member: member['mute'])
+        """
+        return self.update_conference_members(conference_id, members, concurrency, state='completed')
 
     def terminate_conference(self, conference_id):
         """
@@ -1593,7 +2013,7 @@ class Client:
             api.terminate_conference('conferenceId')
 
         """
-        self.update_conference(conference_id, state='completed')
+        return self.update_conference(conference_id, state='completed')
 
     def hold_conference(self, conference_id, hold):
         """
@@ -1609,7 +2029,7 @@ class Client:
 
             api.hold_conference('conferenceId', True)
         """
-        self.update_conference(conference_id, hold=hold)
+        return self.update_conference(conference_id, hold=hold)
 
     def mute_conference(self, conference_id, mute):
         """
@@ -1625,15 +2045,16 @@ class Client:
 
             api.mute_conference('conferenceId', True)
         """
-        self.update_conference(conference_id, mute=mute)
+        return self.update_conference(conference_id, mute=mute)
 
-    def list_recordings(self, size=None, **kwargs):
+    def list_recordings(self, size=None, cursor=None, **kwargs):
         """
         Get a list of call recordings
 
         :param int size: Used for pagination to indicate the size of each page requested for querying a list
             of items. If no value is specified the default value is 25. (Maximum value 1000)
-        :rtype: types.GeneratorType
+        :param dict cursor: position to resume the list from (field ``cursor`` of previously returned list)
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of recordings
 
         Example: List all recordings::
@@ -1663,8 +2084,9 @@ class Client:
         """
         kwargs['size'] = size
         path = '/users/%s/recordings' % self.user_id
-        return lazy_map(_set_media_name,
-                        get_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs)))
+        media_name_key = self._response_key('media_name')
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path, params=kwargs), cursor,
+                                   lambda recording: _set_media_name(recording, media_name_key))
 
     def get_recording(self, recording_id):
         """
@@ -1692,9 +2114,9 @@ class Client:
             ## }
         """
         path = '/users/%s/recordings/%s' % (self.user_id, recording_id)
-        return _set_media_name(self._make_request('get', path)[0])
+        return _set_media_name(self._make_request('get', path)[0], self._response_key('media_name'))
 
-    def list_transcriptions(self, recording_id, size=None, **kwargs):
+    def list_transcriptions(self, recording_id, size=None, cursor=None, **kwargs):
         """
         Get a list of transcriptions
 
@@ -1702,7 +2124,8 @@ class Client:
         :param recording_id: id of a recording
         :param int size: Used for pagination to indicate the size of each page requested for querying a list
             of items. If no value is specified the default value is 25. (Maximum value 1000)
-        :rtype: types.GeneratorType
+        :param dict cursor: position to resume the list from (field ``cursor`` of previously returned list)
+        :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
         :returns: list of transcriptions
 
         Example: Print off all transcriptions for a recording::
@@ -1733,7 +2156,7 @@ class Client:
         kwargs['size'] = size
         path = '/users/%s/recordings/%s/transcriptions' % (
             self.user_id, recording_id)
-        return get_lazy_enumerator(self, lambda: self._make_request('get', path, params=kwargs))
+        return get_lazy_enumerator(self, lambda: self._make_page_request('get', path, params=kwargs), cursor)
 
     def create_transcription(self, recording_id):
         """
@@ -6,7 +6,7 @@ def play_audio(suffix):
     def add_methods(cl):
         def speak_sentence(self, id, sentence, gender='female', voice='susan', locale='en_US', tag=None):
             play_audio = getattr(self, 'play_audio_to_%s' % suffix)
-            play_audio(id, {
+            return play_audio(id, {
                 'sentence': sentence,
                 'gender': gender,
                 'voice': voice,
@@ -16,7 +16,7 @@ def play_audio(suffix):
 
         def play_audio_file(self, id, file_url, tag=None):
             play_audio = getattr(self, 'play_audio_to_%s' % suffix)
-            play_audio(id, {
+            return play_audio(id, {
                 'fileUrl': file_url,
                 'tag': tag
             })
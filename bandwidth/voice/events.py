@@ -0,0 +1,229 @@
+"""
+Events of voice callbacks
+
+:Example:
+
+    from bandwidth.voice.events import parse_event, AnswerEvent
+
+    event = parse_event(request_body)
+    if isinstance(event, AnswerEvent):
+        print(event.call_id, event.from_, event.to)
+"""
+from bandwidth import events
+from bandwidth.events import Event, Field, TimeField
+
+
+class CallEvent(Event):
+
+    """
+    Base class of events of a call
+    """
+
+    __slots__ = ()
+
+    from_ = Field('from')
+    to = Field('to')
+    call_id = Field('callId')
+    call_uri = Field('callUri')
+    call_state = Field('callState')
+    application_id = Field('applicationId')
+
+
+class IncomingCallEvent(CallEvent):
+    __slots__ = ()
+    EVENT_TYPE = 'incomingcall'
+
+
+class AnswerEvent(CallEvent):
+    __slots__ = ()
+    EVENT_TYPE = 'answer'
+
+
+class HangupEvent(CallEvent):
+    __slots__ = ()
+    EVENT_TYPE = 'hangup'
+
+    cause = Field('cause')
+
+
+class TimeoutEvent(CallEvent):
+    __slots__ = ()
+    EVENT_TYPE = 'timeout'
+
+
+class RejectEvent(CallEvent):
+    __slots__ = ()
+    EVENT_TYPE = 'reject'
+
+    cause = Field('cause')
+
+
+class TransferCompleteEvent(CallEvent):
+    __slots__ = ()
+    EVENT_TYPE = 'transferComplete'
+
+
+class GatherEvent(CallEvent):
+    __slots__ = ()
+    EVENT_TYPE = 'gather'
+
+    gather_id = Field('gatherId')
+    digits = Field('digits')
+    reason = Field('reason')
+    state = Field('state')
+
+
+class DtmfEvent(CallEvent):
+    __slots__ = ()
+    EVENT_TYPE = 'dtmf'
+
+    dtmf_digit = Field('dtmfDigit')
+    dtmf_duration = Field('dtmfDuration', int)
+
+
+class SpeakEvent(CallEvent):
+    __slots__ = ()
+    EVENT_TYPE = 'speak'
+
+    status = Field('status')
+    state = Field('state')
+
+
+class PlaybackEvent(CallEvent):
+    __slots__ = ()
+    EVENT_TYPE = 'playback'
+
+    status = Field('status')
+
+
+class RecordingEvent(CallEvent):
+    __slots__ = ()
+    EVENT_TYPE = 'recording'
+
+    recording_id = Field('recordingId')
+    recording_uri = Field('recordingUri')
+    state = Field('state')
+    status = Field('status')
+    start_time = TimeField('startTime')
+    end_time = TimeField('endTime')
+
+    @property
+    def media_name(self):
+        """
+        Name of media file of the recording (it can be downloaded by account client)
+        """
+        return (self.data.get('media') or '').split('/')[-1] or None
+
+
+class TranscriptionEvent(CallEvent):
+    __slots__ = ()
+    EVENT_TYPE = 'transcription'
+
+    transcription_id = Field('transcriptionId')
+    transcription_uri = Field('transcriptionUri')
+    recording_id = Field('recordingId')
+    recording_uri = Field('recordingUri')
+    state = Field('state')
+    status = Field('status')
+    text = Field('text')
+    text_size = Field('textSize', int)
+    text_url = Field('textUrl')
+
+
+class ConferenceEvent(Event):
+    __slots__ = ()
+    EVENT_TYPE = 'conference'
+
+    conference_id = Field('conferenceId')
+    conference_uri = Field('conferenceUri')
+    status = Field('status')
+    created_time = TimeField('createdTime')
+    completed_time = TimeField('completedTime')
+    active_members = Field('activeMembers', int)
+
+
+class ConferenceMemberEvent(Event):
+    __slots__ = ()
+    EVENT_TYPE = 'conference-member'
+
+    conference_id = Field('conferenceId')
+    member_id = Field('memberId')
+    member_uri = Field('memberUri')
+    call_id = Field('callId')
+    state = Field('state')
+    active_members = Field('activeMembers', int)
+
+
+class ConferencePlaybackEvent(Event):
+    __slots__ = ()
+    EVENT_TYPE = 'conference-playback'
+
+    conference_id = Field('conferenceId')
+    conference_uri = Field('conferenceUri')
+    status = Field('status')
+
+
+class ConferenceSpeakEvent(Event):
+    __slots__ = ()
+    EVENT_TYPE = 'conference-speak'
+
+    conference_id = Field('conferenceId')
+    conference_uri = Field('conferenceUri')
+    status = Field('status')
+
+
+EVENT_CLASSES = events.get_event_classes(
+    IncomingCallEvent, AnswerEvent, HangupEvent, TimeoutEvent, RejectEvent, TransferCompleteEvent, GatherEvent,
+    DtmfEvent, SpeakEvent, PlaybackEvent, RecordingEvent, TranscriptionEvent, ConferenceEvent,
+    ConferenceMemberEvent, ConferencePlaybackEvent, ConferenceSpeakEvent)
+
+
+def parse_event(body, state_mirror=None):
+    """
+    Parses body of voice callback to an event
+
+    :type body: str or bytes or dict
+    :param body: JSON text of callback or decoded JSON
+    :type state_mirror: bandwidth.voice.state.StateMirror
+    :param state_mirror: mirror of state to update by the event (optional)
+
+    :rtype: bandwidth.events.Event
+    :returns: event of class by its event type (base class Event for unknown event types)
+    """
+    event = events.parse_event(body, EVENT_CLASSES)
+    if state_mirror is not None:
+        state_mirror.apply_event(event)
+    return event
+
+
+class EventDispatcher(events.EventDispatcher):
+
+    """
+    Calls handlers of voice callback events by their event types
+
+    :Example:
+
+        dispatcher = EventDispatcher(state_mirror=api.state_mirror)
+
+        @dispatcher.on('answer')
+        def on_answer(event):
+            return Response(SpeakSentence('Hello')).to_xml()
+
+        xml = dispatcher.dispatch(request_body)
+    """
+
+    event_classes = EVENT_CLASSES
+
+    def __init__(self, event_classes=None, default=None, state_mirror=None):
+        """
+        Initialize the dispatcher.
+        :type state_mirror: bandwidth.voice.state.StateMirror
+        :param state_mirror: mirror of state to update by events before calling handlers (optional)
+        """
+        super(EventDispatcher, self).__init__(event_classes, default)
+        self.state_mirror = state_mirror
+
+    def handle(self, event):
+        if self.state_mirror is not None:
+            self.state_mirror.apply_event(event)
+        return super(EventDispatcher, self).handle(event)
@@ -1,30 +1,214 @@
+import threading
+from six.moves import queue
 
-def get_lazy_enumerator(client, get_first_page):
+
+def get_next_page_url(response):
+    """
+    Extracts url of next page of data from "link" header of response
+    :type response: requests.Response
+    :param response: api response
+
+    :rtype: str
+    :returns: url of next page or empty string if it is last page
+    """
+    links = response.headers.get('link', '').split(',')
+    for link in links:
+        values = link.split(';')
+        if len(values) == 2 and values[1].strip() == 'rel="next"':
+            return values[0].replace('<', ' ').replace('>', ' ').strip()
+    return ''
+
+
+def get_lazy_enumerator(client, get_first_page, cursor=None, convert_item=None):
     """
     Returns api results as "lazy" collection.
     Makes api requests for new parts of data on demand only.
+    If client option ``prefetch_pages`` is set next pages are requested in background
+    while current page is being consumed (see get_prefetching_lazy_enumerator()).
     :type client: bandwidth.catapult.Client
     :param client: catapult client
     :type get_first_page: types.FunctionType
     :param get_first_page: function which returns contane of first part (page) of data
+    :type cursor: dict
+    :param cursor: position to resume the collection from (field ``cursor`` of a previous lazy collection)
+    :type convert_item: types.FunctionType
+    :param convert_item: function which is applied to each item (optional)
 
-    :rtype: types.GeneratorType
+    :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
     :returns: lazy collection
     """
+    prefetch_pages = getattr(client, 'prefetch_pages', 0)
+    if prefetch_pages:
+        return get_prefetching_lazy_enumerator(client, get_first_page, prefetch_pages, cursor, convert_item)
+    return LazyEnumerator(_get_pages(client, get_first_page, cursor), cursor, convert_item)
+
+
+class LazyEnumerator(object):
+
+    """
+    Lazy collection of api results which tracks its position.
+
+    Field ``cursor`` is a json serializable dictionary with url of the page of last returned item
+    ('url', None for first page if its url is unknown) and number of returned items of this page ('offset').
+    Pass it as argument ``cursor`` of the same list method to continue the list after last returned item.
+
+    Example: Export calls with checkpoints::
+
+        calls = api.list_calls(size=1000, cursor=load_checkpoint())
+        for call in calls:
+            export(call)
+            save_checkpoint(calls.cursor)
+    """
+
+    def __init__(self, pages, cursor=None, convert_item=None):
+        self.cursor = cursor
+        self._convert_item = convert_item
+        self._items = self._get_items(pages, cursor['offset'] if cursor else 0)
+
+    def _get_items(self, pages, skip):
+        try:
+            for page in pages:
+                url, items, _ = page
+                try:
+                    offset = 0
+                    for item in items:
+                        offset += 1
+                        if offset <= skip:
+                            continue
+                        self.cursor = {'url': url, 'offset': offset}
+                        yield item if self._convert_item is None else self._convert_item(item)
+                    skip = 0
+                finally:
+                    _close_page(page)
+        finally:
+            pages.close()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._items)
+
+    next = __next__
+
+    def close(self):
+        """
+        Stops the enumeration (and background requests of next pages)
+        """
+        self._items.close()
+
+
+def _close_page(page):
+    # streamed pages (see client option stream_pages) hold open responses until their items are read
+    _, items, response = page
+    close = getattr(items, 'close', None)
+    if close is not None:
+        close()
+        response.close()
+
+
+def _get_pages(client, get_first_page, cursor=None):
+    # yields urls, items and responses of pages starting from the page of the cursor
+    url = cursor and cursor.get('url')
     get_data = get_first_page
+    if url:
+        def get_data():
+            return client._make_page_request('get', url)
     while True:
         items, response, _ = get_data()
-        next_page_url = ''
-        for item in items:
-            yield item
-        links = response.headers.get('link', '').split(',')
-        for link in links:
-            values = link.split(';')
-            if len(values) == 2 and values[1].strip() == 'rel="next"':
-                next_page_url = values[0].replace('<', ' ').replace('>', ' ').strip()
-                break
-        if len(next_page_url) == 0:
+        yield url or response.url, items, response
+        url = get_next_page_url(response)
+        if len(url) == 0:
             break
 
-        def get_data():
-            return client._make_request('get', next_page_url)
+        def get_data(url=url):
+            return client._make_page_request('get', url)
+
+
+class _PageError(object):
+
+    def __init__(self, error):
+        self.error = error
+
+
+_LAST_PAGE = object()
+
+
+def get_prefetching_lazy_enumerator(client, get_first_page, max_pages=1, cursor=None, convert_item=None):
+    """
+    Returns api results as "lazy" collection which requests next page in background thread
+    while current page is being consumed.
+    :type client: bandwidth.catapult.Client
+    :param client: catapult client
+    :type get_first_page: types.FunctionType
+    :param get_first_page: function which returns contane of first part (page) of data
+    :type max_pages: int
+    :param max_pages: max number of fetched pages waiting to be consumed
+    :type cursor: dict
+    :param cursor: position to resume the collection from (field ``cursor`` of a previous lazy collection)
+    :type convert_item: types.FunctionType
+    :param convert_item: function which is applied to each item (optional)
+
+    :rtype: bandwidth.voice.lazy_enumerable.LazyEnumerator
+    :returns: lazy collection
+
+    Example: Export all messages with prefetching::
+
+        api = bandwidth.client('messaging', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET',
+                               prefetch_pages=2)
+        for message in api.list_messages(size=1000):
+            print(message['id'])
+    """
+    pages = _get_prefetched_pages(_get_pages(client, get_first_page, cursor), max_pages)
+    return LazyEnumerator(pages, cursor, convert_item)
+
+
+def _get_prefetched_pages(source_pages, max_pages):
+    pages = queue.Queue(maxsize=max_pages)
+    stopped = threading.Event()
+
+    def put(page):
+        while not stopped.is_set():
+            try:
+                pages.put(page, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+        if isinstance(page, tuple):
+            _close_page(page)
+
+    def close_pending_pages():
+        # pages which have been fetched but will not be consumed
+        while True:
+            try:
+                page = pages.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(page, tuple):
+                _close_page(page)
+
+    def fetch_pages():
+        try:
+            for page in source_pages:
+                put(page)
+                if stopped.is_set():
+                    close_pending_pages()
+                    return
+            put(_LAST_PAGE)
+        except Exception as e:
+            put(_PageError(e))
+
+    thread = threading.Thread(target=fetch_pages)
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            page = pages.get()
+            if page is _LAST_PAGE:
+                break
+            if isinstance(page, _PageError):
+                raise page.error
+            yield page
+    finally:
+        stopped.set()
+        close_pending_pages()
@@ -0,0 +1,74 @@
+from bandwidth.cache import TTLCache
+from bandwidth.convert_camel import convert_string_to_snake_case
+from bandwidth.voice.events import CallEvent, ConferenceEvent
+
+
+class StateMirror(object):
+
+    """
+    Local copy of fields of calls, bridges and conferences
+
+    Fields are updated by results of ``get_*()`` and successful ``update_*()`` calls of the voice client
+    and by callback events. Each field is fresh during time to live since its last update.
+
+    :Example:
+
+        api = bandwidth.client('voice', 'YOUR_USER_ID', 'YOUR_API_TOKEN', 'YOUR_API_SECRET', mirror_state=True)
+        dispatcher = EventDispatcher(state_mirror=api.state_mirror)
+        ...
+        if api.state_mirror.get('call', call_id, 'state') == 'active':
+            api.speak_sentence_to_call(call_id, 'Hello')
+    """
+
+    def __init__(self, ttl=30, max_size=10000):
+        """
+        Initialize the mirror.
+        :type ttl: float
+        :param ttl: time in seconds while a field is fresh (optional, default value is 30)
+        :type max_size: int
+        :param max_size: max number of stored fields, least recently used fields are evicted
+            (optional, default value is 10000)
+        """
+        self._fields = TTLCache(ttl, max_size)
+
+    def update(self, resource, id, fields):
+        """
+        Stores fields of an object (fields with None values are ignored)
+
+        :type resource: str
+        :param resource: 'call', 'bridge' or 'conference'
+        :type id: str
+        :param id: id of the object
+        :type fields: dict
+        :param fields: fields with names in camelCase or snake_case
+        """
+        for name, value in fields.items():
+            if value is not None:
+                self._fields.set((resource, id, convert_string_to_snake_case(name)), value)
+
+    def get(self, resource, id, field, default=None):
+        """
+        Returns fresh value of a field or default value if the field is unknown or stale
+
+        :type field: str
+        :param field: name of the field in snake_case
+        """
+        return self._fields.get((resource, id, field), default)
+
+    def apply_event(self, event):
+        """
+        Updates state of a call or a conference by callback event
+
+        :type event: bandwidth.events.Event
+        :param event: event of voice callback
+        """
+        if isinstance(event, CallEvent) and event.call_id and event.call_state:
+            self.update('call', event.call_id, {'state': event.call_state})
+        elif isinstance(event, ConferenceEvent) and event.conference_id and event.status:
+            self.update('conference', event.conference_id, {'state': event.status})
+
+    def clear(self):
+        """
+        Removes all fields
+        """
+        self._fields.clear()
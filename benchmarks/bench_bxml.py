@@ -0,0 +1,59 @@
+"""
+Microbenchmark of building BXML of a typical IVR callback with lxml, template and pure python builder.
+
+Run from repository root::
+
+    python -m benchmarks.bench_bxml
+"""
+from __future__ import print_function
+import subprocess
+import sys
+import timeit
+
+from lxml.builder import E
+from bandwidth.voice import bxml, bxml_builder
+
+
+def _build_with_lxml(sentence, url):
+    return bxml.Response(E.Gather(E.SpeakSentence(sentence, {'voice': 'susan'}), E.PlayAudio(url),
+                                  {'requestUrl': 'https://yoursite.com/gather', 'maxDigits': '1'}),
+                         E.Hangup()).to_xml()
+
+
+def _build_with_builder(sentence, url):
+    return bxml_builder.Response(
+        bxml_builder.Gather(bxml_builder.SpeakSentence(sentence, voice='susan'), bxml_builder.PlayAudio(url),
+                            request_url='https://yoursite.com/gather', max_digits='1'),
+        bxml_builder.Hangup()).to_xml()
+
+
+def _measure_import(module, number=5):
+    # cold import in a fresh interpreter, it includes the package bandwidth which is imported by both modules
+    code = 'import time; started = time.time(); import %s; print(time.time() - started)' % module
+    return min(float(subprocess.check_output([sys.executable, '-c', code])) for _ in range(number))
+
+
+def main(number=20000):
+    # the package (requests, dateutil, clients) dominates import time of both modules,
+    # bxml_builder only avoids loading lxml
+    for module in ('bandwidth', 'bandwidth.voice.bxml', 'bandwidth.voice.bxml_builder'):
+        print('cold import %s: %.1f ms' % (module, _measure_import(module) * 1000))
+    template = bxml.Template(E.Gather(E.SpeakSentence(bxml.slot('sentence'), {'voice': 'susan'}),
+                                      E.PlayAudio(bxml.slot('url')),
+                                      {'requestUrl': 'https://yoursite.com/gather', 'maxDigits': '1'}),
+                             E.Hangup())
+    args = ('Press 1 to talk to "sales" & 2 for support', 'https://yoursite.com/audio.mp3?lang=en&v=2')
+    candidates = [
+        ('lxml Response', lambda: _build_with_lxml(*args)),
+        ('bxml_builder Response', lambda: _build_with_builder(*args)),
+        ('Template.render', lambda: template.render(sentence=args[0], url=args[1]))
+    ]
+    expected = _build_with_lxml(*args)
+    for name, build in candidates:
+        assert build() == expected
+        elapsed = timeit.timeit(build, number=number) / number
+        print('%s: %.2f us' % (name, elapsed * 1000000))
+
+
+if __name__ == '__main__':
+    main()
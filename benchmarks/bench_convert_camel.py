@@ -0,0 +1,65 @@
+"""
+Microbenchmark of camelCase to snake_case conversion of api responses.
+
+Run from repository root::
+
+    python -m benchmarks.bench_convert_camel
+"""
+from __future__ import print_function
+import re
+import timeit
+
+from bandwidth.convert_camel import convert_object_to_snake_case, convert_object_to_key_style
+from tests.camel_test_values import before_array_dict
+
+
+def _convert_string_without_cache(s):
+    # previous implementation: compiles regex on each call
+    a = re.compile('((?<=[a-z0-9])[A-Z]|(?!^)[A-Z](?=[a-z]))')
+    return a.sub(r'_\1', s).lower()
+
+
+def _convert_without_cache(o):
+    if isinstance(o, list):
+        return [_convert_without_cache(i) for i in o]
+    elif isinstance(o, dict):
+        return dict((_convert_string_without_cache(k), _convert_without_cache(v)) for k, v in o.items())
+    return o
+
+
+def _message(i):
+    return {
+        'id': 'm-%d' % i,
+        'messageId': 'm-%d' % i,
+        'from': '+19195551212',
+        'to': '+19195551213',
+        'text': 'Message %d' % i,
+        'time': '2017-02-01T21:10:32Z',
+        'direction': 'out',
+        'state': 'sent',
+        'deliveryState': 'delivered',
+        'deliveryCode': 0,
+        'deliveryDescription': 'Message delivered to carrier',
+        'callbackUrl': 'https://yoursite.com/message',
+        'receiptRequested': 'all',
+        'skipMMSCarrierValidation': True,
+        'media': []
+    }
+
+
+def main(number=20):
+    payloads = [
+        ('camel_test_values.before_array_dict', before_array_dict),
+        ('page of 1000 messages', [_message(i) for i in range(1000)])
+    ]
+    for name, payload in payloads:
+        assert _convert_without_cache(payload) == convert_object_to_snake_case(payload)
+        before = timeit.timeit(lambda: _convert_without_cache(payload), number=number) / number
+        after = timeit.timeit(lambda: convert_object_to_snake_case(payload), number=number) / number
+        print('%s: %.3f ms -> %.3f ms (x%.1f)' % (name, before * 1000, after * 1000, before / after))
+        lazy = timeit.timeit(lambda: convert_object_to_key_style(payload, 'lazy_snake'), number=number) / number
+        print('%s: key_style="lazy_snake" %.3f ms' % (name, lazy * 1000))
+
+
+if __name__ == '__main__':
+    main()
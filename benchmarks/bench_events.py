@@ -0,0 +1,70 @@
+"""
+Microbenchmark of parsing of callback events compared to decoding of whole JSON with snake_case conversion.
+
+Run from repository root::
+
+    python -m benchmarks.bench_events
+"""
+from __future__ import print_function
+import json
+import timeit
+
+from bandwidth.convert_camel import convert_object_to_snake_case
+from bandwidth.voice.events import parse_event as parse_voice_event
+from bandwidth.messaging.events import parse_event as parse_messaging_event
+
+ANSWER = json.dumps({
+    'eventType': 'answer',
+    'from': '+15753222083',
+    'to': '+13865245000',
+    'callId': 'c-abc123',
+    'callUri': 'https://api.catapult.inetwork.com/v1/users/u-abc/calls/c-abc123',
+    'callState': 'active',
+    'applicationId': 'a-abc123',
+    'time': '2017-01-26T16:10:11Z',
+    'tag': 'tag1'
+}).encode('utf-8')
+
+SMS = json.dumps({
+    'eventType': 'sms',
+    'direction': 'in',
+    'messageId': 'm-abc123',
+    'messageUri': 'https://api.catapult.inetwork.com/v1/users/u-abc/messages/m-abc123',
+    'from': '+13233326955',
+    'to': '+13865245000',
+    'text': 'Hello',
+    'applicationId': 'a-abc123',
+    'state': 'received',
+    'time': '2017-01-26T16:10:11Z'
+}).encode('utf-8')
+
+
+def _handle_with_dict(body):
+    data = convert_object_to_snake_case(json.loads(body.decode('utf-8')))
+    return data['event_type'], data['call_id'] if 'call_id' in data else data['message_id']
+
+
+def _handle_voice_event(body):
+    event = parse_voice_event(body)
+    return event.event_type, event.call_id
+
+
+def _handle_messaging_event(body):
+    event = parse_messaging_event(body)
+    return event.event_type, event.message_id
+
+
+def main(number=100000):
+    candidates = [
+        ('answer', ANSWER, _handle_voice_event),
+        ('sms', SMS, _handle_messaging_event)
+    ]
+    for name, body, handle in candidates:
+        assert handle(body) == _handle_with_dict(body)
+        before = timeit.timeit(lambda: _handle_with_dict(body), number=number)
+        after = timeit.timeit(lambda: handle(body), number=number)
+        print('%s: %d -> %d events/s' % (name, number / before, number / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -19,7 +19,7 @@ setup(
     maintainer_email='dtolb@bandwidth.com',
     url='https://github.com/bandwidth/python-bandwidth',
     license='MIT',
-    packages=find_packages(exclude=['tests*']),
+    packages=find_packages(exclude=['tests*', 'benchmarks*']),
     long_description="Bandwidth Python API",
     classifiers=[
         'License :: OSI Approved :: Apache Software License',
@@ -33,6 +33,11 @@ setup(
         'requests',
         'python-dateutil',
         'six',
-        'lxml'
+        'lxml',
+        'futures; python_version < "3.2"'
     ],
+    extras_require={
+        'async': ['aiohttp'],
+        'streaming': ['ijson']
+    },
 )
@@ -20,7 +20,7 @@ class AccountTests(unittest.TestCase):
         estimated_json = """
         {"balance": "538.37250","accountType":"pre-pay"}
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = client.get_account()
             p.assert_called_with(
@@ -55,7 +55,7 @@ class AccountTests(unittest.TestCase):
                 }
             ]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = list(client.list_account_transactions())
             p.assert_called_with(
@@ -32,7 +32,7 @@ class ApplicationTests(unittest.TestCase):
             "autoAnswer": true
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = list(client.list_applications())
             p.assert_called_with(
@@ -61,7 +61,7 @@ class ApplicationTests(unittest.TestCase):
         }
         estimated_response = create_response(201)
         estimated_response.headers['Location'] = 'http://localhost/applicationId'
-        with patch('requests.request', return_value=estimated_response) as p:
+        with patch('requests.Session.request', return_value=estimated_response) as p:
             client = get_client()
             id = client.create_application(name='MyFirstApp')
             p.assert_called_with(
@@ -85,7 +85,7 @@ class ApplicationTests(unittest.TestCase):
             "autoAnswer": true
         }
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = client.get_application('applicationId')
             p.assert_called_with(
@@ -112,7 +112,7 @@ class ApplicationTests(unittest.TestCase):
         }
         estimated_response = create_response(201)
         estimated_response.headers['Location'] = 'http://localhost/applicationId'
-        with patch('requests.request', return_value=estimated_response) as p:
+        with patch('requests.Session.request', return_value=estimated_response) as p:
             client = get_client()
             id = client.update_application(app_id='a-123', name='MyUpdatedApplication')
             p.assert_called_with(
@@ -126,7 +126,7 @@ class ApplicationTests(unittest.TestCase):
         """
         delete_application() should remove an application
         """
-        with patch('requests.request', return_value=create_response(200)) as p:
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
             client = get_client()
             client.delete_application('applicationId')
             p.assert_called_with(
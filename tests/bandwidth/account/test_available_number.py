@@ -39,7 +39,7 @@ class AvailableNumberTests(unittest.TestCase):
             "price": "0.60"
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = client.search_available_local_numbers(quantity=1)
             p.assert_called_with(
@@ -66,7 +66,7 @@ class AvailableNumberTests(unittest.TestCase):
         "price": "0.75"
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = client.search_available_toll_free_numbers(quantity=1, pattern='*456')
             p.assert_called_with(
@@ -98,7 +98,7 @@ class AvailableNumberTests(unittest.TestCase):
         "location": "https://.../v1/users/.../phoneNumbers/{numberId1}"
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = client.search_and_order_local_numbers(zip_code='27606', quantity=1)
             p.assert_called_with(
@@ -123,7 +123,7 @@ class AvailableNumberTests(unittest.TestCase):
         "location": "https://.../v1/users/.../phoneNumbers/{numberId1}"
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = client.search_and_order_toll_free_numbers(quantity=1)
             p.assert_called_with(
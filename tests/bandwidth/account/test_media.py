@@ -1,16 +1,21 @@
+import io
+import os
+import shutil
+import tempfile
 import unittest
 import six
 import requests
 from tests.bandwidth.helpers import get_account_client as get_client
 from tests.bandwidth.helpers import create_response, AUTH, headers
 if six.PY3:
-    from unittest.mock import patch, MagicMock
+    from unittest.mock import patch, MagicMock, ANY, call
     builtins = 'builtins'
 else:
-    from mock import patch, MagicMock
+    from mock import patch, MagicMock, ANY, call
     builtins = '__builtin__'
 
 from bandwidth.voice import Client
+from bandwidth.media import UploadStream
 
 
 class MediaTests(unittest.TestCase):
@@ -24,7 +29,7 @@ class MediaTests(unittest.TestCase):
             "mediaName": "file1"
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = list(client.list_media_files())
             p.assert_called_with(
@@ -38,7 +43,7 @@ class MediaTests(unittest.TestCase):
         """
         upload_media_file() should upload file
         """
-        with patch('requests.request', return_value=create_response(200)) as p:
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
             upload_headers = {
                 'content-type': 'application/octet-stream',
                 'User-Agent': headers['User-Agent']
@@ -52,21 +57,23 @@ class MediaTests(unittest.TestCase):
         """
         upload_media_file() should upload file by file path
         """
-        with patch('requests.request', return_value=create_response(200)) as p:
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
             upload_headers = {
                 'content-type': 'application/octet-stream',
                 'User-Agent': headers['User-Agent']
             }
             client = get_client()
-            mock_file_object = MagicMock()
-            mock_close = MagicMock()
-            setattr(mock_file_object, 'close', mock_close)
-            with patch('%s.open' % builtins, return_value=mock_file_object) as f:
+            file_object = io.BytesIO(b'content')
+            with patch('%s.open' % builtins, return_value=file_object) as f:
                 client.upload_media_file('file1', file_path='/path/to/file1')
                 p.assert_called_with('put', 'https://api.catapult.inetwork.com/v1/users/userId/media/file1', auth=AUTH,
-                                     data=mock_file_object, headers=upload_headers)
+                                     data=ANY, headers=upload_headers)
+                data = p.call_args[1]['data']
+                self.assertIsInstance(data, UploadStream)
+                self.assertIs(file_object, data.fileobj)
+                self.assertEqual(7, len(data))
                 f.assert_called_with('/path/to/file1', 'rb')
-                self.assertTrue(mock_close.called)
+                self.assertTrue(file_object.closed)
 
     def test_download_media_file(self):
         """
@@ -74,7 +81,7 @@ class MediaTests(unittest.TestCase):
         """
         estimated_response = create_response(200, '123', 'text/plain')
         estimated_response.raw = MagicMock()
-        with patch('requests.request', return_value=estimated_response) as p:
+        with patch('requests.Session.request', return_value=estimated_response) as p:
             client = get_client()
             content, content_type = client.download_media_file('file1')
             p.assert_called_with(
@@ -90,7 +97,7 @@ class MediaTests(unittest.TestCase):
         """
         delete_media_file() should remove a media file
         """
-        with patch('requests.request', return_value=create_response(200)) as p:
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
             client = get_client()
             client.delete_media_file('file1')
             p.assert_called_with(
@@ -98,3 +105,142 @@ class MediaTests(unittest.TestCase):
                 'https://api.catapult.inetwork.com/v1/users/userId/media/file1',
                 headers=headers,
                 auth=AUTH)
+
+    def test_upload_media_file_with_progress(self):
+        """
+        upload_media_file() should read file by chunks and report progress
+        """
+        def send(method, url, data=None, **kwargs):
+            while len(data.read(8192)) > 0:
+                pass
+            return create_response(200)
+
+        progress = MagicMock()
+        with patch('requests.Session.request', side_effect=send):
+            client = get_client()
+            client.upload_media_file('file1', io.BytesIO(b'0123456789'), chunk_size=4, progress=progress)
+            progress.assert_called_with('file1', 10, 10)
+            self.assertEqual(3, progress.call_count)
+
+    def test_upload_media_files(self):
+        """
+        upload_media_files() should upload all files of a directory and return their checksums
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            for name, content in (('a.wav', b'aaa'), ('b.txt', b'bbbb')):
+                with open(os.path.join(directory, name), 'wb') as f:
+                    f.write(content)
+            os.mkdir(os.path.join(directory, 'subdir'))
+
+            def send(method, url, data=None, headers=None, **kwargs):
+                data.read()
+                if url.endswith('b.txt'):
+                    return create_response(400, 'error', 'text/plain')
+                return create_response(200)
+
+            with patch('requests.Session.request', side_effect=send) as p:
+                client = get_client()
+                results = client.upload_media_files(directory, concurrency=2)
+                self.assertEqual(2, p.call_count)
+                self.assertEqual(['a.wav', 'b.txt'], [r['media_name'] for r in results])
+                self.assertEqual(3, results[0]['size'])
+                self.assertEqual('47bce5c74f589f4867dbd57e9ca9f808', results[0]['md5'])
+                self.assertIsNone(results[0]['error'])
+                self.assertIsNotNone(results[1]['error'])
+                wav_call = [c for c in p.call_args_list if c[0][1].endswith('a.wav')][0]
+                self.assertIn(wav_call[1]['headers']['content-type'], ('audio/wav', 'audio/x-wav'))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_download_media_files(self):
+        """
+        download_media_files() should skip downloaded files, resume partial downloads and download new files
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(directory, 'done.txt'), 'wb') as f:
+                f.write(b'123')
+            with open(os.path.join(directory, 'part.txt.part'), 'wb') as f:
+                f.write(b'abc')
+
+            def send(method, url, headers=None, **kwargs):
+                if method == 'head':
+                    response = create_response(200)
+                    response.headers['content-length'] = '3'
+                    return response
+                response = create_response(206 if headers.get('Range') else 200)
+                if url.endswith('part.txt'):
+                    self.assertEqual('bytes=3-', headers['Range'])
+                    response.raw = io.BytesIO(b'def')
+                else:
+                    self.assertNotIn('Range', headers)
+                    response.raw = io.BytesIO(b'0123456789')
+                return response
+
+            progress = MagicMock()
+            with patch('requests.Session.request', side_effect=send):
+                client = get_client()
+                report = client.download_media_files(['done.txt', 'part.txt', 'new.txt'], directory, chunk_size=4,
+                                                     progress=progress)
+            self.assertEqual(['skipped', 'resumed', 'downloaded'], [f['status'] for f in report['files']])
+            self.assertEqual(13, report['bytes'])
+            progress.assert_any_call('new.txt', 10)
+            with open(os.path.join(directory, 'part.txt'), 'rb') as f:
+                self.assertEqual(b'abcdef', f.read())
+            with open(os.path.join(directory, 'new.txt'), 'rb') as f:
+                self.assertEqual(b'0123456789', f.read())
+            self.assertFalse(os.path.exists(os.path.join(directory, 'part.txt.part')))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_download_media_files_with_resumed_progress(self):
+        """
+        download_media_files() should report progress of resumed download from the start of the file
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(directory, 'file1.part'), 'wb') as f:
+                f.write(b'0123')
+            response = create_response(206)
+            response.raw = io.BytesIO(b'456789')
+            progress = MagicMock()
+            with patch('requests.Session.request', return_value=response):
+                client = get_client()
+                report = client.download_media_files(['file1'], directory, chunk_size=4, progress=progress)
+            self.assertEqual('resumed', report['files'][0]['status'])
+            self.assertEqual(6, report['bytes'])
+            self.assertEqual([call('file1', 8), call('file1', 10)], progress.call_args_list)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_download_media_files_with_error(self):
+        """
+        download_media_files() should report failed downloads
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            with patch('requests.Session.request', return_value=create_response(404, 'not found', 'text/plain')):
+                client = get_client()
+                report = client.download_media_files(['file1'], directory)
+            self.assertIsNone(report['files'][0]['status'])
+            self.assertIsNotNone(report['files'][0]['error'])
+            self.assertEqual(0, report['bytes'])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_download_media_files_with_invalid_name(self):
+        """
+        download_media_files() should not write files outside of the directory
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            with patch('requests.Session.request') as p:
+                client = get_client()
+                report = client.download_media_files(['../file1', '..', 'dir/file2'], directory)
+                p.assert_not_called()
+            for result in report['files']:
+                self.assertIsInstance(result['error'], ValueError)
+            self.assertEqual([], os.listdir(directory))
+        finally:
+            shutil.rmtree(directory)
@@ -9,6 +9,7 @@ else:
     from mock import patch
 
 from bandwidth.voice import Client
+from bandwidth.account import Client as AccountClient, BandwidthAccountAPIException
 
 
 class NumberInfoTests(unittest.TestCase):
@@ -25,7 +26,7 @@ class NumberInfoTests(unittest.TestCase):
         "updated": "2013-09-23T16:42:18Z"
         }
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = client.get_number_info('1234567890')
             p.assert_called_with(
@@ -34,3 +35,35 @@ class NumberInfoTests(unittest.TestCase):
                 headers=headers,
                 auth=AUTH)
             self.assertEqual('Name', data['name'])
+
+    def test_get_number_info_many(self):
+        """
+        get_number_info_many() should request each unique number once and return information of all numbers
+        """
+        def get_info(method, url, *args, **kwargs):
+            number = url.split('/')[-1]
+            if number == '111':
+                return create_response(404, '{"message": "Not found"}')
+            return create_response(200, '{"number": "%s"}' % number)
+
+        with patch('requests.Session.request', side_effect=get_info) as p:
+            client = get_client()
+            data = client.get_number_info_many(['+1234567890', '%2B1234567890', ' 111', '222'], concurrency=2)
+            self.assertEqual(3, p.call_count)
+            self.assertEqual('%2B1234567890', data['+1234567890']['number'])
+            self.assertEqual(data['+1234567890'], data['%2B1234567890'])
+            self.assertIsNot(data['+1234567890'], data['%2B1234567890'])
+            self.assertIsInstance(data[' 111'], BandwidthAccountAPIException)
+            self.assertEqual('222', data['222']['number'])
+
+    def test_get_number_info_many_with_cache(self):
+        """
+        get_number_info_many() should not request cached numbers
+        """
+        with patch('requests.Session.request', return_value=create_response(200, '{"name": "Name"}')) as p:
+            client = AccountClient('userId', 'apiToken', 'apiSecret', cache_ttls={'number_info': 60})
+            client.get_number_info('222')
+            data = client.get_number_info_many(['222', '333'])
+            self.assertEqual(2, p.call_count)
+            self.assertEqual('https://api.catapult.inetwork.com/v1/phoneNumbers/numberInfo/333', p.call_args[0][1])
+            self.assertEqual({'222': {'name': 'Name'}, '333': {'name': 'Name'}}, data)
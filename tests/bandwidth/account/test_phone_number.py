@@ -38,7 +38,7 @@ class PhoneNumberTests(unittest.TestCase):
         "numberState": "enabled"
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = list(client.list_phone_numbers())
             p.assert_called_with(
@@ -61,7 +61,7 @@ class PhoneNumberTests(unittest.TestCase):
             'applicationId': None,
             'fallbackNumber': None
         }
-        with patch('requests.request', return_value=estimated_response) as p:
+        with patch('requests.Session.request', return_value=estimated_response) as p:
             client = get_client()
             data = {'name': 'MyFirstNumber', 'number': '+1234567890'}
             id = client.order_phone_number(**data)
@@ -90,7 +90,7 @@ class PhoneNumberTests(unittest.TestCase):
         "numberState": "enabled"
         }
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = client.get_phone_number('numberId')
             p.assert_called_with(
@@ -104,7 +104,7 @@ class PhoneNumberTests(unittest.TestCase):
         """
         delete_phone_number() should remove a number
         """
-        with patch('requests.request', return_value=create_response(200)) as p:
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
             client = get_client()
             client.delete_phone_number('numberId')
             p.assert_called_with(
@@ -122,7 +122,7 @@ class PhoneNumberTests(unittest.TestCase):
             'applicationId': 'appId',
             'fallbackNumber': None
         }
-        with patch('requests.request', return_value=create_response(200)) as p:
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
             client = get_client()
             data = {'application_id': 'appId'}
             client.update_phone_number('numberId', **data)
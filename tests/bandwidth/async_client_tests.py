@@ -0,0 +1,444 @@
+"""
+Tests of async clients. Python 3.8+ only, the module is imported by test_async_client on supported interpreters.
+"""
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+import bandwidth
+from tests.bandwidth.helpers import create_response, AUTH, headers
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from bandwidth.voice import Client as VoiceClient
+from bandwidth.account import Client as AccountClient
+from bandwidth.messaging import Client as MessagingClient
+from bandwidth.metrics import MetricsRecorder
+from bandwidth.async_transport import AsyncTransport, AsyncResponse
+from bandwidth.async_archive import async_archive_recordings
+from bandwidth.async_sharding import async_list_sharded
+from bandwidth.retry import RetryPolicy
+from bandwidth.voice.async_client_module import AsyncClient as AsyncVoiceClient
+from bandwidth.account.async_client_module import AsyncClient as AsyncAccountClient
+from bandwidth.messaging.async_client_module import AsyncClient as AsyncMessagingClient
+
+# sync methods which don't make requests or call other methods only, they are inherited by async clients
+DELEGATING_METHODS = [
+    'answer_call', 'reject_call', 'hangup_call', 'enable_call_recording', 'disable_call_recording',
+    'transfer_call', 'speak_sentence_to_conference_member', 'play_audio_file_to_conference_member',
+    'remove_conference_member', 'hold_conference_member', 'mute_conference_member', 'terminate_conference',
+    'remove_conference_members', 'hold_conference_members', 'mute_conference_members',
+    'hold_conference', 'mute_conference', 'speak_sentence_to_call', 'play_audio_file_to_call',
+    'speak_sentence_to_bridge', 'play_audio_file_to_bridge', 'speak_sentence_to_conference',
+    'play_audio_file_to_conference', 'build_sentence', 'build_audio_playback', 'close', 'with_key_style',
+    'clear_cache'
+]
+
+
+def collect(items):
+    async def _collect():
+        return [item async for item in items]
+    return asyncio.run(_collect())
+
+
+class AsyncClientTests(unittest.TestCase):
+
+    def test_client_with_async_mode(self):
+        """
+        client() should return async clients for mode 'async'
+        """
+        self.assertIsInstance(bandwidth.client('voice', 'userId', 'token', 'secret', mode='async'),
+                              AsyncVoiceClient)
+        self.assertIsInstance(bandwidth.client('account', 'userId', 'token', 'secret', mode='async'),
+                              AsyncAccountClient)
+        self.assertIsInstance(bandwidth.client('messaging', 'userId', 'token', 'secret', mode='async'),
+                              AsyncMessagingClient)
+        with self.assertRaises(ValueError):
+            bandwidth.client('voice', 'userId', 'token', 'secret', mode='threads')
+
+    def test_all_methods_are_mirrored(self):
+        """
+        async clients should override all sync methods which make requests
+        """
+        for sync_class, async_class in ((VoiceClient, AsyncVoiceClient), (AccountClient, AsyncAccountClient),
+                                        (MessagingClient, AsyncMessagingClient)):
+            for name in dir(sync_class):
+                if name.startswith('_') or name in DELEGATING_METHODS:
+                    continue
+                self.assertTrue(name in async_class.__dict__, '%s.%s is not mirrored' % (async_class.__module__, name))
+
+    def test_get_call(self):
+        """
+        get_call() should be a coroutine which returns call data
+        """
+        with patch.object(AsyncTransport, 'request',
+                          new=AsyncMock(return_value=create_response(200, '{"id": "callId"}'))) as p:
+            client = AsyncVoiceClient('userId', 'apiToken', 'apiSecret')
+            data = asyncio.run(client.get_call('callId'))
+            p.assert_called_with('get', 'https://api.catapult.inetwork.com/v1/users/userId/calls/callId',
+                                 auth=AUTH, headers=headers)
+            self.assertEqual('callId', data['id'])
+
+    def test_get_call_with_metrics(self):
+        """
+        async client should pass metrics of each request to its metrics sink
+        """
+        recorder = MetricsRecorder()
+        with patch.object(AsyncTransport, 'request',
+                          new=AsyncMock(return_value=create_response(200, '{"id": "callId"}'))):
+            client = AsyncVoiceClient('userId', 'apiToken', 'apiSecret', metrics=recorder)
+            asyncio.run(client.get_call('callId'))
+        stats = recorder.stats()[('get', '/users/{id}/calls/{id}')]
+        self.assertEqual(1, stats['count'])
+        self.assertEqual(16, stats['payload_size'])
+
+    def test_answer_call(self):
+        """
+        answer_call() inherited from sync client should return awaitable result of update_call()
+        """
+        response = create_response(200)
+        response.headers['location'] = 'http://localhost/callId'
+        with patch.object(AsyncTransport, 'request', new=AsyncMock(return_value=response)) as p:
+            client = AsyncVoiceClient('userId', 'apiToken', 'apiSecret')
+            self.assertEqual('callId', asyncio.run(client.answer_call('callId')))
+            self.assertEqual('active', p.call_args[1]['json']['state'])
+
+    def test_list_with_several_pages(self):
+        """
+        list_messages() should return async iterator which requests new pages on demand
+        """
+        response1 = create_response(200, '[{"id": "1"}, {"id": "2"}]')
+        response1.headers['link'] = '<messages?page=1&size=2>; rel="next"'
+        response2 = create_response(200, '[{"id": "3"}]')
+        with patch.object(AsyncTransport, 'request', new=AsyncMock(side_effect=[response1, response2])) as p:
+            client = AsyncMessagingClient('userId', 'apiToken', 'apiSecret')
+            items = client.list_messages(size=2)
+            p.assert_not_called()
+            self.assertEqual(['1', '2', '3'], [m['id'] for m in collect(items)])
+            p.assert_called_with('get', 'messages?page=1&size=2', auth=AUTH, headers=headers)
+
+    def test_list_recordings(self):
+        """
+        list_recordings() should add media names to items of async iterator
+        """
+        response = create_response(200, '[{"id": "1", "media": "http://localhost/media/file1"}]')
+        with patch.object(AsyncTransport, 'request', new=AsyncMock(return_value=response)):
+            client = AsyncVoiceClient('userId', 'apiToken', 'apiSecret')
+            self.assertEqual('file1', collect(client.list_recordings())[0]['media_name'])
+
+    def test_transport_request(self):
+        """
+        AsyncTransport.request() should skip empty params, use basic auth and read response body
+        """
+        aiohttp_response = MagicMock(status=200, headers={'content-type': 'application/json'})
+        aiohttp_response.read = AsyncMock(return_value=b'{"id": "1"}')
+        aiohttp_response.__aenter__ = AsyncMock(return_value=aiohttp_response)
+        aiohttp_response.__aexit__ = AsyncMock(return_value=None)
+        transport = AsyncTransport()
+        transport.session = MagicMock(closed=False)
+        transport.session.request = AsyncMock(return_value=aiohttp_response)
+        response = asyncio.run(transport.request('get', 'http://localhost', auth=AUTH, params={'a': 1, 'b': None}))
+        args = transport.session.request.call_args
+        self.assertEqual({'a': 1}, args[1]['params'])
+        self.assertEqual('Basic YXBpVG9rZW46YXBpU2VjcmV0', args[1]['headers']['Authorization'])
+        self.assertIsInstance(response, AsyncResponse)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({'id': '1'}, response.json())
+
+    def test_close(self):
+        """
+        close() should close own transport only
+        """
+        transport = AsyncTransport()
+        transport.close = AsyncMock()
+        client = AsyncAccountClient('userId', 'apiToken', 'apiSecret', transport=transport)
+        asyncio.run(client.close())
+        transport.close.assert_not_called()
+        client = AsyncAccountClient('userId', 'apiToken', 'apiSecret')
+        with patch.object(AsyncTransport, 'close', new=AsyncMock()) as p:
+            asyncio.run(client.close())
+            p.assert_called_with()
+
+    def test_transport_retry(self):
+        """
+        AsyncTransport.request() should retry failed requests according to retry policy
+        """
+        failed = create_response(503, '{"message": "Service unavailable"}')
+        failed.headers['retry-after'] = '1'
+        transport = AsyncTransport(retry=RetryPolicy())
+        with patch.object(AsyncTransport, '_send', new=AsyncMock(side_effect=[failed, create_response()])) as p, \
+                patch('asyncio.sleep', new=AsyncMock()) as sleep:
+            response = asyncio.run(transport.request('get', 'http://localhost'))
+            self.assertEqual(200, response.status_code)
+            self.assertEqual(2, p.call_count)
+            sleep.assert_called_with(1.0)
+
+    def test_send_messages_bulk(self):
+        """
+        send_messages_bulk() should return async iterator of results in input order
+        """
+        responses = [create_response(200, '[{"result": "accepted", "location": "http://localhost/m-%d"}]' % i)
+                     for i in range(3)]
+        with patch.object(AsyncTransport, 'request', new=AsyncMock(side_effect=responses)):
+            client = AsyncMessagingClient('userId', 'apiToken', 'apiSecret')
+            messages = [{'from': 'num1', 'to': 'num2', 'text': 'text'}] * 3
+            results = collect(client.send_messages_bulk(messages, chunk_size=1, concurrency=2))
+            self.assertEqual(['m-0', 'm-1', 'm-2'], [r['id'] for r in results])
+
+    def test_map(self):
+        """
+        map() should return async iterator of results and errors in order of arguments
+        """
+        responses = [create_response(200, '{"id": "c-1"}'), create_response(404), create_response(200, '{"id": "c-3"}')]
+        with patch.object(AsyncTransport, 'request', new=AsyncMock(side_effect=responses)):
+            client = AsyncVoiceClient('userId', 'apiToken', 'apiSecret')
+            results = collect(client.map('get_call', ['c-1', 'c-2', 'c-3'], concurrency=2))
+            self.assertEqual(['c-1', 'c-2', 'c-3'], [r['args'] for r in results])
+            self.assertEqual('c-1', results[0]['result']['id'])
+            self.assertIsNotNone(results[1]['error'])
+            self.assertEqual('c-3', results[2]['result']['id'])
+
+    def test_batch(self):
+        """
+        batch() should be async context manager which collects results of calls on exit
+        """
+        async def run(client):
+            async with client.batch(concurrency=2) as batch:
+                batch.get_call('c-1')
+                batch.get_call('c-2')
+            return batch.results
+
+        responses = [create_response(200, '{"id": "c-1"}'), create_response(200, '{"id": "c-2"}')]
+        with patch.object(AsyncTransport, 'request', new=AsyncMock(side_effect=responses)):
+            client = AsyncVoiceClient('userId', 'apiToken', 'apiSecret')
+            results = asyncio.run(run(client))
+            self.assertEqual(['c-1', 'c-2'], [r['result']['id'] for r in results])
+            self.assertEqual(('get_call', ('c-2',), {}), results[1]['args'])
+
+    def test_list_messages_sharded(self):
+        """
+        list_messages_sharded() should return async iterator of messages of all sub-ranges in order
+        """
+        def get_page(method, url, params=None, **kwargs):
+            return create_response(200, '[{"id": "%s"}]' % params['fromDateTime'])
+
+        with patch.object(AsyncTransport, 'request', new=AsyncMock(side_effect=get_page)):
+            client = AsyncMessagingClient('userId', 'apiToken', 'apiSecret')
+            messages = collect(client.list_messages_sharded('2017-01-01 00:00:00', '2017-01-01 00:00:09',
+                                                            shards=2, sort_order='desc'))
+            self.assertEqual(['2017-01-01 00:00:05', '2017-01-01 00:00:00'], [m['id'] for m in messages])
+
+    def test_async_list_sharded_with_max_items(self):
+        """
+        async_list_sharded() should stop walks of sub-ranges and close their iterators when enough items are read
+        """
+        closed = []
+
+        async def list_shard(start, end):
+            try:
+                for item in range(start, end):
+                    yield item
+                    await asyncio.sleep(0)
+            finally:
+                closed.append(start)
+
+        async def run():
+            items = [item async for item in async_list_sharded(list_shard, [(0, 100), (100, 200)], max_items=3)]
+            pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            return items, pending
+
+        items, pending = asyncio.run(run())
+        self.assertEqual([0, 1, 2], items)
+        self.assertEqual([], pending)
+        self.assertEqual([0, 100], sorted(closed))
+
+    def test_get_application_with_cache(self):
+        """
+        get_application() of async account client should use cache of the client
+        """
+        with patch.object(AsyncTransport, 'request',
+                          new=AsyncMock(return_value=create_response(200, '{"id": "a-1"}'))) as p:
+            client = AsyncAccountClient('userId', 'apiToken', 'apiSecret', cache_ttls={'application': 60})
+            asyncio.run(client.get_application('a-1'))
+            self.assertEqual('a-1', asyncio.run(client.get_application('a-1'))['id'])
+            self.assertEqual(1, p.call_count)
+            asyncio.run(client.delete_application('a-1'))
+            asyncio.run(client.get_application('a-1'))
+            self.assertEqual(3, p.call_count)
+
+    def test_get_call_with_conditional_get(self):
+        """
+        get_call() of async client should revalidate cached call
+        """
+        response1 = create_response(200, '{"id": "c-1"}')
+        response1.headers['ETag'] = '"v1"'
+        with patch.object(AsyncTransport, 'request', new=AsyncMock(side_effect=[response1, create_response(304)])) as p:
+            client = AsyncVoiceClient('userId', 'apiToken', 'apiSecret', conditional_get=True)
+            asyncio.run(client.get_call('c-1'))
+            self.assertEqual('c-1', asyncio.run(client.get_call('c-1'))['id'])
+            self.assertEqual('"v1"', p.call_args[1]['headers']['If-None-Match'])
+
+    def test_get_number_info_many(self):
+        """
+        get_number_info_many() should be a coroutine which requests unique numbers
+        """
+        with patch.object(AsyncTransport, 'request',
+                          new=AsyncMock(return_value=create_response(200, '{"name": "Name"}'))) as p:
+            client = AsyncAccountClient('userId', 'apiToken', 'apiSecret')
+            data = asyncio.run(client.get_number_info_many(['+1234567890', '%2B1234567890']))
+            self.assertEqual(1, p.call_count)
+            self.assertEqual('Name', data['%2B1234567890']['name'])
+
+    def test_download_media_files(self):
+        """
+        download_media_files() should be a coroutine which writes streamed content to files
+        """
+        async def iter_chunked(chunk_size):
+            yield b'0123'
+            yield b'45'
+
+        response = create_response(200)
+        response.raw = MagicMock()
+        response.raw.iter_chunked = iter_chunked
+        directory = tempfile.mkdtemp()
+        try:
+            with patch.object(AsyncTransport, 'request', new=AsyncMock(return_value=response)):
+                client = AsyncAccountClient('userId', 'apiToken', 'apiSecret')
+                report = asyncio.run(client.download_media_files(['file1'], directory))
+            self.assertEqual('downloaded', report['files'][0]['status'])
+            self.assertEqual(6, report['bytes'])
+            with open(os.path.join(directory, 'file1'), 'rb') as f:
+                self.assertEqual(b'012345', f.read())
+        finally:
+            shutil.rmtree(directory)
+
+    def test_download_media_files_with_resumed_progress(self):
+        """
+        download_media_files() of async client should report progress of resumed download from the start of the file
+        """
+        async def iter_chunked(chunk_size):
+            yield b'45'
+
+        response = create_response(206)
+        response.raw = MagicMock()
+        response.raw.iter_chunked = iter_chunked
+        progress = MagicMock()
+        directory = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(directory, 'file1.part'), 'wb') as f:
+                f.write(b'0123')
+            with patch.object(AsyncTransport, 'request', new=AsyncMock(return_value=response)) as p:
+                client = AsyncAccountClient('userId', 'apiToken', 'apiSecret')
+                report = asyncio.run(client.download_media_files(['file1'], directory, progress=progress))
+            self.assertEqual('bytes=4-', p.call_args[1]['headers']['Range'])
+            self.assertEqual('resumed', report['files'][0]['status'])
+            progress.assert_called_once_with('file1', 6)
+            with open(os.path.join(directory, 'file1'), 'rb') as f:
+                self.assertEqual(b'012345', f.read())
+        finally:
+            shutil.rmtree(directory)
+
+    def test_download_media_files_with_invalid_name(self):
+        """
+        download_media_files() of async client should report invalid media names as errors
+        """
+        with patch.object(AsyncTransport, 'request', new=AsyncMock()) as p:
+            client = AsyncAccountClient('userId', 'apiToken', 'apiSecret')
+            report = asyncio.run(client.download_media_files(['../file1'], tempfile.gettempdir()))
+            p.assert_not_called()
+        self.assertIsInstance(report['files'][0]['error'], ValueError)
+
+    def test_archive_recordings(self):
+        """
+        async_archive_recordings() should download media files of listed recordings
+        """
+        async def iter_chunked(chunk_size):
+            yield b'content'
+
+        media_response = create_response(200, 'content', 'audio/wav')
+        media_response.raw = MagicMock()
+        media_response.raw.iter_chunked = iter_chunked
+        recordings_response = create_response(200, '[{"id": "r-1", "media": "http://host/media/c-1.wav"}]')
+        directory = tempfile.mkdtemp()
+        try:
+            with patch.object(AsyncTransport, 'request',
+                              new=AsyncMock(side_effect=[recordings_response, media_response])):
+                results = collect(async_archive_recordings(
+                    AsyncVoiceClient('userId', 'apiToken', 'apiSecret'),
+                    AsyncAccountClient('userId', 'apiToken', 'apiSecret'), directory))
+            self.assertEqual('archived', results[0]['status'])
+            with open(os.path.join(directory, 'c-1.wav'), 'rb') as f:
+                self.assertEqual(b'content', f.read())
+        finally:
+            shutil.rmtree(directory)
+
+    def test_archive_recordings_with_error(self):
+        """
+        async_archive_recordings() should close media response if its content can't be written
+        """
+        async def iter_chunked(chunk_size):
+            yield b'content'
+
+        def open_sink(recording, media_name):
+            sink = MagicMock()
+            sink.write.side_effect = IOError('no space left')
+            return sink
+
+        media_response = create_response(200, 'content', 'audio/wav')
+        media_response.raw = MagicMock()
+        media_response.raw.iter_chunked = iter_chunked
+        media_response.close = MagicMock()
+        recordings_response = create_response(200, '[{"id": "r-1", "media": "http://host/media/c-1.wav"}]')
+        with patch.object(AsyncTransport, 'request', new=AsyncMock(side_effect=[recordings_response, media_response])):
+            results = collect(async_archive_recordings(
+                AsyncVoiceClient('userId', 'apiToken', 'apiSecret'),
+                AsyncAccountClient('userId', 'apiToken', 'apiSecret'), open_sink))
+        self.assertEqual('failed', results[0]['status'])
+        media_response.close.assert_called_with()
+
+    def test_update_conference_members(self):
+        """
+        update_conference_members() should be a coroutine which updates active members
+        """
+        members_response = create_response(200, '[{"id": "m-1", "state": "active"}, '
+                                                '{"id": "m-2", "state": "completed"}]')
+        with patch.object(AsyncTransport, 'request',
+                          new=AsyncMock(side_effect=[members_response, create_response(200)])) as p:
+            client = AsyncVoiceClient('userId', 'apiToken', 'apiSecret')
+            outcomes = asyncio.run(client.mute_conference_members('conferenceId', True))
+            self.assertEqual([{'member_id': 'm-1', 'error': None}], outcomes)
+            self.assertTrue(p.call_args[1]['json']['mute'])
+
+    def test_create_bridged_calls(self):
+        """
+        create_bridged_calls() should be a coroutine which creates calls, bridge and plays prepared audio
+        """
+        async def prepare_audio():
+            return {'file_url': 'http://host/audio.mp3'}
+
+        client = AsyncVoiceClient('userId', 'apiToken', 'apiSecret')
+        with patch.object(client, 'create_call', new=AsyncMock(side_effect=['c-1', 'c-2'])), \
+                patch.object(client, 'create_bridge', new=AsyncMock(return_value='brg-1')) as create_bridge, \
+                patch.object(client, 'play_audio_to_bridge', new=AsyncMock()) as play_audio:
+            result = asyncio.run(client.create_bridged_calls([{'from_': '+1', 'to': '+2'}, {'from_': '+1', 'to': '+3'}],
+                                                             audio=prepare_audio))
+            create_bridge.assert_called_with(call_ids=['c-1', 'c-2'], bridge_audio=True)
+            play_audio.assert_called_with('brg-1', file_url='http://host/audio.mp3')
+            self.assertEqual('brg-1', result['bridge_id'])
+            self.assertIn('prepare_audio', result['timings'])
+
+    def test_create_bridged_calls_with_failed_audio(self):
+        """
+        create_bridged_calls() should hang up calls and remove them from the bridge if audio is not played
+        """
+        client = AsyncVoiceClient('userId', 'apiToken', 'apiSecret')
+        with patch.object(client, 'create_call', new=AsyncMock(side_effect=['c-1', 'c-2'])), \
+                patch.object(client, 'create_bridge', new=AsyncMock(return_value='brg-1')), \
+                patch.object(client, 'play_audio_to_bridge', new=AsyncMock(side_effect=ValueError('failed'))), \
+                patch.object(client, 'update_bridge', new=AsyncMock()) as update_bridge, \
+                patch.object(client, 'hangup_call', new=AsyncMock()) as hangup_call:
+            with self.assertRaises(ValueError):
+                asyncio.run(client.create_bridged_calls([{'from_': '+1', 'to': '+2'}, {'from_': '+1', 'to': '+3'}],
+                                                        audio={'sentence': 'Hello'}))
+            self.assertEqual(2, hangup_call.call_count)
+            update_bridge.assert_called_once_with('brg-1', call_ids=[])
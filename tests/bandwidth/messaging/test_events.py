@@ -0,0 +1,38 @@
+import unittest
+
+from bandwidth.messaging.events import parse_event, EventDispatcher, SmsEvent, MmsEvent
+
+
+class EventsTests(unittest.TestCase):
+
+    def test_parse_event(self):
+        """
+        parse_event() should return message events
+        """
+        event = parse_event("""{
+            "eventType": "sms",
+            "direction": "in",
+            "messageId": "m-abc123",
+            "from": "+13233326955",
+            "to": "+13865245000",
+            "text": "Hello",
+            "state": "received",
+            "time": "2017-01-26T16:10:11Z"
+        }""")
+        self.assertIsInstance(event, SmsEvent)
+        self.assertEqual('in', event.direction)
+        self.assertEqual('m-abc123', event.message_id)
+        self.assertEqual('+13233326955', event.from_)
+        self.assertEqual('Hello', event.text)
+        event = parse_event({'eventType': 'mms', 'media': ['https://host/media/1.jpg'], 'deliveryCode': '0'})
+        self.assertIsInstance(event, MmsEvent)
+        self.assertEqual(['https://host/media/1.jpg'], event.media)
+        self.assertEqual(0, event.delivery_code)
+
+    def test_dispatch(self):
+        """
+        dispatch() should call handler of event type
+        """
+        dispatcher = EventDispatcher()
+        dispatcher.register('sms', lambda event: event.text)
+        self.assertEqual('Hello', dispatcher.dispatch({'eventType': 'sms', 'text': 'Hello'}))
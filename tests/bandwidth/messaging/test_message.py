@@ -1,6 +1,7 @@
 import unittest
 import six
 import requests
+from json import dumps
 from tests.bandwidth.helpers import get_messaging_client as get_client
 from tests.bandwidth.helpers import create_response, AUTH, headers
 if six.PY3:
@@ -9,6 +10,7 @@ else:
     from mock import patch
 
 from bandwidth.voice import Client
+from bandwidth.messaging import BandwidthMessageAPIException
 
 
 class MessageTests(unittest.TestCase):
@@ -33,7 +35,7 @@ class MessageTests(unittest.TestCase):
             'sortOrder': None,
             'size': None
         }
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = list(client.list_messages())
             p.assert_called_with(
@@ -62,7 +64,7 @@ class MessageTests(unittest.TestCase):
             'fallbackUrl': None,
             'tag': None
         }
-        with patch('requests.request', return_value=estimated_response) as p:
+        with patch('requests.Session.request', return_value=estimated_response) as p:
             client = get_client()
             messageID = client.send_message(
                 from_='num1',
@@ -86,7 +88,7 @@ class MessageTests(unittest.TestCase):
             {"result": "accepted", "location": "http://localhost/messageId"}
         ]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = [{'from': 'num1', 'to': 'num2', 'text': 'text'}]
             results = client.send_messages(data)
@@ -98,6 +100,63 @@ class MessageTests(unittest.TestCase):
                 json=data)
             self.assertEqual('messageId', results[0]['id'])
 
+    def test_send_messages_bulk(self):
+        """
+        send_messages_bulk() should send messages by batches and return results in input order
+        """
+        def send(method, url, json=None, **kwargs):
+            results = []
+            for message in json:
+                if message['to'] == 'bad':
+                    results.append({'result': 'error', 'error': {'code': 'invalid-to'}})
+                else:
+                    results.append({'result': 'accepted', 'location': 'http://localhost/m-%s' % message['to']})
+            return create_response(200, dumps(results))
+
+        def messages():
+            for i in range(7):
+                yield {'from': 'num1', 'to': 'bad' if i == 3 else str(i), 'text': 'text'}
+        with patch('requests.Session.request', side_effect=send) as p:
+            client = get_client()
+            results = list(client.send_messages_bulk(messages(), chunk_size=2, concurrency=3))
+            self.assertEqual(4, p.call_count)
+            self.assertEqual(['m-0', 'm-1', 'm-2', None, 'm-4', 'm-5', 'm-6'], [r['id'] for r in results])
+            self.assertEqual(['0', '1', '2', 'bad', '4', '5', '6'], [r['message']['to'] for r in results])
+            self.assertEqual({'code': 'invalid-to'}, results[3]['error'])
+            self.assertIsNone(results[0]['error'])
+
+    def test_send_messages_bulk_with_failed_batch(self):
+        """
+        send_messages_bulk() should return error of failed batch for each message of the batch
+        """
+        responses = [create_response(200, '[{"result": "accepted", "location": "http://localhost/m-1"}]'),
+                     create_response(400, '{"message": "Invalid"}')]
+        with patch('requests.Session.request', side_effect=responses):
+            client = get_client()
+            messages = [{'from': 'num1', 'to': 'num2', 'text': 'text'}] * 2
+            results = list(client.send_messages_bulk(messages, chunk_size=1, concurrency=1))
+            self.assertIsNone(results[0]['error'])
+            self.assertIsNone(results[1]['id'])
+            self.assertIsInstance(results[1]['error'], BandwidthMessageAPIException)
+
+    def test_send_messages_bulk_reads_messages_on_demand(self):
+        """
+        send_messages_bulk() should not read all input messages at once
+        """
+        read = []
+
+        def messages():
+            for i in range(100):
+                read.append(i)
+                yield {'from': 'num1', 'to': 'num2', 'text': 'text'}
+        response = create_response(200, '[{"result": "accepted", "location": "http://localhost/m-1"}]')
+        with patch('requests.Session.request', return_value=response):
+            client = get_client()
+            results = client.send_messages_bulk(messages(), chunk_size=1, concurrency=2)
+            next(results)
+            self.assertLessEqual(len(read), 3)
+            results.close()
+
     def test_get_message(self):
         """
         get_message() should return a message
@@ -107,7 +166,7 @@ class MessageTests(unittest.TestCase):
             "id": "messageId"
         }
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = client.get_message('messageId')
             p.assert_called_with(
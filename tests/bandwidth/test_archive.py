@@ -0,0 +1,131 @@
+import io
+import os
+import zlib
+import shutil
+import tempfile
+import unittest
+import six
+from requests.packages.urllib3.response import HTTPResponse
+from tests.bandwidth.helpers import create_response, get_voice_client, get_account_client
+if six.PY3:
+    from unittest.mock import patch
+else:
+    from mock import patch
+
+from bandwidth.archive import archive_recordings, Checkpoint
+
+RECORDINGS = """
+[{
+    "id": "r-1",
+    "media": "https://api.catapult.inetwork.com/v1/users/userId/media/c-1-1.wav"
+}, {
+    "id": "r-2",
+    "media": "https://api.catapult.inetwork.com/v1/users/userId/media/c-2-1.wav"
+}, {
+    "id": "r-3"
+}]
+"""
+
+
+def send(method, url, *args, **kwargs):
+    if url.endswith('/recordings'):
+        return create_response(200, RECORDINGS)
+    if url.endswith('c-2-1.wav'):
+        return create_response(404, 'not found', 'text/plain')
+    response = create_response(200, 'content', 'audio/wav')
+    response.raw = io.BytesIO(b'content of ' + url.split('/')[-1].encode('utf-8'))
+    return response
+
+
+class ArchiveTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_archive_recordings(self):
+        """
+        archive_recordings() should download media files of recordings to directory and report results
+        """
+        with patch('requests.Session.request', side_effect=send):
+            results = list(archive_recordings(get_voice_client(), get_account_client(), self.directory,
+                                              chunk_size=4))
+        self.assertEqual(['archived', 'failed', 'no_media'], [r['status'] for r in results])
+        self.assertEqual(['r-1', 'r-2', 'r-3'], [r['recording_id'] for r in results])
+        self.assertEqual(20, results[0]['bytes'])
+        self.assertIsNotNone(results[1]['error'])
+        self.assertEqual(['c-1-1.wav'], os.listdir(self.directory))
+        with open(os.path.join(self.directory, 'c-1-1.wav'), 'rb') as f:
+            self.assertEqual(b'content of c-1-1.wav', f.read())
+
+    def test_archive_recordings_with_checkpoint(self):
+        """
+        archive_recordings() should skip recordings from checkpoint and add archived recordings to it
+        """
+        checkpoint_path = os.path.join(self.directory, 'archived.txt')
+        with open(checkpoint_path, 'w') as f:
+            f.write('r-2\n')
+        with patch('requests.Session.request', side_effect=send) as p:
+            results = list(archive_recordings(get_voice_client(), get_account_client(), self.directory,
+                                              checkpoint=checkpoint_path))
+            self.assertEqual(['r-1', 'r-3'], [r['recording_id'] for r in results])
+            self.assertEqual(2, p.call_count)
+            results = list(archive_recordings(get_voice_client(), get_account_client(), self.directory,
+                                              checkpoint=checkpoint_path))
+            self.assertEqual(['r-3'], [r['recording_id'] for r in results])
+            self.assertEqual(3, p.call_count)
+        checkpoint = Checkpoint(checkpoint_path)
+        self.assertIn('r-1', checkpoint)
+        self.assertNotIn('r-3', checkpoint)
+
+    def test_archive_recordings_to_sink(self):
+        """
+        archive_recordings() should write content to files returned by sink function
+        """
+        sinks = {}
+
+        class Sink(io.BytesIO):
+            def close(self):
+                sinks[self.media_name] = self.getvalue()
+                super(Sink, self).close()
+
+        def open_sink(recording, media_name):
+            sink = Sink()
+            sink.media_name = media_name
+            return sink
+
+        with patch('requests.Session.request', side_effect=send):
+            list(archive_recordings(get_voice_client(), get_account_client(), open_sink, size=10))
+        self.assertEqual({'c-1-1.wav': b'content of c-1-1.wav'}, sinks)
+
+    def test_archive_recordings_with_invalid_media_name(self):
+        """
+        archive_recordings() should not write files outside of the directory
+        """
+        response = create_response(200, '[{"id": "r-1", "media": "https://host/v1/users/userId/media/.."}]')
+        with patch('requests.Session.request', return_value=response) as p:
+            results = list(archive_recordings(get_voice_client(), get_account_client(), self.directory))
+            self.assertEqual(1, p.call_count)
+        self.assertEqual('failed', results[0]['status'])
+        self.assertIsInstance(results[0]['error'], ValueError)
+
+    def test_archive_recordings_with_compressed_content(self):
+        """
+        archive_recordings() should write decoded content of compressed media files
+        """
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        body = compressor.compress(b'content of c-1-1.wav') + compressor.flush()
+
+        def send_compressed(method, url, *args, **kwargs):
+            response = send(method, url, *args, **kwargs)
+            if url.endswith('c-1-1.wav'):
+                response.raw = HTTPResponse(io.BytesIO(body), headers={'content-encoding': 'gzip'},
+                                            preload_content=False, decode_content=False)
+            return response
+
+        with patch('requests.Session.request', side_effect=send_compressed):
+            list(archive_recordings(get_voice_client(), get_account_client(), self.directory, chunk_size=4))
+        with open(os.path.join(self.directory, 'c-1-1.wav'), 'rb') as f:
+            self.assertEqual(b'content of c-1-1.wav', f.read())
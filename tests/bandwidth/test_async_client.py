@@ -0,0 +1,13 @@
+import sys
+import unittest
+
+# async tests use syntax which is invalid on python 2.7 and 3.4-3.5, so they are in a separate module
+# which is imported on supported interpreters only
+if sys.version_info >= (3, 8):
+    from tests.bandwidth.async_client_tests import AsyncClientTests
+else:
+    @unittest.skip('async client tests require python 3.8+')
+    class AsyncClientTests(unittest.TestCase):
+
+        def test_async_client(self):
+            pass
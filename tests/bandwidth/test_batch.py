@@ -0,0 +1,61 @@
+import unittest
+import six
+from tests.bandwidth.helpers import create_response, get_voice_client
+if six.PY3:
+    from unittest.mock import patch
+else:
+    from mock import patch
+
+from bandwidth.voice.api_exception_module import BandwidthVoiceAPIException
+
+
+def get_call_response(method, url, *args, **kwargs):
+    call_id = url.split('/')[-1]
+    if call_id == 'missing':
+        return create_response(404, '{"code": "not-found", "message": "Call not found"}')
+    return create_response(200, '{"id": "%s"}' % call_id)
+
+
+class BatchTests(unittest.TestCase):
+
+    def test_map(self):
+        """
+        map() should call client method concurrently and return results and errors in order of arguments
+        """
+        with patch('requests.Session.request', side_effect=get_call_response) as p:
+            client = get_voice_client()
+            results = list(client.map('get_call', iter(['c-1', 'missing', 'c-3', 'c-4']), concurrency=2))
+            self.assertEqual(4, p.call_count)
+            self.assertEqual(['c-1', 'missing', 'c-3', 'c-4'], [r['args'] for r in results])
+            self.assertEqual('c-1', results[0]['result']['id'])
+            self.assertIsNone(results[0]['error'])
+            self.assertIsNone(results[1]['result'])
+            self.assertIsInstance(results[1]['error'], BandwidthVoiceAPIException)
+            self.assertEqual('c-4', results[3]['result']['id'])
+
+    def test_map_with_arguments(self):
+        """
+        map() should pass tuples as positional arguments and dictionaries as keyword arguments
+        """
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
+            client = get_voice_client()
+            args = [('c-1', 'completed'), {'call_id': 'c-2', 'state': 'active'}]
+            results = list(client.map(client.update_call, args))
+            self.assertEqual([None, None], [r['error'] for r in results])
+            states = sorted(c[1]['json']['state'] for c in p.call_args_list)
+            self.assertEqual(['active', 'completed'], states)
+
+    def test_batch(self):
+        """
+        batch() should run calls of client methods concurrently and collect results on exit
+        """
+        with patch('requests.Session.request', side_effect=get_call_response) as p:
+            client = get_voice_client()
+            with client.batch(concurrency=3) as batch:
+                for call_id in ['c-1', 'missing', 'c-3']:
+                    batch.get_call(call_id)
+            self.assertEqual(3, p.call_count)
+            self.assertEqual(('get_call', ('c-1',), {}), batch.results[0]['args'])
+            self.assertEqual('c-1', batch.results[0]['result']['id'])
+            self.assertIsInstance(batch.results[1]['error'], BandwidthVoiceAPIException)
+            self.assertEqual('c-3', batch.results[2]['result']['id'])
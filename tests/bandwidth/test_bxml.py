@@ -1,5 +1,5 @@
 import unittest
-from bandwidth.voice.bxml import Response
+from bandwidth.voice.bxml import Response, Template, slot
 from lxml.builder import E
 
 
@@ -28,3 +28,50 @@ class ResponseTests(unittest.TestCase):
         estimated_xml = '<xml><Response><Hangup/></Response></xml>'
         xml = Response(E.Hangup())
         self.assertEqual(estimated_xml, str(xml))
+
+
+class TemplateTests(unittest.TestCase):
+
+    def test_render(self):
+        """
+        render() should build the same XML as Response with values in place of slots
+        """
+        template = Template(E.SpeakSentence(slot('sentence'), {'voice': 'susan'}),
+                            E.PlayAudio({'url': slot('url')}), E.Hangup())
+        self.assertEqual({'sentence', 'url'}, template.slots)
+        for sentence, url in (('Hello', 'http://host/a.mp3'),
+                              (u'<b>"Tom" & \'Jerry\'\r\n\t\u00e9', u'http://host/?a=1&b="2"\t\n\u00e9')):
+            estimated_xml = Response(E.SpeakSentence(sentence, {'voice': 'susan'}),
+                                     E.PlayAudio({'url': url}), E.Hangup()).to_xml()
+            self.assertEqual(estimated_xml, template.render(sentence=sentence, url=url))
+
+    def test_render_with_slot_inside_text(self):
+        """
+        render() should fill several slots inside one text
+        """
+        template = Template(E.SpeakSentence(u'Hello, %s %s!' % (slot('first_name'), slot('last_name'))))
+        self.assertEqual(b'<xml><Response><SpeakSentence>Hello, John &amp; Jane!</SpeakSentence></Response></xml>',
+                         template.render(first_name='John', last_name='& Jane'))
+
+    def test_render_with_missing_value(self):
+        """
+        render() should fail if value of a slot is missing
+        """
+        template = Template(E.SpeakSentence(slot('sentence')))
+        with self.assertRaises(KeyError):
+            template.render()
+
+    def test_render_with_invalid_value(self):
+        """
+        render() should fail if value contains characters which are not allowed in XML
+        """
+        template = Template(E.SpeakSentence(slot('sentence')))
+        with self.assertRaises(ValueError):
+            template.render(sentence='\x00')
+
+    def test_slot_with_invalid_name(self):
+        """
+        slot() should fail for names which are not identifiers
+        """
+        with self.assertRaises(ValueError):
+            slot('a b')
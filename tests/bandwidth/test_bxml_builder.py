@@ -0,0 +1,67 @@
+import sys
+import unittest
+from lxml.builder import E
+from bandwidth.voice import bxml
+from bandwidth.voice.bxml_builder import Response, Call, Gather, Hangup, Pause, PlayAudio, SpeakSentence, Transfer
+
+
+class ResponseTests(unittest.TestCase):
+
+    def test_to_xml(self):
+        """
+        to_xml() should build XML
+        """
+        self.assertEqual(b'<xml><Response><Hangup/></Response></xml>', Response(Hangup()).to_xml())
+        self.assertEqual(b'<xml><Response/></xml>', Response().to_xml())
+
+    def test_to_xml_is_the_same_as_lxml(self):
+        """
+        to_xml() should build the same XML as Response with lxml
+        """
+        text = u'<b>"Tom" & \'Jerry\'\r\n\té\U0001F600]]>'
+        pairs = [
+            (Response(Pause(duration='10'), Hangup()),
+             bxml.Response(E.Pause({'duration': '10'}), E.Hangup())),
+            (Response(Call({'from': '+1234567890', 'to': '+1234567891'})),
+             bxml.Response(E.Call({'from': '+1234567890', 'to': '+1234567891'}))),
+            (Response(Gather(SpeakSentence(text, voice=text), PlayAudio('http://host/?a=1&b=2'),
+                             request_url='http://host/gather', max_digits='1'), Hangup()),
+             bxml.Response(E.Gather(E.SpeakSentence(text, {'voice': text}), E.PlayAudio('http://host/?a=1&b=2'),
+                                    {'requestUrl': 'http://host/gather', 'maxDigits': '1'}), E.Hangup())),
+            (Response(Transfer(SpeakSentence(''), 'tail', transfer_to='+1234567891')),
+             bxml.Response(E.Transfer(E.SpeakSentence(''), 'tail', {'transferTo': '+1234567891'})))
+        ]
+        for response, lxml_response in pairs:
+            self.assertEqual(lxml_response.to_xml(), response.to_xml())
+
+    def test__str__(self):
+        """
+        __str__() should return XML as string
+        """
+        self.assertEqual('<xml><Response><Hangup/></Response></xml>', str(Response(Hangup())))
+
+    def test_verb_with_keyword_attributes(self):
+        """
+        verbs should convert names of keyword attributes to camelCase and boolean values to strings
+        """
+        self.assertEqual(b'<Call from="+1234567890" timeout="10"/>', Call(from_='+1234567890', timeout='10').to_xml())
+        self.assertEqual(b'<Gather bargeable="false"/>', Gather(bargeable=False).to_xml())
+
+    def test_verb_with_invalid_arguments(self):
+        """
+        verbs should fail for unknown attributes, invalid children and invalid characters
+        """
+        with self.assertRaises(TypeError):
+            Hangup(reason='busy')
+        with self.assertRaises(TypeError):
+            SpeakSentence(10)
+        with self.assertRaises(ValueError):
+            SpeakSentence('\x00').to_xml()
+
+    def test_import_without_lxml(self):
+        """
+        bxml_builder should not import lxml
+        """
+        import subprocess
+        code = 'import sys; import bandwidth.voice.bxml_builder; sys.exit(int("lxml" in sys.modules))'
+        self.assertEqual(0, subprocess.call([sys.executable, '-c', code]))
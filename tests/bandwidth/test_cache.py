@@ -0,0 +1,106 @@
+import unittest
+import six
+from tests.bandwidth.helpers import create_response
+if six.PY3:
+    from unittest.mock import patch
+else:
+    from mock import patch
+
+from bandwidth.cache import TTLCache
+from bandwidth.account import Client
+
+
+class TTLCacheTests(unittest.TestCase):
+
+    def test_get(self):
+        """
+        get() should return cached values until they expire
+        """
+        with patch('bandwidth.cache._monotonic', return_value=100):
+            cache = TTLCache(10)
+            cache.set('key', 'value')
+            self.assertEqual('value', cache.get('key'))
+            self.assertIsNone(cache.get('another'))
+        with patch('bandwidth.cache._monotonic', return_value=110):
+            self.assertIsNone(cache.get('key'))
+            self.assertEqual(0, len(cache))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(2, cache.misses)
+
+    def test_set_with_full_cache(self):
+        """
+        set() should evict least recently used entries
+        """
+        cache = TTLCache(10, max_size=2)
+        cache.set('key1', 1)
+        cache.set('key2', 2)
+        cache.get('key1')
+        cache.set('key3', 3)
+        self.assertEqual(1, cache.get('key1'))
+        self.assertIsNone(cache.get('key2'))
+        self.assertEqual(3, cache.get('key3'))
+
+
+class AccountClientCacheTests(unittest.TestCase):
+
+    def test_get_application(self):
+        """
+        get_application() should return cached copies of application until it is changed by the client
+        """
+        with patch('requests.Session.request', return_value=create_response(200, '{"id": "a-1", "name": "app"}')) as p:
+            client = Client('userId', 'apiToken', 'apiSecret', cache_ttls={'application': 60})
+            application = client.get_application('a-1')
+            application['name'] = 'changed'
+            self.assertEqual('app', client.get_application('a-1')['name'])
+            self.assertEqual(1, p.call_count)
+            client.update_application('a-1', name='new')
+            client.get_application('a-1')
+            self.assertEqual(3, p.call_count)
+
+    def test_get_number_info(self):
+        """
+        get_number_info() should cache information of encoded number
+        """
+        with patch('requests.Session.request', return_value=create_response(200, '{"name": "RALEIGH, NC"}')) as p:
+            client = Client('userId', 'apiToken', 'apiSecret', cache_ttls={'number_info': 60})
+            client.get_number_info('+1234567890')
+            self.assertEqual('RALEIGH, NC', client.get_number_info('%2B1234567890')['name'])
+            self.assertEqual(1, p.call_count)
+
+    def test_get_phone_number(self):
+        """
+        update_phone_number() should invalidate all cached phone numbers
+        """
+        with patch('requests.Session.request', return_value=create_response(200, '{"id": "n-1"}')) as p:
+            client = Client('userId', 'apiToken', 'apiSecret', cache_ttls={'phone_number': 60})
+            client.get_phone_number('n-1')
+            client.get_phone_number('+1234567890')
+            client.update_phone_number('n-1', name='name')
+            client.get_phone_number('+1234567890')
+            self.assertEqual(4, p.call_count)
+
+    def test_get_domain_without_cache(self):
+        """
+        get_domain() should not cache results if cache of domains is not enabled
+        """
+        with patch('requests.Session.request', return_value=create_response(200, '{"id": "rd-1"}')) as p:
+            client = Client('userId', 'apiToken', 'apiSecret', cache_ttls={'application': 60})
+            client.get_domain('rd-1')
+            client.get_domain('rd-1')
+            self.assertEqual(2, p.call_count)
+
+    def test_cache_with_another_key_style(self):
+        """
+        clients with another key style should not get objects cached in other style
+        """
+        with patch('requests.Session.request', return_value=create_response(200, '{"autoAnswer": true}')):
+            client = Client('userId', 'apiToken', 'apiSecret', cache_ttls={'application': 60})
+            self.assertTrue(client.get_application('a-1')['auto_answer'])
+            self.assertTrue(client.with_key_style('raw').get_application('a-1')['autoAnswer'])
+
+    def test_init_with_unknown_resource(self):
+        """
+        Client() should raise ValueError for unknown cached resources
+        """
+        with self.assertRaises(ValueError):
+            Client('userId', 'apiToken', 'apiSecret', cache_ttls={'call': 60})
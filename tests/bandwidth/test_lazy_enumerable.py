@@ -1,3 +1,5 @@
+import io
+import time
 import unittest
 import six
 import requests
@@ -8,7 +10,22 @@ if six.PY3:
 else:
     from mock import patch
 
-from bandwidth.voice.lazy_enumerable import get_lazy_enumerator
+from bandwidth.voice import Client as VoiceClient, BandwidthVoiceAPIException
+from bandwidth.voice.lazy_enumerable import get_lazy_enumerator, get_prefetching_lazy_enumerator
+from bandwidth.json_stream import ijson
+
+
+def create_stream_response(status_code=200, content=''):
+    response = create_response(status_code, None)
+    response.headers['content-type'] = 'application/json'
+    response.raw = io.BytesIO(content.encode('utf-8'))
+    return response
+
+
+def wait_for(condition, timeout=1):
+    started = time.time()
+    while not condition() and time.time() - started < timeout:
+        time.sleep(0.01)
 
 
 class LazyEnumerableTests(unittest.TestCase):
@@ -17,7 +34,7 @@ class LazyEnumerableTests(unittest.TestCase):
         """
         get_lazy_enumerator() should return data on demand
         """
-        with patch('requests.request', return_value=create_response(200, '[1, 2, 3]')) as p:
+        with patch('requests.Session.request', return_value=create_response(200, '[1, 2, 3]')) as p:
             client = get_client()
             results = get_lazy_enumerator(client, lambda: client._make_request(
                 'get', 'https://api.catapult.inetwork.com/v1/users/userId/account/transactions?page=0&size=25'))
@@ -40,7 +57,7 @@ class LazyEnumerableTests(unittest.TestCase):
                                     '<transactions?page=1&size=25>; rel="next"'
         response2 = create_response(200, estimated_json2)
         client = get_client()
-        with patch('requests.request', return_value=response2) as p:
+        with patch('requests.Session.request', return_value=response2) as p:
             results = get_lazy_enumerator(client, lambda: ([1, 2, 3], response1, None))
             self.assertEqual([1, 2, 3, 4, 5, 6, 7], list(results))
             p.assert_called_with(
@@ -48,3 +65,172 @@ class LazyEnumerableTests(unittest.TestCase):
                 'transactions?page=1&size=25',
                 headers=headers,
                 auth=AUTH)
+
+    def test_get_prefetching_lazy_enumerator(self):
+        """
+        get_prefetching_lazy_enumerator() should return items of all pages in order
+        """
+        response1 = create_response(200, '[1, 2, 3]')
+        response1.headers['link'] = '<transactions?page=1&size=3>; rel="next"'
+        response2 = create_response(200, '[4, 5, 6]')
+        response2.headers['link'] = '<transactions?page=2&size=3>; rel="next"'
+        response3 = create_response(200, '[7]')
+        client = get_client()
+        with patch('requests.Session.request', side_effect=[response2, response3]) as p:
+            results = get_prefetching_lazy_enumerator(client, lambda: ([1, 2, 3], response1, None), 2)
+            self.assertEqual([1, 2, 3, 4, 5, 6, 7], list(results))
+            p.assert_called_with('get', 'transactions?page=2&size=3', headers=headers, auth=AUTH)
+
+    def test_get_prefetching_lazy_enumerator_with_limited_buffer(self):
+        """
+        get_prefetching_lazy_enumerator() should not request more pages than it can buffer
+        """
+        response = create_response(200, '[1, 2]')
+        response.headers['link'] = '<transactions?page=1&size=2>; rel="next"'
+        client = get_client()
+        with patch('requests.Session.request', return_value=response) as p:
+            results = get_prefetching_lazy_enumerator(client, lambda: client._make_request('get', '/path'), 1)
+            self.assertEqual(1, next(results))
+            time.sleep(0.3)
+            # consumed page, buffered page and page waiting to be buffered
+            self.assertEqual(3, p.call_count)
+            results.close()
+
+    def test_get_prefetching_lazy_enumerator_with_error(self):
+        """
+        get_prefetching_lazy_enumerator() should raise errors of background requests
+        """
+        response1 = create_response(200, '[1]')
+        response1.headers['link'] = '<transactions?page=1&size=1>; rel="next"'
+        client = get_client()
+        with patch('requests.Session.request', return_value=create_response(500, '{"message": "error"}')):
+            results = get_prefetching_lazy_enumerator(client, lambda: ([1], response1, None))
+            self.assertEqual(1, next(results))
+            with self.assertRaises(BandwidthVoiceAPIException):
+                next(results)
+
+    def test_get_lazy_enumerator_with_prefetch_option(self):
+        """
+        get_lazy_enumerator() should prefetch pages if client option prefetch_pages is set
+        """
+        client = VoiceClient('userId', 'apiToken', 'apiSecret', prefetch_pages=2)
+        with patch('bandwidth.voice.lazy_enumerable.get_prefetching_lazy_enumerator', return_value=iter([1])) as p:
+            def first_page():
+                return [1], create_response(), None
+            self.assertEqual([1], list(get_lazy_enumerator(client, first_page)))
+            p.assert_called_with(client, first_page, 2, None, None)
+
+    @unittest.skipIf(ijson is None, 'streaming of pages requires ijson')
+    def test_get_lazy_enumerator_with_stream_pages_option(self):
+        """
+        list methods should parse streamed pages item by item if client option stream_pages is set
+        """
+        response1 = create_stream_response(200, '[{"callId": "c-1", "price": 0.5}, {"callId": "c-2"}]')
+        response1.headers['link'] = '<calls?page=1&size=2>; rel="next"'
+        response2 = create_stream_response(200, '[{"callId": "c-3"}]')
+        client = VoiceClient('userId', 'apiToken', 'apiSecret', stream_pages=True)
+        with patch('requests.Session.request', side_effect=[response1, response2]) as p:
+            results = client.list_calls()
+            self.assertEqual({'call_id': 'c-1', 'price': 0.5}, next(results))
+            self.assertFalse(response1.raw.closed)
+            self.assertEqual([{'call_id': 'c-2'}, {'call_id': 'c-3'}], list(results))
+            self.assertTrue(response1.raw.closed)
+            self.assertTrue(response2.raw.closed)
+            p.assert_called_with('get', 'calls?page=1&size=2', headers=headers, auth=AUTH, stream=True)
+
+    @unittest.skipIf(ijson is None, 'streaming of pages requires ijson')
+    def test_get_lazy_enumerator_with_stream_pages_option_and_close(self):
+        """
+        closing of list should close streamed response of current page
+        """
+        response = create_stream_response(200, '[{"callId": "c-1"}, {"callId": "c-2"}]')
+        client = VoiceClient('userId', 'apiToken', 'apiSecret', stream_pages=True)
+        with patch('requests.Session.request', return_value=response):
+            results = client.list_calls()
+            self.assertEqual({'call_id': 'c-1'}, next(results))
+            results.close()
+            self.assertTrue(response.raw.closed)
+
+    @unittest.skipIf(ijson is None, 'streaming of pages requires ijson')
+    def test_get_prefetching_lazy_enumerator_with_stream_pages_option_and_close(self):
+        """
+        closing of prefetching list should close streamed responses of fetched pages
+        """
+        response1 = create_stream_response(200, '[{"callId": "c-1"}, {"callId": "c-2"}]')
+        response1.headers['link'] = '<calls?page=1>; rel="next"'
+        response2 = create_stream_response(200, '[{"callId": "c-3"}]')
+        client = VoiceClient('userId', 'apiToken', 'apiSecret', stream_pages=True, prefetch_pages=2)
+        with patch('requests.Session.request', side_effect=[response1, response2]) as p:
+            results = client.list_calls()
+            self.assertEqual({'call_id': 'c-1'}, next(results))
+            wait_for(lambda: p.call_count == 2)
+            results.close()
+            self.assertTrue(response1.raw.closed)
+            # the page fetched in background is closed when it is dropped
+            wait_for(lambda: response2.raw.closed)
+            self.assertTrue(response2.raw.closed)
+
+    @unittest.skipIf(ijson is None, 'streaming of pages requires ijson')
+    def test_get_lazy_enumerator_with_stream_pages_option_and_error(self):
+        """
+        list methods should raise api errors of streamed pages
+        """
+        client = VoiceClient('userId', 'apiToken', 'apiSecret', stream_pages=True)
+        with patch('requests.Session.request', return_value=create_response(400, '{"message": "error"}')):
+            with self.assertRaises(BandwidthVoiceAPIException):
+                list(client.list_calls())
+
+    def test_lazy_enumerator_cursor(self):
+        """
+        cursor of lazy collection should contain url of current page and number of its returned items
+        """
+        response1 = create_response(200, '[{"id": "1"}, {"id": "2"}]')
+        response1.url = 'https://api.catapult.inetwork.com/v1/users/userId/calls?size=2'
+        response1.headers['link'] = '<https://api.catapult.inetwork.com/v1/users/userId/calls?page=1&size=2>; ' \
+                                    'rel="next"'
+        response2 = create_response(200, '[{"id": "3"}, {"id": "4"}]')
+        client = get_client()
+        with patch('requests.Session.request', side_effect=[response1, response2]):
+            calls = client.list_calls(size=2)
+            self.assertIsNone(calls.cursor)
+            next(calls)
+            self.assertEqual({'url': response1.url, 'offset': 1}, calls.cursor)
+            next(calls)
+            next(calls)
+            self.assertEqual({'url': 'https://api.catapult.inetwork.com/v1/users/userId/calls?page=1&size=2',
+                              'offset': 1}, calls.cursor)
+
+    def test_list_with_cursor(self):
+        """
+        list methods should resume the list from passed cursor
+        """
+        response = create_response(200, '[{"id": "3"}, {"id": "4"}, {"id": "5"}]')
+        cursor = {'url': 'https://api.catapult.inetwork.com/v1/users/userId/calls?page=1&size=3', 'offset': 1}
+        client = get_client()
+        with patch('requests.Session.request', return_value=response) as p:
+            calls = client.list_calls(size=3, cursor=cursor)
+            self.assertEqual(['4', '5'], [call['id'] for call in calls])
+            p.assert_called_with('get', cursor['url'], headers=headers, auth=AUTH)
+            self.assertEqual({'url': cursor['url'], 'offset': 3}, calls.cursor)
+
+    def test_list_with_cursor_of_first_page(self):
+        """
+        list methods should request first page again if cursor has no url
+        """
+        with patch('requests.Session.request', return_value=create_response(200, '[{"id": "1"}, {"id": "2"}]')) as p:
+            client = get_client()
+            recordings = client.list_recordings(cursor={'url': None, 'offset': 1})
+            self.assertEqual(['2'], [recording['id'] for recording in recordings])
+            self.assertEqual('https://api.catapult.inetwork.com/v1/users/userId/recordings', p.call_args[0][1])
+
+    def test_prefetching_lazy_enumerator_with_cursor(self):
+        """
+        get_prefetching_lazy_enumerator() should track cursor and resume from it
+        """
+        response = create_response(200, '[1, 2, 3]')
+        client = get_client()
+        with patch('requests.Session.request', return_value=response) as p:
+            results = get_prefetching_lazy_enumerator(client, None, 1, {'url': 'calls?page=2', 'offset': 2})
+            self.assertEqual([3], list(results))
+            self.assertEqual({'url': 'calls?page=2', 'offset': 3}, results.cursor)
+            p.assert_called_with('get', 'calls?page=2', headers=headers, auth=AUTH)
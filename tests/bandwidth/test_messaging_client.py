@@ -45,7 +45,7 @@ class ClientTests(unittest.TestCase):
         """
         _request() should make authorized request to absolute url
         """
-        with patch('requests.request', return_value=create_response()) as p:
+        with patch('requests.Session.request', return_value=create_response()) as p:
             client = get_client()
             response = client._request('get', 'http://localhost')
             p.assert_called_with('get', 'http://localhost', headers=headers, auth=('apiToken', 'apiSecret'))
@@ -54,7 +54,7 @@ class ClientTests(unittest.TestCase):
         """
         _request() should make authorized request to relative url
         """
-        with patch('requests.request', return_value=create_response()) as p:
+        with patch('requests.Session.request', return_value=create_response()) as p:
             client = get_client()
             response = client._request('get', '/path')
             p.assert_called_with('get', 'https://api.catapult.inetwork.com/v1/path',
@@ -64,7 +64,7 @@ class ClientTests(unittest.TestCase):
         """
         _request() should add the user agent to header
         """
-        with patch('requests.request', return_value=create_response()) as p:
+        with patch('requests.Session.request', return_value=create_response()) as p:
             client = get_client()
             req_headers = {
                 'hello': 'world'
@@ -122,7 +122,7 @@ class ClientTests(unittest.TestCase):
         _make_request() should make request, check response and extract json data
         """
         estimated_response = create_response(200, '{"data": "data"}')
-        with patch('requests.request', return_value=estimated_response) as p:
+        with patch('requests.Session.request', return_value=estimated_response) as p:
             client = get_client()
             data, response, _ = client._make_request('get', '/path')
             p.assert_called_with('get', 'https://api.catapult.inetwork.com/v1/path',
@@ -136,7 +136,7 @@ class ClientTests(unittest.TestCase):
         """
         estimated_response = create_response(201, '', 'text/html')
         estimated_response.headers['location'] = 'http://localhost/path/id'
-        with patch('requests.request', return_value=estimated_response) as p:
+        with patch('requests.Session.request', return_value=estimated_response) as p:
             client = get_client()
             _, response, id = client._make_request('get', '/path')
             p.assert_called_with('get', 'https://api.catapult.inetwork.com/v1/path',
@@ -0,0 +1,144 @@
+import io
+import unittest
+import six
+from tests.bandwidth.helpers import create_response
+if six.PY3:
+    from unittest.mock import patch, MagicMock
+else:
+    from mock import patch, MagicMock
+
+from bandwidth.voice import Client as VoiceClient
+from bandwidth.account import Client as AccountClient
+from bandwidth.messaging import Client as MessagingClient
+from bandwidth.voice.api_exception_module import BandwidthVoiceAPIException
+from bandwidth.metrics import get_endpoint_template, RequestMetrics, MetricsRecorder
+from bandwidth.rate_limiter import RateLimiter
+
+
+class MetricsTests(unittest.TestCase):
+
+    def test_get_endpoint_template(self):
+        """
+        get_endpoint_template() should replace ids in path of url
+        """
+        self.assertEqual('/users/{id}/calls/{id}', get_endpoint_template('/users/u-1/calls/c-1'))
+        self.assertEqual('/users/{id}/conferences/{id}/members',
+                         get_endpoint_template('https://api.catapult.inetwork.com/v1/users/u-1/conferences/'
+                                               'conf-1/members?page=1&size=100'))
+        self.assertEqual('/users/{id}/messages', get_endpoint_template('https://localhost/v2/users/u-1/messages', 'v2'))
+
+    def test_request_metrics(self):
+        """
+        RequestMetrics should store status and size of response
+        """
+        metrics = RequestMetrics('get', '/users/{id}/calls')
+        metrics.set_response(create_response(200, '[]'))
+        data = metrics.to_dict()
+        self.assertEqual(200, data['status'])
+        self.assertEqual(2, data['payload_size'])
+        self.assertIsNotNone(data['network_time'])
+        self.assertIsNone(data['wait_time'])
+        self.assertIsNone(data['decode_time'])
+        self.assertNotIn('_started', data)
+
+    def test_metrics_recorder(self):
+        """
+        MetricsRecorder should aggregate metrics by method and endpoint template
+        """
+        recorder = MetricsRecorder()
+        for status in (200, 200, 404):
+            metrics = RequestMetrics('get', '/users/{id}/calls/{id}')
+            metrics.set_response(create_response(status, '{}'))
+            metrics.decode_time = 0.5
+            recorder(metrics)
+        stats = recorder.stats()[('get', '/users/{id}/calls/{id}')]
+        self.assertEqual(3, stats['count'])
+        self.assertEqual(1, stats['errors'])
+        self.assertEqual(1.5, stats['decode_time'])
+        self.assertEqual(6, stats['payload_size'])
+        self.assertEqual(0, stats['conversion_time'])
+        recorder.clear()
+        self.assertEqual({}, recorder.stats())
+
+    def test_client_metrics(self):
+        """
+        client should pass metrics of each request to its metrics sink
+        """
+        sink = MagicMock()
+        with patch('requests.Session.request', return_value=create_response(200, '{"id": "callId"}')):
+            client = VoiceClient('userId', 'apiToken', 'apiSecret', metrics=sink)
+            self.assertEqual('callId', client.get_call('callId')['id'])
+        metrics = sink.call_args[0][0]
+        self.assertEqual('get', metrics.method)
+        self.assertEqual('/users/{id}/calls/{id}', metrics.endpoint)
+        self.assertEqual(200, metrics.status)
+        self.assertEqual(16, metrics.payload_size)
+        self.assertIsNotNone(metrics.decode_time)
+        self.assertIsNotNone(metrics.conversion_time)
+        self.assertIsNotNone(metrics.wait_time)
+
+    def test_client_metrics_of_failed_request(self):
+        """
+        client should pass metrics of failed request to its metrics sink and raise the error
+        """
+        recorder = MetricsRecorder()
+        response = create_response(404, '{"code": "not-found", "message": "Not found"}')
+        with patch('requests.Session.request', return_value=response):
+            client = VoiceClient('userId', 'apiToken', 'apiSecret', metrics=recorder)
+            with self.assertRaises(BandwidthVoiceAPIException):
+                client.get_call('callId')
+        stats = recorder.stats()[('get', '/users/{id}/calls/{id}')]
+        self.assertEqual(1, stats['count'])
+        self.assertEqual(1, stats['errors'])
+
+    def test_client_metrics_of_list(self):
+        """
+        client should measure requests of pages of lists
+        """
+        recorder = MetricsRecorder()
+        response1 = create_response(200, '[{"id": "1"}]')
+        response1.headers['link'] = '<https://api.catapult.inetwork.com/v1/users/userId/messages?page=1>; rel="next"'
+        response2 = create_response(200, '[{"id": "2"}]')
+        with patch('requests.Session.request', side_effect=[response1, response2]):
+            client = MessagingClient('userId', 'apiToken', 'apiSecret', metrics=recorder)
+            self.assertEqual(['1', '2'], [m['id'] for m in client.list_messages()])
+        self.assertEqual(2, recorder.stats()[('get', '/users/{id}/messages')]['count'])
+
+    def test_client_metrics_with_rate_limiter(self):
+        """
+        waiting for rate limiter should be measured as wait time, not as network time
+        """
+        recorder = MetricsRecorder()
+        with patch('requests.Session.request', return_value=create_response(200, '{"id": "callId"}')):
+            client = VoiceClient('userId', 'apiToken', 'apiSecret', metrics=recorder,
+                                 rate_limiter=RateLimiter(calls_rps=10))
+            for _ in range(3):
+                client.get_call('callId')
+        stats = recorder.stats()[('get', '/users/{id}/calls/{id}')]
+        self.assertLess(stats['network_time'], 0.05)
+        self.assertGreater(stats['wait_time'], 0.15)
+
+    def test_client_metrics_of_media_download(self):
+        """
+        downloading of media file should be measured
+        """
+        recorder = MetricsRecorder()
+        response = create_response(200, 'content', 'audio/wav')
+        response.headers['content-length'] = '7'
+        response.raw = io.BytesIO(b'content')
+        with patch('requests.Session.request', return_value=response):
+            client = AccountClient('userId', 'apiToken', 'apiSecret', metrics=recorder)
+            client.download_media_file('file1.wav')
+        stats = recorder.stats()[('get', '/users/{id}/media/{id}')]
+        self.assertEqual(1, stats['count'])
+        self.assertEqual(7, stats['payload_size'])
+
+    def test_client_without_metrics(self):
+        """
+        client should not collect metrics by default
+        """
+        with patch('requests.Session.request', return_value=create_response(200, '{"id": "callId"}')), \
+                patch('bandwidth.metrics.RequestMetrics') as p:
+            client = VoiceClient('userId', 'apiToken', 'apiSecret')
+            client.get_call('callId')
+            p.assert_not_called()
@@ -0,0 +1,84 @@
+import threading
+import unittest
+import six
+from tests.bandwidth.helpers import create_response
+if six.PY3:
+    from unittest.mock import patch
+else:
+    from mock import patch
+
+from bandwidth.rate_limiter import TokenBucket, RateLimiter
+from bandwidth.messaging import Client
+
+
+class TokenBucketTests(unittest.TestCase):
+
+    @patch('bandwidth.rate_limiter._monotonic', return_value=100.0)
+    def test_reserve(self, monotonic):
+        """
+        reserve() should return delays to keep rate of requests
+        """
+        bucket = TokenBucket(10, capacity=2)
+        self.assertEqual(0, bucket.reserve())
+        self.assertEqual(0, bucket.reserve())
+        self.assertAlmostEqual(0.1, bucket.reserve())
+        self.assertAlmostEqual(0.2, bucket.reserve())
+        monotonic.return_value = 101.0
+        self.assertEqual(0, bucket.reserve())
+
+    def test_reserve_from_several_threads(self):
+        """
+        reserve() should give each token once when it is called from several threads
+        """
+        bucket = TokenBucket(1, capacity=50)
+        delays = []
+
+        def reserve():
+            for i in range(10):
+                delays.append(bucket.reserve())
+        threads = [threading.Thread(target=reserve) for i in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(50, len([d for d in delays if d == 0]))
+
+
+class RateLimiterTests(unittest.TestCase):
+
+    def test_get_bucket_key(self):
+        """
+        get_bucket_key() should return account and endpoint family of url
+        """
+        limiter = RateLimiter()
+        base = 'https://api.catapult.inetwork.com/v1'
+        self.assertEqual(('u-1', 'messages'), limiter.get_bucket_key(base + '/users/u-1/messages'))
+        self.assertEqual(('u-1', 'calls'), limiter.get_bucket_key(base + '/users/u-1/calls/c-1/audio'))
+        self.assertEqual(('u-2', 'default'), limiter.get_bucket_key(base + '/users/u-2/bridges'))
+        self.assertEqual((None, 'default'), limiter.get_bucket_key(base + '/availableNumbers/local'))
+
+    def test_reserve(self):
+        """
+        reserve() should use separate buckets for endpoint families and skip not limited ones
+        """
+        limiter = RateLimiter(messages_rps=1, calls_rps=1)
+        self.assertEqual(0, limiter.reserve('post', '/users/u-1/messages'))
+        self.assertGreater(limiter.reserve('post', '/users/u-1/messages'), 0)
+        self.assertEqual(0, limiter.reserve('post', '/users/u-1/calls'))
+        self.assertEqual(0, limiter.reserve('post', '/users/u-2/messages'))
+        self.assertEqual(0, limiter.reserve('get', '/users/u-1/bridges'))
+        self.assertEqual(0, limiter.reserve('get', '/users/u-1/bridges'))
+
+    def test_client_with_rate_limiter(self):
+        """
+        Client should wait for tokens of rate limiter before requests
+        """
+        limiter = RateLimiter(messages_rps=2)
+        response = create_response(201)
+        response.headers['location'] = 'http://localhost/messages/m-1'
+        with patch('requests.Session.request', return_value=response), patch('time.sleep') as sleep:
+            client = Client('userId', 'apiToken', 'apiSecret', rate_limiter=limiter)
+            client.send_message('+1234567890', '+1234567891', 'text')
+            sleep.assert_not_called()
+            client.send_message('+1234567890', '+1234567891', 'text')
+            self.assertAlmostEqual(0.5, sleep.call_args[0][0], places=2)
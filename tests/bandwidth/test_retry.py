@@ -0,0 +1,131 @@
+import unittest
+import six
+import requests
+from tests.bandwidth.helpers import create_response, get_voice_client
+if six.PY3:
+    from unittest.mock import patch
+else:
+    from mock import patch
+
+from bandwidth.retry import RetryPolicy, get_retry_after
+from bandwidth.transport import Transport
+from bandwidth.voice import Client, BandwidthVoiceAPIException
+
+
+def create_retry_response(status_code=503, retry_after=None):
+    response = create_response(status_code, '{"message": "Service unavailable"}')
+    if retry_after is not None:
+        response.headers['retry-after'] = retry_after
+    return response
+
+
+class RetryPolicyTests(unittest.TestCase):
+
+    def test_get_delay(self):
+        """
+        get_delay() should return exponential backoff for failed idempotent requests
+        """
+        policy = RetryPolicy(max_attempts=4, backoff_factor=1, jitter=False)
+        self.assertEqual(1, policy.get_delay('get', 1, response=create_retry_response()))
+        self.assertEqual(2, policy.get_delay('get', 2, error=requests.ConnectionError()))
+        self.assertEqual(4, policy.get_delay('delete', 3, response=create_retry_response(429)))
+        self.assertIsNone(policy.get_delay('get', 4, response=create_retry_response()))
+        self.assertIsNone(policy.get_delay('get', 1, response=create_retry_response(404)))
+
+    def test_get_delay_with_jitter(self):
+        """
+        get_delay() should return random delay not greater than backoff
+        """
+        policy = RetryPolicy(backoff_factor=1, max_backoff=1.5)
+        for attempt in range(1, 3):
+            delay = policy.get_delay('get', attempt, response=create_retry_response())
+            self.assertTrue(0 <= delay <= 1.5)
+
+    def test_get_delay_for_non_idempotent_requests(self):
+        """
+        get_delay() should not retry POST requests unless retry_non_idempotent is set
+        """
+        self.assertIsNone(RetryPolicy().get_delay('post', 1, response=create_retry_response()))
+        policy = RetryPolicy(retry_non_idempotent=True, jitter=False)
+        self.assertEqual(0.5, policy.get_delay('post', 1, response=create_retry_response()))
+
+    def test_get_delay_with_retry_after(self):
+        """
+        get_delay() should honor header Retry-After
+        """
+        policy = RetryPolicy(max_retry_after=10)
+        self.assertEqual(7, policy.get_delay('get', 1, response=create_retry_response(429, '7')))
+        self.assertIsNone(policy.get_delay('get', 1, response=create_retry_response(429, '120')))
+
+    def test_get_retry_after(self):
+        """
+        get_retry_after() should parse seconds and http dates
+        """
+        self.assertEqual(3, get_retry_after(create_retry_response(retry_after='3')))
+        self.assertEqual(0, get_retry_after(create_retry_response(retry_after='Wed, 21 Oct 2015 07:28:00 GMT')))
+        self.assertIsNone(get_retry_after(create_retry_response(retry_after='soon')))
+        self.assertIsNone(get_retry_after(create_retry_response()))
+
+
+@patch('time.sleep')
+class TransportRetryTests(unittest.TestCase):
+
+    def test_retry_request(self, sleep):
+        """
+        request() should retry failed requests
+        """
+        responses = [create_retry_response(retry_after='2'), create_response(200, '{"id": "callId"}')]
+        with patch('requests.Session.request', side_effect=responses) as p:
+            client = Client('userId', 'apiToken', 'apiSecret', retry=RetryPolicy())
+            self.assertEqual('callId', client.get_call('callId')['id'])
+            self.assertEqual(2, p.call_count)
+            sleep.assert_called_once_with(2)
+
+    def test_retry_request_with_connection_error(self, sleep):
+        """
+        request() should retry requests failed by connection errors
+        """
+        side_effect = [requests.ConnectionError(), create_response(200, '[1, 2]')]
+        with patch('requests.Session.request', side_effect=side_effect) as p:
+            client = Client('userId', 'apiToken', 'apiSecret', retry=RetryPolicy())
+            self.assertEqual([1, 2], list(client.list_calls()))
+            self.assertEqual(2, p.call_count)
+
+    def test_retry_request_gives_up(self, sleep):
+        """
+        request() should return last failed response when attempts are exhausted
+        """
+        with patch('requests.Session.request', return_value=create_retry_response()) as p:
+            client = Client('userId', 'apiToken', 'apiSecret', retry=RetryPolicy(max_attempts=3))
+            with self.assertRaises(BandwidthVoiceAPIException):
+                client.get_call('callId')
+            self.assertEqual(3, p.call_count)
+
+    def test_do_not_retry_create_call(self, sleep):
+        """
+        request() should not repeat non-idempotent requests by default
+        """
+        with patch('requests.Session.request', return_value=create_retry_response()) as p:
+            client = Client('userId', 'apiToken', 'apiSecret', retry=RetryPolicy())
+            with self.assertRaises(BandwidthVoiceAPIException):
+                client.create_call('+1234567890', '+1234567891')
+            self.assertEqual(1, p.call_count)
+            sleep.assert_not_called()
+
+    def test_do_not_retry_streams(self, sleep):
+        """
+        request() should not repeat requests with stream body
+        """
+        with patch('requests.Session.request', return_value=create_retry_response()) as p:
+            transport = Transport(retry=RetryPolicy())
+            transport.request('put', 'http://localhost', data=six.BytesIO(b'data'))
+            self.assertEqual(1, p.call_count)
+
+    def test_without_retry_policy(self, sleep):
+        """
+        request() should not retry requests without retry policy
+        """
+        with patch('requests.Session.request', return_value=create_retry_response()) as p:
+            with self.assertRaises(BandwidthVoiceAPIException):
+                get_voice_client().get_call('callId')
+            self.assertEqual(1, p.call_count)
@@ -0,0 +1,76 @@
+import unittest
+import six
+from tests.bandwidth.helpers import create_response
+if six.PY3:
+    from unittest.mock import patch
+else:
+    from mock import patch
+
+from bandwidth.voice import Client
+
+
+def create_validated_response(status_code=200, content='', etag=None, last_modified=None):
+    response = create_response(status_code, content)
+    if etag:
+        response.headers['ETag'] = etag
+    if last_modified:
+        response.headers['Last-Modified'] = last_modified
+    return response
+
+
+class ConditionalGetTests(unittest.TestCase):
+
+    def test_get_call_with_etag(self):
+        """
+        get_call() should revalidate cached call by its ETag and return cached call for response 304
+        """
+        responses = [create_validated_response(200, '{"id": "c-1", "state": "active"}', etag='"v1"'),
+                     create_validated_response(304, etag='"v1"')]
+        with patch('requests.Session.request', side_effect=responses) as p:
+            client = Client('userId', 'apiToken', 'apiSecret', conditional_get=True)
+            call = client.get_call('c-1')
+            # cached result is returned without copying
+            self.assertIs(call, client.get_call('c-1'))
+            self.assertEqual({'id': 'c-1', 'state': 'active'}, call)
+            self.assertEqual('"v1"', p.call_args[1]['headers']['If-None-Match'])
+            self.assertEqual({'requests': 2, 'revalidations': 1, 'not_modified': 1, 'hit_rate': 1.0},
+                             client.conditional_cache.stats())
+
+    def test_get_conference_with_changed_data(self):
+        """
+        get_conference() should return and cache new data if it has been changed
+        """
+        responses = [create_validated_response(200, '{"state": "created"}', last_modified='Mon, 30 Jan 2017'),
+                     create_validated_response(200, '{"state": "completed"}', last_modified='Tue, 31 Jan 2017'),
+                     create_validated_response(304)]
+        with patch('requests.Session.request', side_effect=responses) as p:
+            client = Client('userId', 'apiToken', 'apiSecret', conditional_get=True)
+            client.get_conference('conf-1')
+            self.assertEqual('completed', client.get_conference('conf-1')['state'])
+            self.assertEqual('Mon, 30 Jan 2017', p.call_args[1]['headers']['If-Modified-Since'])
+            self.assertEqual('completed', client.get_conference('conf-1')['state'])
+            self.assertEqual('Tue, 31 Jan 2017', p.call_args[1]['headers']['If-Modified-Since'])
+            self.assertEqual(0.5, client.conditional_cache.hit_rate)
+
+    def test_list_calls_is_not_cached(self):
+        """
+        pages of lists should not be cached
+        """
+        with patch('requests.Session.request',
+                   return_value=create_validated_response(200, '[{"id": "c-1"}]', etag='"v1"')) as p:
+            client = Client('userId', 'apiToken', 'apiSecret', conditional_get=True)
+            list(client.list_calls())
+            list(client.list_calls())
+            self.assertNotIn('If-None-Match', p.call_args[1]['headers'])
+            self.assertEqual(0, client.conditional_cache.revalidations)
+
+    def test_get_recording_without_validators(self):
+        """
+        get_recording() should not send conditional requests if the server doesn't send validators
+        """
+        with patch('requests.Session.request', return_value=create_response(200, '{"id": "rec-1"}')) as p:
+            client = Client('userId', 'apiToken', 'apiSecret', conditional_get=True)
+            client.get_recording('rec-1')
+            client.get_recording('rec-1')
+            self.assertNotIn('If-None-Match', p.call_args[1]['headers'])
+            self.assertEqual(0, client.conditional_cache.revalidations)
@@ -0,0 +1,152 @@
+import datetime
+import threading
+import unittest
+import six
+from tests.bandwidth.helpers import create_response, get_messaging_client, get_account_client
+if six.PY3:
+    from unittest.mock import patch
+else:
+    from mock import patch
+
+from bandwidth.sharding import split_time_range, list_sharded, get_boundary_item_id
+
+
+def get_page(method, url, params=None, **kwargs):
+    # returns one item with filters of the request
+    return create_response(200, '[{"from": "%s", "to": "%s"}]' % (
+        params.get('fromDateTime') or params.get('fromDate'), params.get('toDateTime') or params.get('toDate')))
+
+
+class ShardingTests(unittest.TestCase):
+
+    def test_split_time_range(self):
+        """
+        split_time_range() should split time range to adjacent sub-ranges with common boundaries
+        """
+        ranges = split_time_range('2017-01-01 00:00:00', '2017-01-01 00:00:09', 3)
+        self.assertEqual([
+            (datetime.datetime(2017, 1, 1, 0, 0, 0), datetime.datetime(2017, 1, 1, 0, 0, 3)),
+            (datetime.datetime(2017, 1, 1, 0, 0, 3), datetime.datetime(2017, 1, 1, 0, 0, 6)),
+            (datetime.datetime(2017, 1, 1, 0, 0, 6), datetime.datetime(2017, 1, 1, 0, 0, 9))
+        ], ranges)
+        self.assertEqual([(datetime.datetime(2017, 1, 1), datetime.datetime(2017, 1, 1))],
+                         split_time_range('2017-01-01 00:00:00', '2017-01-01 00:00:00', 3))
+
+    def test_split_time_range_with_short_range(self):
+        """
+        split_time_range() should not return more sub-ranges than seconds in the range
+        """
+        ranges = split_time_range('2017-01-01T00:00:00Z', datetime.datetime(2017, 1, 1, 0, 0, 2), 10)
+        self.assertEqual(2, len(ranges))
+        with self.assertRaises(ValueError):
+            split_time_range(None, '2017-01-01 00:00:00', 2)
+
+    def test_list_sharded(self):
+        """
+        list_sharded() should walk ranges at the same time and return items in order of ranges
+        """
+        barrier = threading.Event()
+
+        def list_shard(start, end):
+            if start == 1:
+                # first range waits for second one to be started
+                barrier.wait(1)
+            else:
+                barrier.set()
+            return [start, end]
+
+        items = list(list_sharded(list_shard, [(1, 2), (3, 4)], buffer_size=1))
+        self.assertEqual([1, 2, 3, 4], items)
+        self.assertTrue(barrier.is_set())
+
+    def test_list_sharded_unordered(self):
+        """
+        list_sharded() should return all items in order of receiving if ordered is False
+        """
+        items = list(list_sharded(lambda start, end: range(start, end), [(0, 5), (5, 10), (10, 12)],
+                                  concurrency=2, ordered=False))
+        self.assertEqual(list(range(12)), sorted(items))
+
+    def test_list_sharded_with_max_items(self):
+        """
+        list_sharded() should limit total number of items
+        """
+        items = list(list_sharded(lambda start, end: range(start, end), [(0, 5), (5, 10)], max_items=7))
+        self.assertEqual(list(range(7)), items)
+        self.assertEqual([], list(list_sharded(lambda start, end: range(start, end), [(0, 5)], max_items=0)))
+
+    def test_get_boundary_item_id(self):
+        """
+        get_boundary_item_id() should return ids of items in seconds of common boundaries of sub-ranges only
+        """
+        get_id = get_boundary_item_id(split_time_range('2017-01-01 00:00:00', '2017-01-01 00:00:09', 2))
+        self.assertEqual('m-1', get_id({'id': 'm-1', 'time': '2017-01-01T00:00:05.500Z'}))
+        self.assertEqual('m-2', get_id({'id': 'm-2', 'time': datetime.datetime(2017, 1, 1, 0, 0, 5)}))
+        self.assertIsNone(get_id({'id': 'm-3', 'time': '2017-01-01T00:00:00Z'}))
+        self.assertIsNone(get_id({'id': 'm-4', 'time': '2017-01-01T00:00:09Z'}))
+
+    def test_list_messages_sharded_with_items_at_boundary(self):
+        """
+        list_messages_sharded() should return messages at boundaries of sub-ranges once and limit total number
+        """
+        pages = {
+            '2017-01-01 00:00:00': '[{"id": "m-1", "time": "2017-01-01T00:00:01Z"}, '
+                                   '{"id": "m-2", "time": "2017-01-01T00:00:05.500Z"}]',
+            '2017-01-01 00:00:05': '[{"id": "m-2", "time": "2017-01-01T00:00:05.500Z"}, '
+                                   '{"id": "m-3", "time": "2017-01-01T00:00:07Z"}]'
+        }
+
+        def get_page(method, url, params=None, **kwargs):
+            return create_response(200, pages[params['fromDateTime']])
+
+        with patch('requests.Session.request', side_effect=get_page) as p:
+            client = get_messaging_client()
+            messages = client.list_messages_sharded('2017-01-01 00:00:00', '2017-01-01 00:00:09', shards=2)
+            self.assertEqual(['m-1', 'm-2', 'm-3'], [m['id'] for m in messages])
+            messages = client.list_messages_sharded('2017-01-01 00:00:00', '2017-01-01 00:00:09', shards=2,
+                                                    max_items=2)
+            self.assertEqual(['m-1', 'm-2'], [m['id'] for m in messages])
+            self.assertNotIn('max_items', p.call_args[1]['params'])
+
+    def test_list_sharded_with_error(self):
+        """
+        list_sharded() should raise errors of ranges
+        """
+        def list_shard(start, end):
+            if start == 2:
+                raise ValueError('error')
+            return [start]
+
+        items = list_sharded(list_shard, [(1, 1), (2, 2)])
+        self.assertEqual(1, next(items))
+        with self.assertRaises(ValueError):
+            next(items)
+
+    def test_list_messages_sharded(self):
+        """
+        list_messages_sharded() should request messages of each sub-range
+        """
+        with patch('requests.Session.request', side_effect=get_page) as p:
+            client = get_messaging_client()
+            messages = list(client.list_messages_sharded('2017-01-01 00:00:00', '2017-01-01 00:00:09',
+                                                         shards=2, direction='in'))
+            self.assertEqual([
+                {'from': '2017-01-01 00:00:00', 'to': '2017-01-01 00:00:05'},
+                {'from': '2017-01-01 00:00:05', 'to': '2017-01-01 00:00:09'}
+            ], messages)
+            self.assertEqual(2, p.call_count)
+            self.assertEqual('in', p.call_args[1]['params']['direction'])
+            self.assertEqual('asc', p.call_args[1]['params']['sortOrder'])
+
+    def test_list_account_transactions_sharded(self):
+        """
+        list_account_transactions_sharded() should return transactions of newest sub-ranges first
+        """
+        with patch('requests.Session.request', side_effect=get_page):
+            client = get_account_client()
+            transactions = list(client.list_account_transactions_sharded('2017-01-01T00:00:00Z',
+                                                                         '2017-01-01T00:00:09Z', shards=2))
+            self.assertEqual([
+                {'from': '2017-01-01T00:00:05Z', 'to': '2017-01-01T00:00:09Z'},
+                {'from': '2017-01-01T00:00:00Z', 'to': '2017-01-01T00:00:05Z'}
+            ], transactions)
@@ -0,0 +1,62 @@
+import unittest
+import six
+from tests.bandwidth.helpers import create_response
+if six.PY3:
+    from unittest.mock import patch
+else:
+    from mock import patch
+
+from bandwidth.transport import Transport
+from bandwidth.voice import Client as VoiceClient
+from bandwidth.account import Client as AccountClient
+
+
+class TransportTests(unittest.TestCase):
+
+    def test_init(self):
+        """
+        Transport() should mount pooled adapters with right pool options
+        """
+        transport = Transport(pool_connections=2, pool_maxsize=20)
+        adapter = transport.session.get_adapter('https://api.catapult.inetwork.com')
+        self.assertEqual(20, adapter._pool_maxsize)
+        self.assertEqual(2, adapter._pool_connections)
+        self.assertEqual('keep-alive', transport.session.headers['Connection'])
+
+    def test_init_without_keep_alive(self):
+        """
+        Transport() should close connections after each request if keep_alive is False
+        """
+        transport = Transport(keep_alive=False)
+        self.assertEqual('close', transport.session.headers['Connection'])
+
+    def test_request(self):
+        """
+        request() should make request by session
+        """
+        with patch('requests.Session.request', return_value=create_response()) as p:
+            transport = Transport()
+            transport.request('get', 'http://localhost', timeout=1)
+            p.assert_called_with('get', 'http://localhost', timeout=1)
+
+    def test_shared_transport(self):
+        """
+        Clients should share transport passed to them and leave it open on close()
+        """
+        transport = Transport()
+        voice_api = VoiceClient('userId', 'apiToken', 'apiSecret', transport=transport)
+        account_api = AccountClient('userId', 'apiToken', 'apiSecret', transport=transport)
+        self.assertIs(transport, voice_api.transport)
+        self.assertIs(transport, account_api.transport)
+        with patch.object(transport, 'close') as p:
+            voice_api.close()
+            p.assert_not_called()
+
+    def test_client_context_manager(self):
+        """
+        Client should close own transport on exit of context manager
+        """
+        with patch('requests.Session.close') as p:
+            with VoiceClient('userId', 'apiToken', 'apiSecret', pool_maxsize=5) as api:
+                self.assertEqual(5, api.transport.pool_maxsize)
+            p.assert_called_with()
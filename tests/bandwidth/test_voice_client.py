@@ -45,7 +45,7 @@ class ClientTests(unittest.TestCase):
         """
         _request() should make authorized request to absolute url
         """
-        with patch('requests.request', return_value=create_response()) as p:
+        with patch('requests.Session.request', return_value=create_response()) as p:
             client = get_client()
             response = client._request('get', 'http://localhost')
             p.assert_called_with('get', 'http://localhost', headers=headers, auth=('apiToken', 'apiSecret'))
@@ -54,7 +54,7 @@ class ClientTests(unittest.TestCase):
         """
         _request() should make authorized request to relative url
         """
-        with patch('requests.request', return_value=create_response()) as p:
+        with patch('requests.Session.request', return_value=create_response()) as p:
             client = get_client()
             response = client._request('get', '/path')
             p.assert_called_with('get', 'https://api.catapult.inetwork.com/v1/path',
@@ -64,7 +64,7 @@ class ClientTests(unittest.TestCase):
         """
         _request() should add the user agent to header
         """
-        with patch('requests.request', return_value=create_response()) as p:
+        with patch('requests.Session.request', return_value=create_response()) as p:
             client = get_client()
             req_headers = {
                 'hello': 'world'
@@ -122,7 +122,7 @@ class ClientTests(unittest.TestCase):
         _make_request() should make request, check response and extract json data
         """
         estimated_response = create_response(200, '{"data": "data"}')
-        with patch('requests.request', return_value=estimated_response) as p:
+        with patch('requests.Session.request', return_value=estimated_response) as p:
             client = get_client()
             data, response, _ = client._make_request('get', '/path')
             p.assert_called_with('get', 'https://api.catapult.inetwork.com/v1/path',
@@ -136,7 +136,7 @@ class ClientTests(unittest.TestCase):
         """
         estimated_response = create_response(201, '', 'text/html')
         estimated_response.headers['location'] = 'http://localhost/path/id'
-        with patch('requests.request', return_value=estimated_response) as p:
+        with patch('requests.Session.request', return_value=estimated_response) as p:
             client = get_client()
             _, response, id = client._make_request('get', '/path')
             p.assert_called_with('get', 'https://api.catapult.inetwork.com/v1/path',
@@ -157,3 +157,27 @@ class ClientTests(unittest.TestCase):
         self.assertIsNotNone(getattr(client, 'play_audio_file_to_conference'))
         self.assertIsNotNone(getattr(client, 'speak_sentence_to_conference_member'))
         self.assertIsNotNone(getattr(client, 'play_audio_file_to_conference_member'))
+
+    def test_make_request_with_raw_key_style(self):
+        """
+        _make_request() should return parsed json as is for key style 'raw'
+        """
+        with patch('requests.Session.request', return_value=create_response(200, '{"callId": "id"}')):
+            client = Client('userId', 'apiToken', 'apiSecret', key_style='raw')
+            self.assertDictEqual({'callId': 'id'}, client._make_request('get', '/path')[0])
+
+    def test_with_key_style(self):
+        """
+        with_key_style() should return copy of client with another key style and the same transport
+        """
+        client = get_client()
+        raw_client = client.with_key_style('raw')
+        self.assertEqual('snake', client.key_style)
+        self.assertEqual('raw', raw_client.key_style)
+        self.assertIs(client.transport, raw_client.transport)
+        with patch('requests.Session.request', return_value=create_response(200, '{"callId": "id"}')):
+            self.assertEqual('id', client.with_key_style('lazy_snake').get_call('id')['call_id'])
+        with self.assertRaises(ValueError):
+            client.with_key_style('kebab')
+        with self.assertRaises(ValueError):
+            Client('userId', 'apiToken', 'apiSecret', key_style='kebab')
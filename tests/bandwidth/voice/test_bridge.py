@@ -4,9 +4,9 @@ import requests
 from tests.bandwidth.helpers import get_voice_client as get_client
 from tests.bandwidth.helpers import create_response, AUTH, headers
 if six.PY3:
-    from unittest.mock import patch
+    from unittest.mock import patch, call
 else:
-    from mock import patch
+    from mock import patch, call
 
 from bandwidth.voice import Client
 
@@ -28,7 +28,7 @@ class BridgesTests(unittest.TestCase):
             "completedTime": "2013-04-22T13:59:30.122Z"
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = list(client.list_bridges())
             p.assert_called_with(
@@ -46,7 +46,7 @@ class BridgesTests(unittest.TestCase):
         """
         estimated_response = create_response(201)
         estimated_response.headers['Location'] = 'http://localhost/bridgeId'
-        with patch('requests.request', return_value=estimated_response) as p:
+        with patch('requests.Session.request', return_value=estimated_response) as p:
             client = get_client()
             data = {'callIds': ['callId'], 'bridgeAudio': False}
             id = client.create_bridge(call_ids=['callId'], bridge_audio=False)
@@ -73,7 +73,7 @@ class BridgesTests(unittest.TestCase):
             "completedTime": "2013-04-22T13:59:30.122Z"
         }
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = client.get_bridge('bridgeId')
             p.assert_called_with(
@@ -87,7 +87,7 @@ class BridgesTests(unittest.TestCase):
         """
         update_bridge() should update a bridge
         """
-        with patch('requests.request', return_value=create_response(200)) as p:
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
             client = get_client()
             data = {'bridgeAudio': False, 'callIds': None}
             client.update_bridge('bridgeId', bridge_audio=False)
@@ -117,7 +117,7 @@ class BridgesTests(unittest.TestCase):
             "bridge": "https://api.catapult.inetwork.com/v1/users/{userId}/bridges/{bridgeId}"
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             calls = list(client.list_bridge_calls('bridgeId'))
             p.assert_called_with(
@@ -139,7 +139,7 @@ class BridgesTests(unittest.TestCase):
             'voice': None,
             'loopEnabled': None
         }
-        with patch('requests.request', return_value=create_response(200)) as p:
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
             client = get_client()
             data = {'file_url': 'url'}
             client.play_audio_to_bridge('bridgeId', **data)
@@ -149,3 +149,66 @@ class BridgesTests(unittest.TestCase):
                 auth=AUTH,
                 headers=headers,
                 json=estimated_request)
+
+    def test_create_bridged_calls(self):
+        """
+        create_bridged_calls() should create calls concurrently, bridge them, play audio and report timings
+        """
+        client = get_client()
+        with patch.object(client, 'create_call', side_effect=lambda from_, to: 'c-' + to) as create_call, \
+                patch.object(client, 'create_bridge', return_value='brg-1') as create_bridge, \
+                patch.object(client, 'play_audio_to_bridge') as play_audio:
+            result = client.create_bridged_calls([{'from_': '+1', 'to': '2'}, {'from_': '+1', 'to': '3'}],
+                                                 audio=lambda: {'sentence': 'Hello'})
+            self.assertEqual(2, create_call.call_count)
+            create_bridge.assert_called_with(call_ids=['c-2', 'c-3'], bridge_audio=True)
+            play_audio.assert_called_with('brg-1', sentence='Hello')
+            self.assertEqual(['c-2', 'c-3'], result['call_ids'])
+            self.assertEqual('brg-1', result['bridge_id'])
+            self.assertEqual({'create_call_0', 'create_call_1', 'prepare_audio', 'create_bridge', 'play_audio',
+                              'total'}, set(result['timings']))
+
+    def test_create_bridged_calls_with_failed_call(self):
+        """
+        create_bridged_calls() should hang up created calls if a call is not created
+        """
+        def create_call(from_, to):
+            if to == '3':
+                raise ValueError('failed')
+            return 'c-' + to
+        client = get_client()
+        with patch.object(client, 'create_call', side_effect=create_call), \
+                patch.object(client, 'create_bridge') as create_bridge, \
+                patch.object(client, 'hangup_call') as hangup_call:
+            with self.assertRaises(ValueError):
+                client.create_bridged_calls([{'from_': '+1', 'to': '2'}, {'from_': '+1', 'to': '3'}])
+            create_bridge.assert_not_called()
+            hangup_call.assert_called_once_with('c-2')
+
+    def test_create_bridged_calls_with_failed_bridge(self):
+        """
+        create_bridged_calls() should hang up calls if the bridge is not created
+        """
+        client = get_client()
+        with patch.object(client, 'create_call', side_effect=lambda from_, to: 'c-' + to), \
+                patch.object(client, 'create_bridge', side_effect=ValueError('failed')), \
+                patch.object(client, 'hangup_call') as hangup_call:
+            with self.assertRaises(ValueError):
+                client.create_bridged_calls([{'from_': '+1', 'to': '2'}, {'from_': '+1', 'to': '3'}])
+            hangup_call.assert_has_calls([call('c-2'), call('c-3')])
+
+    def test_create_bridged_calls_with_failed_audio(self):
+        """
+        create_bridged_calls() should hang up calls and remove them from the bridge if audio is not played
+        """
+        client = get_client()
+        with patch.object(client, 'create_call', side_effect=lambda from_, to: 'c-' + to), \
+                patch.object(client, 'create_bridge', return_value='brg-1'), \
+                patch.object(client, 'play_audio_to_bridge', side_effect=ValueError('failed')), \
+                patch.object(client, 'update_bridge') as update_bridge, \
+                patch.object(client, 'hangup_call') as hangup_call:
+            with self.assertRaises(ValueError):
+                client.create_bridged_calls([{'from_': '+1', 'to': '2'}, {'from_': '+1', 'to': '3'}],
+                                            audio={'sentence': 'Hello'})
+            hangup_call.assert_has_calls([call('c-2'), call('c-3')])
+            update_bridge.assert_called_once_with('brg-1', call_ids=[])
@@ -30,7 +30,7 @@ class CallTests(unittest.TestCase):
             "id": "callId"
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = list(client.list_calls())
             p.assert_called_with(
@@ -64,7 +64,7 @@ class CallTests(unittest.TestCase):
         }
         estimated_response = create_response(201)
         estimated_response.headers['Location'] = 'http://localhost/callId'
-        with patch('requests.request', return_value=estimated_response) as p:
+        with patch('requests.Session.request', return_value=estimated_response) as p:
             client = get_client()
             from_ = '+1234567890'
             to = '+1234567891'
@@ -86,7 +86,7 @@ class CallTests(unittest.TestCase):
             "id": "callId"
         }
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = client.get_call('callId')
             p.assert_called_with(
@@ -109,7 +109,7 @@ class CallTests(unittest.TestCase):
             'whisperAudio': None,
             'callbackUrl': None
         }
-        with patch('requests.request', return_value=create_response(200)) as p:
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
             client = get_client()
             client.update_call('callId', state='completed')
             p.assert_called_with(
@@ -131,7 +131,7 @@ class CallTests(unittest.TestCase):
             'voice': None,
             'loopEnabled': None
         }
-        with patch('requests.request', return_value=create_response(200)) as p:
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
             client = get_client()
             client.play_audio_to_call('callId', file_url='url')
             p.assert_called_with(
@@ -145,7 +145,7 @@ class CallTests(unittest.TestCase):
         """
         send_dtmf_to_call() should send dtmf data to a call
         """
-        with patch('requests.request', return_value=create_response(200)) as p:
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
             client = get_client()
             client.send_dtmf_to_call('callId', 12)
             p.assert_called_with(
@@ -165,7 +165,7 @@ class CallTests(unittest.TestCase):
             "id": "recordingId"
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = list(client.list_call_recordings('callId'))
             p.assert_called_with(
@@ -184,7 +184,7 @@ class CallTests(unittest.TestCase):
             "id": "transcriptionId"
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = list(client.list_call_transcriptions('callId'))
             p.assert_called_with(
@@ -203,7 +203,7 @@ class CallTests(unittest.TestCase):
             "id": "eventId"
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = list(client.list_call_events('callId'))
             p.assert_called_with(
@@ -222,7 +222,7 @@ class CallTests(unittest.TestCase):
             "id": "eventId"
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = client.get_call_event('callId', 'eventId')
             p.assert_called_with(
@@ -244,7 +244,7 @@ class CallTests(unittest.TestCase):
         }
         response = create_response(201)
         response.headers['location'] = 'http://.../gatherId'
-        with patch('requests.request', return_value=response) as p:
+        with patch('requests.Session.request', return_value=response) as p:
             client = get_client()
             id = client.create_call_gather('callId', max_digits=1)
             p.assert_called_with(
@@ -264,7 +264,7 @@ class CallTests(unittest.TestCase):
             "id": "gatherId"
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = client.get_call_gather('callId', 'gatherId')
             p.assert_called_with(
@@ -278,7 +278,7 @@ class CallTests(unittest.TestCase):
         """
         update_call_gather() should update a gather
         """
-        with patch('requests.request', return_value=create_response(200)) as p:
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
             client = get_client()
             data = {'state': 'completed'}
             client.update_call_gather('callId', 'gatherId', state='completed')
@@ -446,3 +446,19 @@ class CallTests(unittest.TestCase):
                                  callback_url='curl',
                                  whisper_audio=my_audio
                                  )
+
+    def test_toggle_call_recording_with_state_mirror(self):
+        """
+        toggle_call_recording() should use mirrored state of the call and request it once only
+        """
+        responses = [create_response(200, '{"id": "callId", "state": "active", "recordingEnabled": false}'),
+                     create_response(200), create_response(200)]
+        with patch('requests.Session.request', side_effect=responses) as p:
+            client = Client('userId', 'apiToken', 'apiSecret', mirror_state=True)
+            client.toggle_call_recording('callId')
+            self.assertTrue(client.state_mirror.get('call', 'callId', 'recording_enabled'))
+            client.toggle_call_recording('callId')
+            self.assertEqual(['get', 'post', 'post'], [c[0][0] for c in p.call_args_list])
+            self.assertTrue(p.call_args_list[1][1]['json']['recordingEnabled'])
+            self.assertFalse(p.call_args_list[2][1]['json']['recordingEnabled'])
+            self.assertEqual('active', client.state_mirror.get('call', 'callId', 'state'))
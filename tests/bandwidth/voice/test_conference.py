@@ -29,7 +29,7 @@ class ConferenceTests(unittest.TestCase):
 
         estimated_response = create_response(201)
         estimated_response.headers['Location'] = 'http://localhost/conferenceId'
-        with patch('requests.request', return_value=estimated_response) as p:
+        with patch('requests.Session.request', return_value=estimated_response) as p:
             client = get_client()
             id = client.create_conference(
                 from_='+1234567980',
@@ -54,7 +54,7 @@ class ConferenceTests(unittest.TestCase):
             "id": "conferenceId"
         }
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = client.get_conference('conferenceId')
             p.assert_called_with(
@@ -78,7 +78,7 @@ class ConferenceTests(unittest.TestCase):
             'fallbackUrl': None,
             'tag': None
         }
-        with patch('requests.request', return_value=create_response(200)) as p:
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
             client = get_client()
             client.update_conference('conferenceId', state='completed')
             p.assert_called_with(
@@ -101,7 +101,7 @@ class ConferenceTests(unittest.TestCase):
             'loopEnabled': None
         }
 
-        with patch('requests.request', return_value=create_response(200)) as p:
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
             client = get_client()
             data = {'file_url': 'url'}
             client.play_audio_to_conference('conferenceId', **data)
@@ -125,7 +125,7 @@ class ConferenceTests(unittest.TestCase):
         }
         response = create_response(201)
         response.headers['location'] = 'http://.../memberId'
-        with patch('requests.request', return_value=response) as p:
+        with patch('requests.Session.request', return_value=response) as p:
             client = get_client()
             data = {'call_id': 'callId'}
             id = client.create_conference_member('conferenceId', **data)
@@ -146,7 +146,7 @@ class ConferenceTests(unittest.TestCase):
             "id": "memberId"
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = list(client.list_conference_members('conferenceId'))
             p.assert_called_with(
@@ -165,7 +165,7 @@ class ConferenceTests(unittest.TestCase):
             "id": "memberId"
         }
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = client.get_conference_member('conferenceId', 'memberId')
             p.assert_called_with(
@@ -186,7 +186,7 @@ class ConferenceTests(unittest.TestCase):
             'mute': None,
             'hold': None
         }
-        with patch('requests.request', return_value=create_response(200)) as p:
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
             client = get_client()
             data = {'state': 'completed'}
             client.update_conference_member('conferenceId', 'memberId', **data)
@@ -209,7 +209,7 @@ class ConferenceTests(unittest.TestCase):
             'voice': None,
             'loopEnabled': None
         }
-        with patch('requests.request', return_value=create_response(200)) as p:
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
             client = get_client()
             data = {'file_url': 'url'}
             client.play_audio_to_conference_member('conferenceId', 'memberId', file_url='url')
@@ -300,3 +300,59 @@ class ConferenceTests(unittest.TestCase):
         with patch.object(client, 'update_conference') as p:
             client.mute_conference('conferenceId', True)
             p.assert_called_with('conferenceId', mute=True)
+
+    def test_update_conference_members(self):
+        """
+        update_conference_members() should update selected active members concurrently and return outcomes
+        """
+        members_json = """
+        [{"id": "member-1", "state": "active", "mute": false},
+         {"id": "member-2", "state": "completed", "mute": false},
+         {"id": "member-3", "state": "active", "mute": true},
+         {"id": "member-4", "state": "active", "mute": false}]
+        """
+
+        def send(method, url, **kwargs):
+            if method == 'get':
+                return create_response(200, members_json)
+            if url.endswith('member-4'):
+                return create_response(400, '{"code": "error", "message": "Member is not active"}')
+            return create_response(200)
+
+        with patch('requests.Session.request', side_effect=send) as p:
+            client = get_client()
+            outcomes = client.update_conference_members('conferenceId', lambda member: not member['mute'],
+                                                        mute=True)
+            self.assertEqual(['member-1', 'member-4'], [outcome['member_id'] for outcome in outcomes])
+            self.assertIsNone(outcomes[0]['error'])
+            self.assertIsNotNone(outcomes[1]['error'])
+            post = [c for c in p.call_args_list if c[0][0] == 'post'][0]
+            self.assertTrue(post[0][1].endswith('/conferences/conferenceId/members/member-1'))
+            self.assertTrue(post[1]['json']['mute'])
+
+            outcomes = client.update_conference_members('conferenceId', hold=True)
+            self.assertEqual(['member-1', 'member-3', 'member-4'], [outcome['member_id'] for outcome in outcomes])
+
+    def test_update_conference_members_by_ids(self):
+        """
+        update_conference_members() should update members by ids without listing members
+        """
+        with patch('requests.Session.request', return_value=create_response(200)) as p:
+            client = get_client()
+            outcomes = client.update_conference_members('conferenceId', ['member-1', 'member-2'], hold=True)
+            self.assertEqual(2, p.call_count)
+            self.assertEqual(['member-1', 'member-2'], [outcome['member_id'] for outcome in outcomes])
+
+    def test_mute_hold_and_remove_conference_members(self):
+        """
+        mute_conference_members(), hold_conference_members() and remove_conference_members()
+        should call update_conference_members() with right params
+        """
+        client = get_client()
+        with patch.object(client, 'update_conference_members') as p:
+            client.mute_conference_members('conferenceId', True, ['memberId'])
+            p.assert_called_with('conferenceId', ['memberId'], 10, mute=True)
+            client.hold_conference_members('conferenceId', False, concurrency=2)
+            p.assert_called_with('conferenceId', None, 2, hold=False)
+            client.remove_conference_members('conferenceId')
+            p.assert_called_with('conferenceId', None, 10, state='completed')
@@ -0,0 +1,85 @@
+import datetime
+import unittest
+from dateutil import tz
+
+from bandwidth.events import Event
+from bandwidth.voice.events import parse_event, EventDispatcher, AnswerEvent, GatherEvent, RecordingEvent
+
+
+class EventsTests(unittest.TestCase):
+
+    def test_parse_event(self):
+        """
+        parse_event() should return event of class by its event type
+        """
+        event = parse_event(b"""{
+            "eventType": "answer",
+            "from": "+15753222083",
+            "to": "+13865245000",
+            "callId": "c-abc123",
+            "callUri": "https://api.catapult.inetwork.com/v1/users/u-abc/calls/c-abc123",
+            "callState": "active",
+            "time": "2017-01-26T16:10:11Z",
+            "tag": "tag1"
+        }""")
+        self.assertIsInstance(event, AnswerEvent)
+        self.assertEqual('answer', event.event_type)
+        self.assertEqual('+15753222083', event.from_)
+        self.assertEqual('+13865245000', event.to)
+        self.assertEqual('c-abc123', event.call_id)
+        self.assertEqual('active', event.call_state)
+        self.assertEqual('tag1', event.tag)
+        self.assertEqual(datetime.datetime(2017, 1, 26, 16, 10, 11, tzinfo=tz.tzutc()), event.time)
+        self.assertEqual('c-abc123', event['callId'])
+        self.assertIsNone(event.application_id)
+
+    def test_parse_event_with_specific_fields(self):
+        """
+        parse_event() should decode fields of specific events
+        """
+        event = parse_event({'eventType': 'gather', 'callId': 'c-1', 'digits': '123', 'reason': 'max-digits'})
+        self.assertIsInstance(event, GatherEvent)
+        self.assertEqual('123', event.digits)
+        self.assertEqual('max-digits', event.reason)
+        event = parse_event({'eventType': 'recording', 'recordingId': 'rec-1', 'state': 'complete',
+                             'media': 'https://api.catapult.inetwork.com/v1/users/u-abc/media/c-1-1.wav'})
+        self.assertIsInstance(event, RecordingEvent)
+        self.assertEqual('c-1-1.wav', event.media_name)
+        self.assertIsNone(event.start_time)
+
+    def test_parse_unknown_event(self):
+        """
+        parse_event() should return base event for unknown event types and fail for invalid body
+        """
+        event = parse_event(u'{"eventType": "new-event", "callId": "c-1"}')
+        self.assertIs(Event, type(event))
+        self.assertEqual('c-1', event.get('callId'))
+        with self.assertRaises(ValueError):
+            parse_event('[]')
+
+    def test_events_have_no_dict(self):
+        """
+        events should have slots only
+        """
+        event = parse_event({'eventType': 'answer'})
+        self.assertFalse(hasattr(event, '__dict__'))
+
+    def test_dispatch(self):
+        """
+        dispatch() should call handler of event type
+        """
+        dispatcher = EventDispatcher()
+        events = []
+
+        @dispatcher.on('answer')
+        def on_answer(event):
+            events.append(event)
+            return 'answered'
+
+        dispatcher.register(GatherEvent, lambda event: 'gathered')
+        self.assertEqual('answered', dispatcher.dispatch('{"eventType": "answer", "callId": "c-1"}'))
+        self.assertEqual('gathered', dispatcher.dispatch('{"eventType": "gather", "callId": "c-1"}'))
+        self.assertIsNone(dispatcher.dispatch('{"eventType": "hangup", "callId": "c-1"}'))
+        self.assertEqual('c-1', events[0].call_id)
+        dispatcher.default = lambda event: event.event_type
+        self.assertEqual('hangup', dispatcher.dispatch('{"eventType": "hangup", "callId": "c-1"}'))
@@ -27,7 +27,7 @@ class RecordingTests(unittest.TestCase):
             "state": "complete"
         }]
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = list(client.list_recordings())
             p.assert_called_with(
@@ -53,7 +53,7 @@ class RecordingTests(unittest.TestCase):
             "state": "complete"
         }
         """
-        with patch('requests.request', return_value=create_response(200, estimated_json)) as p:
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)) as p:
             client = get_client()
             data = client.get_recording('recordingId')
             p.assert_called_with(
@@ -62,3 +62,13 @@ class RecordingTests(unittest.TestCase):
                 headers=headers,
                 auth=AUTH)
             self.assertEqual('{callId1}-1.wav', data['media_name'])
+
+    def test_get_recording_with_raw_key_style(self):
+        """
+        get_recording() should add media name in key style of client
+        """
+        estimated_json = '{"id": "recordingId", "media": "http://localhost/media/file"}'
+        with patch('requests.Session.request', return_value=create_response(200, estimated_json)):
+            client = get_client().with_key_style('raw')
+            data = client.get_recording('recordingId')
+            self.assertEqual('file', data['mediaName'])
@@ -0,0 +1,43 @@
+import time
+import unittest
+
+from bandwidth.voice.events import parse_event, EventDispatcher
+from bandwidth.voice.state import StateMirror
+
+
+class StateMirrorTests(unittest.TestCase):
+
+    def test_update(self):
+        """
+        update() should store fields with snake_case names and ignore None values
+        """
+        mirror = StateMirror()
+        mirror.update('call', 'c-1', {'state': 'active', 'recordingEnabled': False, 'transferTo': None})
+        self.assertEqual('active', mirror.get('call', 'c-1', 'state'))
+        self.assertIs(False, mirror.get('call', 'c-1', 'recording_enabled'))
+        self.assertEqual('unknown', mirror.get('call', 'c-1', 'transfer_to', 'unknown'))
+        self.assertIsNone(mirror.get('call', 'c-2', 'state'))
+        mirror.clear()
+        self.assertIsNone(mirror.get('call', 'c-1', 'state'))
+
+    def test_stale_fields(self):
+        """
+        get() should not return fields older than time to live
+        """
+        mirror = StateMirror(ttl=0.01)
+        mirror.update('conference', 'conf-1', {'state': 'created'})
+        time.sleep(0.02)
+        self.assertIsNone(mirror.get('conference', 'conf-1', 'state'))
+
+    def test_apply_event(self):
+        """
+        parse_event() and dispatcher should update state by events
+        """
+        mirror = StateMirror()
+        parse_event('{"eventType": "hangup", "callId": "c-1", "callState": "completed"}', mirror)
+        self.assertEqual('completed', mirror.get('call', 'c-1', 'state'))
+        dispatcher = EventDispatcher(state_mirror=mirror)
+        dispatcher.dispatch({'eventType': 'conference', 'conferenceId': 'conf-1', 'status': 'created'})
+        self.assertEqual('created', mirror.get('conference', 'conf-1', 'state'))
+        dispatcher.dispatch({'eventType': 'speak', 'callId': 'c-2', 'status': 'done'})
+        self.assertIsNone(mirror.get('call', 'c-2', 'state'))
@@ -2,7 +2,9 @@ from __future__ import absolute_import
 import unittest
 import six
 from tests.camel_test_values import before_array_dict, after_array_dict
-from bandwidth.convert_camel import convert_object_to_snake_case
+from bandwidth import convert_camel
+from bandwidth.convert_camel import convert_object_to_snake_case, convert_string_to_snake_case, \
+    convert_string_to_camel_case, convert_object_to_key_style, check_key_style, SnakeCaseView
 
 
 class ConvertCamelTests(unittest.TestCase):
@@ -34,3 +36,67 @@ class ConvertCamelTests(unittest.TestCase):
         """
         my_value = convert_object_to_snake_case({"helloWorld": "goodByeWorld"})
         self.assertEqual(my_value, {"hello_world": "goodByeWorld"})
+
+    def test_string_case_cache(self):
+        """
+        convert_string_to_snake_case() should cache converted strings
+        """
+        convert_camel._snake_case_cache.clear()
+        self.assertEqual('call_id', convert_string_to_snake_case('callId'))
+        self.assertEqual('call_id', convert_camel._snake_case_cache['callId'])
+        self.assertEqual('call_id', convert_string_to_snake_case('callId'))
+
+    def test_string_case_cache_size(self):
+        """
+        convert_string_to_snake_case() should keep cache size bounded
+        """
+        for i in range(convert_camel._SNAKE_CASE_CACHE_SIZE + 10):
+            convert_string_to_snake_case('key%dValue' % i)
+        self.assertLessEqual(len(convert_camel._snake_case_cache), convert_camel._SNAKE_CASE_CACHE_SIZE)
+        self.assertEqual('key1_value', convert_string_to_snake_case('key1Value'))
+
+    def test_camel_case(self):
+        """
+        convert_string_to_camel_case() should camel a string
+        """
+        self.assertEqual('recordingEnabled', convert_string_to_camel_case('recording_enabled'))
+        self.assertEqual('id', convert_string_to_camel_case('id'))
+
+    def test_lazy_snake_view(self):
+        """
+        convert_object_to_key_style() should return lazy snake_case view for 'lazy_snake'
+        """
+        view = convert_object_to_key_style(before_array_dict, 'lazy_snake')
+        self.assertIsInstance(view[0], SnakeCaseView)
+        self.assertIsNone(view[0]._keys)
+        self.assertEqual('ued-abc123', view[0]['details'][0]['next_id'])
+        self.assertEqual(view, after_array_dict)
+        self.assertIs(before_array_dict[0], view[0].raw)
+
+    def test_lazy_snake_view_changes(self):
+        """
+        SnakeCaseView should write changes to underlying object
+        """
+        data = {'callId': 'c-1', 'state': 'active'}
+        view = SnakeCaseView(data)
+        view['call_id'] = 'c-2'
+        view['media_name'] = 'file'
+        del view['state']
+        self.assertEqual({'callId': 'c-2', 'media_name': 'file'}, data)
+        self.assertEqual({'call_id': 'c-2', 'media_name': 'file'}, dict(view))
+        with self.assertRaises(KeyError):
+            view['callId']
+
+    def test_raw_key_style(self):
+        """
+        convert_object_to_key_style() should return same object for 'raw'
+        """
+        self.assertIs(before_array_dict, convert_object_to_key_style(before_array_dict, 'raw'))
+
+    def test_check_key_style(self):
+        """
+        check_key_style() should raise error for unsupported key style
+        """
+        self.assertEqual('raw', check_key_style('raw'))
+        with self.assertRaises(ValueError):
+            check_key_style('kebab')